@@ -16,9 +16,9 @@ CREATE TABLE users (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
--- 근무 스케줄 테이블
+-- 근무 스케줄 테이블 (work_date 기준 월별 파티션)
 CREATE TABLE schedules (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     user_id VARCHAR(255) NOT NULL,
     work_date DATE NOT NULL,
     shift_type VARCHAR(20) CHECK (shift_type IN ('day', 'evening', 'night', 'off')) NOT NULL,
@@ -26,8 +26,21 @@ CREATE TABLE schedules (
     end_time TIME,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, work_date),
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
     UNIQUE (user_id, work_date)
+) PARTITION BY RANGE (work_date);
+
+-- 근무 롤링 상태 테이블 (피로 위험도 계산용, schedules 트리거가 유지)
+-- state_date 기준 최근 7일 [state_date - 6, state_date] 의 연속 야간 근무 수와 근무 일정 수 (off 포함)
+CREATE TABLE schedule_rolling_state (
+    user_id VARCHAR(255) NOT NULL,
+    state_date DATE NOT NULL,
+    consecutive_night_shifts INTEGER NOT NULL DEFAULT 0,
+    workdays_7d INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, state_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
 );
 
 -- OCR 업로드 이미지 메타데이터 테이블
@@ -77,9 +90,9 @@ CREATE TABLE caffeine_plans (
     UNIQUE (user_id, plan_date)
 );
 
--- 피로 위험도 테이블 (백엔드 계산)
+-- 피로 위험도 테이블 (백엔드 계산, assessment_date 기준 월별 파티션)
 CREATE TABLE fatigue_assessments (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     user_id VARCHAR(255) NOT NULL,
     assessment_date DATE NOT NULL,
     sleep_hours DECIMAL(3,1) NOT NULL, -- 수면 시간 (시간.분)
@@ -90,9 +103,10 @@ CREATE TABLE fatigue_assessments (
     safety_recommendations TEXT, -- 안전 권장사항
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, assessment_date),
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
     UNIQUE (user_id, assessment_date)
-);
+) PARTITION BY RANGE (assessment_date);
 
 -- 점프스타트 블록 테이블
 CREATE TABLE jumpstart_blocks (
@@ -127,6 +141,30 @@ CREATE TABLE jumpstart_tasks (
     UNIQUE (user_id, task_date, block_id, task_order)
 );
 
+-- 사용자별 일간 집계 테이블 (통계 API용, fatigue_assessments / jumpstart 트리거가 유지)
+-- 피로 위험도는 해당 날짜 평가값(없으면 NULL), 점프스타트는 블록 유형별 작업 수/완료 수/완료 시간(분)
+CREATE TABLE user_daily_rollups (
+    user_id VARCHAR(255) NOT NULL,
+    rollup_date DATE NOT NULL,
+    risk_score INTEGER,
+    risk_level VARCHAR(10),
+    sleep_hours DECIMAL(3,1),
+    consecutive_night_shifts INTEGER,
+    jumpstart_blocks INTEGER NOT NULL DEFAULT 0,
+    now_total_tasks INTEGER NOT NULL DEFAULT 0,
+    now_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    now_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    must_do_total_tasks INTEGER NOT NULL DEFAULT 0,
+    must_do_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    must_do_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    recovery_total_tasks INTEGER NOT NULL DEFAULT 0,
+    recovery_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    recovery_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, rollup_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
 -- 일일 체크리스트 테이블 (홈화면용 - 별도 유지)
 CREATE TABLE daily_checklists (
     id SERIAL PRIMARY KEY,
@@ -140,15 +178,16 @@ CREATE TABLE daily_checklists (
     UNIQUE (user_id, task_date, task_name)
 );
 
--- AI 상담 내역 테이블
+-- AI 상담 내역 테이블 (created_at 기준 월별 파티션)
 CREATE TABLE chat_history (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     user_id VARCHAR(255) NOT NULL,
     message TEXT NOT NULL,
     response TEXT NOT NULL,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at),
     FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
-);
+) PARTITION BY RANGE (created_at);
 
 -- 오디오 파일 테이블 (이완 & 휴식)
 CREATE TABLE audio_files (
@@ -162,6 +201,32 @@ CREATE TABLE audio_files (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Bio-Coach 응답 공유 캐시 테이블 (ai_services, BIO_COACH_SHARED_CACHE=true일 때 사용)
+-- cache_key: 계획 종류:근무 유형:전날 근무 유형:로케일, response: 파싱된 Agent 응답 (date 제외)
+CREATE TABLE bio_coach_cache (
+    cache_key VARCHAR(100) PRIMARY KEY,
+    response JSONB NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 사용자별 마지막 쓰기 시각 테이블 (utils/database.py, DB_READER_HOST가 있을 때 쓰기 트랜잭션마다 갱신)
+-- user_id: Cognito sub 또는 path parameter user_id (사용자 삭제 요청에서도 기록되므로 외래 키 없음)
+CREATE TABLE user_write_marks (
+    user_id VARCHAR(255) PRIMARY KEY,
+    written_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- 서킷 브레이커 공유 상태 테이블 (ai_services / schedule_management, CIRCUIT_BREAKER_SHARED_STATE=true일 때 사용)
+-- name: 서킷 이름 (bedrock-chat-agent, bedrock-bio-coach-agent, ocr-vision), opened_at: open 전이 시각 (closed이면 NULL)
+CREATE TABLE circuit_breakers (
+    name VARCHAR(100) PRIMARY KEY,
+    state VARCHAR(20) NOT NULL CHECK (state IN ('closed', 'open')),
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    opened_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
 -- 인덱스 생성 (성능 최적화)
 CREATE INDEX idx_schedules_user_date ON schedules(user_id, work_date);
 CREATE INDEX idx_schedule_images_user ON schedule_images(user_id);
@@ -173,7 +238,7 @@ CREATE INDEX idx_jumpstart_blocks_user_date ON jumpstart_blocks(user_id, block_d
 CREATE INDEX idx_jumpstart_tasks_user_date ON jumpstart_tasks(user_id, task_date);
 CREATE INDEX idx_jumpstart_tasks_block ON jumpstart_tasks(block_id);
 CREATE INDEX idx_daily_checklists_user_date ON daily_checklists(user_id, task_date);
-CREATE INDEX idx_chat_history_user ON chat_history(user_id);
+CREATE INDEX idx_chat_history_user_created ON chat_history(user_id, created_at DESC, id DESC);
 CREATE INDEX idx_audio_files_type ON audio_files(file_type);
 
 -- 업데이트 트리거 함수
@@ -202,4 +267,284 @@ CREATE TRIGGER update_fatigue_assessments_updated_at BEFORE UPDATE ON fatigue_as
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 CREATE TRIGGER update_jumpstart_blocks_updated_at BEFORE UPDATE ON jumpstart_blocks
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
\ No newline at end of file
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- 근무 롤링 상태 재계산 (p_from ~ p_to 날짜만)
+-- 연속 야간 근무: 7일 창 안에서 마지막 비야간 근무일 이후의 야간 근무 수 (일정이 없는 날은 건너뜀)
+CREATE OR REPLACE FUNCTION refresh_schedule_rolling_state(p_user_id VARCHAR, p_from DATE, p_to DATE)
+RETURNS VOID AS $$
+BEGIN
+    -- 같은 사용자의 재계산을 트랜잭션 단위로 직렬화: 먼저 잠근 트랜잭션이 끝난 뒤에 schedules를 읽으므로
+    -- (READ COMMITTED는 문장마다 새 스냅샷) 동시에 저장된 근무 일정을 서로 덮어쓰지 않음
+    PERFORM pg_advisory_xact_lock(hashtext('schedule_rolling_state'), hashtext(p_user_id));
+    
+    -- 사용자 삭제로 schedules가 CASCADE 삭제되는 경우 (상태 행도 함께 삭제됨)
+    IF NOT EXISTS (SELECT 1 FROM users WHERE user_id = p_user_id) THEN
+        RETURN;
+    END IF;
+    
+    INSERT INTO schedule_rolling_state (user_id, state_date, consecutive_night_shifts, workdays_7d)
+    SELECT p_user_id, days.state_date,
+           COUNT(s.work_date) FILTER (WHERE s.shift_type = 'night' AND s.work_date > days.last_non_night),
+           COUNT(s.work_date)
+    FROM (
+        SELECT day::DATE AS state_date,
+               COALESCE((SELECT MAX(work_date) FROM schedules
+                         WHERE user_id = p_user_id AND shift_type <> 'night'
+                           AND work_date BETWEEN day::DATE - 6 AND day::DATE),
+                        day::DATE - 7) AS last_non_night
+        FROM generate_series(p_from, p_to, INTERVAL '1 day') AS day
+    ) days
+    LEFT JOIN schedules s
+        ON s.user_id = p_user_id AND s.work_date BETWEEN days.state_date - 6 AND days.state_date
+    GROUP BY days.state_date
+    ON CONFLICT (user_id, state_date)
+    DO UPDATE SET
+        consecutive_night_shifts = EXCLUDED.consecutive_night_shifts,
+        workdays_7d = EXCLUDED.workdays_7d,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+$$ language 'plpgsql';
+
+-- schedules 변경 트리거 함수 (문장 단위: 일괄 등록도 사용자당 한 번만 재계산)
+-- 변경된 근무일부터 6일 뒤까지가 7일 창에 영향을 받는 범위
+CREATE OR REPLACE FUNCTION refresh_schedule_rolling_state_from_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM new_rows GROUP BY user_id ORDER BY user_id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- 근무일이나 근무 유형이 바뀐 행만 (시간만 바뀐 수정은 무시)
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM (
+            (SELECT user_id, work_date, shift_type FROM old_rows
+             EXCEPT SELECT user_id, work_date, shift_type FROM new_rows)
+            UNION ALL
+            (SELECT user_id, work_date, shift_type FROM new_rows
+             EXCEPT SELECT user_id, work_date, shift_type FROM old_rows)
+        ) changed
+        GROUP BY user_id
+        ORDER BY user_id;
+    ELSE
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM old_rows GROUP BY user_id ORDER BY user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- 근무 롤링 상태 트리거 적용
+CREATE TRIGGER refresh_schedule_rolling_state_on_insert AFTER INSERT ON schedules
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+CREATE TRIGGER refresh_schedule_rolling_state_on_update AFTER UPDATE ON schedules
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+CREATE TRIGGER refresh_schedule_rolling_state_on_delete AFTER DELETE ON schedules
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+-- 일간 집계 재계산 (p_from ~ p_to 날짜만)
+CREATE OR REPLACE FUNCTION refresh_user_daily_rollups(p_user_id VARCHAR, p_from DATE, p_to DATE)
+RETURNS VOID AS $$
+BEGIN
+    -- 같은 사용자의 재계산을 트랜잭션 단위로 직렬화: 먼저 잠근 트랜잭션이 끝난 뒤에 원본을 읽으므로
+    -- (READ COMMITTED는 문장마다 새 스냅샷) 동시에 바뀐 작업 / 피로도 변경을 서로 덮어쓰지 않음
+    PERFORM pg_advisory_xact_lock(hashtext('user_daily_rollups'), hashtext(p_user_id));
+    
+    -- 사용자 삭제로 원본 행이 CASCADE 삭제되는 경우 (집계 행도 함께 삭제됨)
+    IF NOT EXISTS (SELECT 1 FROM users WHERE user_id = p_user_id) THEN
+        RETURN;
+    END IF;
+    
+    INSERT INTO user_daily_rollups (
+        user_id, rollup_date, risk_score, risk_level, sleep_hours, consecutive_night_shifts,
+        jumpstart_blocks,
+        now_total_tasks, now_completed_tasks, now_completed_minutes,
+        must_do_total_tasks, must_do_completed_tasks, must_do_completed_minutes,
+        recovery_total_tasks, recovery_completed_tasks, recovery_completed_minutes
+    )
+    SELECT p_user_id, day::DATE, fa.risk_score, fa.risk_level, fa.sleep_hours, fa.consecutive_night_shifts,
+           js.blocks,
+           js.now_total, js.now_completed, js.now_minutes,
+           js.must_do_total, js.must_do_completed, js.must_do_minutes,
+           js.recovery_total, js.recovery_completed, js.recovery_minutes
+    FROM generate_series(p_from, p_to, INTERVAL '1 day') AS day
+    LEFT JOIN fatigue_assessments fa
+        ON fa.user_id = p_user_id AND fa.assessment_date = day::DATE
+    CROSS JOIN LATERAL (
+        SELECT COUNT(DISTINCT jb.id) AS blocks,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'now') AS now_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'now' AND jt.completed) AS now_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'now' AND jt.completed), 0) AS now_minutes,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'must_do') AS must_do_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'must_do' AND jt.completed) AS must_do_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'must_do' AND jt.completed), 0) AS must_do_minutes,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'recovery') AS recovery_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'recovery' AND jt.completed) AS recovery_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'recovery' AND jt.completed), 0) AS recovery_minutes
+        FROM jumpstart_blocks jb
+        LEFT JOIN jumpstart_tasks jt ON jt.block_id = jb.id
+        WHERE jb.user_id = p_user_id AND jb.block_date = day::DATE
+    ) js
+    ON CONFLICT (user_id, rollup_date)
+    DO UPDATE SET
+        risk_score = EXCLUDED.risk_score,
+        risk_level = EXCLUDED.risk_level,
+        sleep_hours = EXCLUDED.sleep_hours,
+        consecutive_night_shifts = EXCLUDED.consecutive_night_shifts,
+        jumpstart_blocks = EXCLUDED.jumpstart_blocks,
+        now_total_tasks = EXCLUDED.now_total_tasks,
+        now_completed_tasks = EXCLUDED.now_completed_tasks,
+        now_completed_minutes = EXCLUDED.now_completed_minutes,
+        must_do_total_tasks = EXCLUDED.must_do_total_tasks,
+        must_do_completed_tasks = EXCLUDED.must_do_completed_tasks,
+        must_do_completed_minutes = EXCLUDED.must_do_completed_minutes,
+        recovery_total_tasks = EXCLUDED.recovery_total_tasks,
+        recovery_completed_tasks = EXCLUDED.recovery_completed_tasks,
+        recovery_completed_minutes = EXCLUDED.recovery_completed_minutes,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+$$ language 'plpgsql';
+
+-- 원본 테이블 변경 트리거 함수 (문장 단위, TG_ARGV[0] = 날짜 컬럼명)
+CREATE OR REPLACE FUNCTION refresh_user_daily_rollups_from_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_rows TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM new_rows';
+    ELSIF TG_OP = 'UPDATE' THEN
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM new_rows UNION ALL SELECT user_id, %1$I FROM old_rows';
+    ELSE
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM old_rows';
+    END IF;
+    
+    EXECUTE format('SELECT refresh_user_daily_rollups(user_id, MIN(changed_date), MAX(changed_date)) FROM ('
+                   || changed_rows || ') changed GROUP BY user_id ORDER BY user_id', TG_ARGV[0]);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- 전체 사용자 일간 집계 재생성 (백필: run_migration.py --rebuild-rollups)
+CREATE OR REPLACE FUNCTION rebuild_user_daily_rollups(p_from DATE, p_to DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    user_count INTEGER;
+BEGIN
+    PERFORM refresh_user_daily_rollups(user_id, p_from, p_to) FROM users ORDER BY user_id;
+    GET DIAGNOSTICS user_count = ROW_COUNT;
+    RETURN user_count;
+END;
+$$ language 'plpgsql';
+
+-- 일간 집계 트리거 적용
+CREATE TRIGGER refresh_rollups_on_fatigue_insert AFTER INSERT ON fatigue_assessments
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_fatigue_update AFTER UPDATE ON fatigue_assessments
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_fatigue_delete AFTER DELETE ON fatigue_assessments
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_block_insert AFTER INSERT ON jumpstart_blocks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_block_update AFTER UPDATE ON jumpstart_blocks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_block_delete AFTER DELETE ON jumpstart_blocks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_task_insert AFTER INSERT ON jumpstart_tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+CREATE TRIGGER refresh_rollups_on_task_update AFTER UPDATE ON jumpstart_tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+CREATE TRIGGER refresh_rollups_on_task_delete AFTER DELETE ON jumpstart_tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+-- 월별 파티션 생성 함수
+-- start_month가 속한 달부터 (현재 달 + months_ahead)까지 없는 파티션을 생성
+-- DEFAULT 파티션에 들어가 있던 해당 월 데이터는 새 파티션으로 옮긴 뒤 ATTACH
+-- 경계값은 UTC 자정 기준 (DATE / TIMESTAMP WITH TIME ZONE 컬럼 모두 사용 가능)
+-- 오래된 데이터는 DELETE 대신 ALTER TABLE ... DETACH PARTITION 후 보관/삭제
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent_table TEXT,
+    partition_column TEXT,
+    start_month DATE DEFAULT CURRENT_DATE,
+    months_ahead INTEGER DEFAULT 3
+)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', start_month)::DATE;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => months_ahead))::DATE;
+    month_end DATE;
+    lower_bound TEXT;
+    upper_bound TEXT;
+    partition_name TEXT;
+    default_partition TEXT := parent_table || '_default';
+    created_count INTEGER := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        month_end := (month_start + INTERVAL '1 month')::DATE;
+        partition_name := parent_table || '_' || to_char(month_start, 'YYYYMM');
+        
+        IF to_regclass(partition_name) IS NULL THEN
+            lower_bound := to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00';
+            upper_bound := to_char(month_end, 'YYYY-MM-DD') || ' 00:00:00+00';
+            
+            EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                           partition_name, parent_table);
+            
+            IF to_regclass(default_partition) IS NOT NULL THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+                    'INSERT INTO %I SELECT * FROM moved',
+                    default_partition, partition_column, lower_bound, partition_column, upper_bound,
+                    partition_name
+                );
+            END IF;
+            
+            EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                           parent_table, partition_name, lower_bound, upper_bound);
+            created_count := created_count + 1;
+        END IF;
+        
+        month_start := month_end;
+    END LOOP;
+    
+    RETURN created_count;
+END;
+$$ language 'plpgsql';
+
+-- 시계열 테이블 파티션 유지 (매월 실행: EventBridge 월간 규칙(setup_fatigue_schedule.py) 또는 pg_cron)
+CREATE OR REPLACE FUNCTION maintain_time_series_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+BEGIN
+    RETURN create_monthly_partitions('schedules', 'work_date', CURRENT_DATE, months_ahead)
+         + create_monthly_partitions('fatigue_assessments', 'assessment_date', CURRENT_DATE, months_ahead)
+         + create_monthly_partitions('chat_history', 'created_at', CURRENT_DATE, months_ahead);
+END;
+$$ language 'plpgsql';
+
+-- 파티션 생성 (범위 밖 날짜는 DEFAULT 파티션에 저장)
+CREATE TABLE schedules_default PARTITION OF schedules DEFAULT;
+CREATE TABLE fatigue_assessments_default PARTITION OF fatigue_assessments DEFAULT;
+CREATE TABLE chat_history_default PARTITION OF chat_history DEFAULT;
+SELECT maintain_time_series_partitions();
@@ -0,0 +1,12 @@
+-- Bio-Coach 응답 공유 캐시(bio_coach_cache) 마이그레이션
+-- ai_services가 파싱된 Bio-Coach Agent 응답을 근무 맥락 키로 저장하여 컨테이너 간 공유
+-- (BIO_COACH_SHARED_CACHE=true일 때만 사용, run_migration.py bio_coach_cache)
+
+-- Bio-Coach 응답 공유 캐시 테이블 (ai_services, BIO_COACH_SHARED_CACHE=true일 때 사용)
+-- cache_key: 계획 종류:근무 유형:전날 근무 유형:로케일, response: 파싱된 Agent 응답 (date 제외)
+CREATE TABLE IF NOT EXISTS bio_coach_cache (
+    cache_key VARCHAR(100) PRIMARY KEY,
+    response JSONB NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
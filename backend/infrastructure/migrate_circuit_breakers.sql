@@ -0,0 +1,13 @@
+-- 서킷 브레이커 공유 상태(circuit_breakers) 마이그레이션
+-- Bedrock Agent / OCR Vision 서킷의 open / closed 전이를 기록하여 Lambda 컨테이너 간 공유
+-- (CIRCUIT_BREAKER_SHARED_STATE=true일 때만 사용, run_migration.py circuit_breakers)
+
+-- 서킷 브레이커 공유 상태 테이블 (ai_services / schedule_management, CIRCUIT_BREAKER_SHARED_STATE=true일 때 사용)
+-- name: 서킷 이름 (bedrock-chat-agent, bedrock-bio-coach-agent, ocr-vision), opened_at: open 전이 시각 (closed이면 NULL)
+CREATE TABLE IF NOT EXISTS circuit_breakers (
+    name VARCHAR(100) PRIMARY KEY,
+    state VARCHAR(20) NOT NULL CHECK (state IN ('closed', 'open')),
+    failure_count INTEGER NOT NULL DEFAULT 0,
+    opened_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,165 @@
+-- 사용자별 일간 집계(user_daily_rollups) 마이그레이션
+-- 통계 API가 매번 30일치 원본(fatigue_assessments, jumpstart_blocks/tasks JOIN)을 집계하지 않도록
+-- 쓰기 시점에 트리거로 날짜별 집계 행을 유지
+-- partition_time_series 마이그레이션 이후 실행 (run_migration.py daily_rollups, 단일 트랜잭션)
+
+-- 1. 테이블
+-- 사용자별 일간 집계 테이블 (통계 API용, fatigue_assessments / jumpstart 트리거가 유지)
+-- 피로 위험도는 해당 날짜 평가값(없으면 NULL), 점프스타트는 블록 유형별 작업 수/완료 수/완료 시간(분)
+CREATE TABLE user_daily_rollups (
+    user_id VARCHAR(255) NOT NULL,
+    rollup_date DATE NOT NULL,
+    risk_score INTEGER,
+    risk_level VARCHAR(10),
+    sleep_hours DECIMAL(3,1),
+    consecutive_night_shifts INTEGER,
+    jumpstart_blocks INTEGER NOT NULL DEFAULT 0,
+    now_total_tasks INTEGER NOT NULL DEFAULT 0,
+    now_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    now_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    must_do_total_tasks INTEGER NOT NULL DEFAULT 0,
+    must_do_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    must_do_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    recovery_total_tasks INTEGER NOT NULL DEFAULT 0,
+    recovery_completed_tasks INTEGER NOT NULL DEFAULT 0,
+    recovery_completed_minutes INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, rollup_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
+-- 2. 재계산 함수 및 트리거
+-- 일간 집계 재계산 (p_from ~ p_to 날짜만)
+CREATE OR REPLACE FUNCTION refresh_user_daily_rollups(p_user_id VARCHAR, p_from DATE, p_to DATE)
+RETURNS VOID AS $$
+BEGIN
+    -- 같은 사용자의 재계산을 트랜잭션 단위로 직렬화: 먼저 잠근 트랜잭션이 끝난 뒤에 원본을 읽으므로
+    -- (READ COMMITTED는 문장마다 새 스냅샷) 동시에 바뀐 작업 / 피로도 변경을 서로 덮어쓰지 않음
+    PERFORM pg_advisory_xact_lock(hashtext('user_daily_rollups'), hashtext(p_user_id));
+    
+    -- 사용자 삭제로 원본 행이 CASCADE 삭제되는 경우 (집계 행도 함께 삭제됨)
+    IF NOT EXISTS (SELECT 1 FROM users WHERE user_id = p_user_id) THEN
+        RETURN;
+    END IF;
+    
+    INSERT INTO user_daily_rollups (
+        user_id, rollup_date, risk_score, risk_level, sleep_hours, consecutive_night_shifts,
+        jumpstart_blocks,
+        now_total_tasks, now_completed_tasks, now_completed_minutes,
+        must_do_total_tasks, must_do_completed_tasks, must_do_completed_minutes,
+        recovery_total_tasks, recovery_completed_tasks, recovery_completed_minutes
+    )
+    SELECT p_user_id, day::DATE, fa.risk_score, fa.risk_level, fa.sleep_hours, fa.consecutive_night_shifts,
+           js.blocks,
+           js.now_total, js.now_completed, js.now_minutes,
+           js.must_do_total, js.must_do_completed, js.must_do_minutes,
+           js.recovery_total, js.recovery_completed, js.recovery_minutes
+    FROM generate_series(p_from, p_to, INTERVAL '1 day') AS day
+    LEFT JOIN fatigue_assessments fa
+        ON fa.user_id = p_user_id AND fa.assessment_date = day::DATE
+    CROSS JOIN LATERAL (
+        SELECT COUNT(DISTINCT jb.id) AS blocks,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'now') AS now_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'now' AND jt.completed) AS now_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'now' AND jt.completed), 0) AS now_minutes,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'must_do') AS must_do_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'must_do' AND jt.completed) AS must_do_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'must_do' AND jt.completed), 0) AS must_do_minutes,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'recovery') AS recovery_total,
+               COUNT(jt.id) FILTER (WHERE jb.block_type = 'recovery' AND jt.completed) AS recovery_completed,
+               COALESCE(SUM(jt.duration_minutes) FILTER (WHERE jb.block_type = 'recovery' AND jt.completed), 0) AS recovery_minutes
+        FROM jumpstart_blocks jb
+        LEFT JOIN jumpstart_tasks jt ON jt.block_id = jb.id
+        WHERE jb.user_id = p_user_id AND jb.block_date = day::DATE
+    ) js
+    ON CONFLICT (user_id, rollup_date)
+    DO UPDATE SET
+        risk_score = EXCLUDED.risk_score,
+        risk_level = EXCLUDED.risk_level,
+        sleep_hours = EXCLUDED.sleep_hours,
+        consecutive_night_shifts = EXCLUDED.consecutive_night_shifts,
+        jumpstart_blocks = EXCLUDED.jumpstart_blocks,
+        now_total_tasks = EXCLUDED.now_total_tasks,
+        now_completed_tasks = EXCLUDED.now_completed_tasks,
+        now_completed_minutes = EXCLUDED.now_completed_minutes,
+        must_do_total_tasks = EXCLUDED.must_do_total_tasks,
+        must_do_completed_tasks = EXCLUDED.must_do_completed_tasks,
+        must_do_completed_minutes = EXCLUDED.must_do_completed_minutes,
+        recovery_total_tasks = EXCLUDED.recovery_total_tasks,
+        recovery_completed_tasks = EXCLUDED.recovery_completed_tasks,
+        recovery_completed_minutes = EXCLUDED.recovery_completed_minutes,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+$$ language 'plpgsql';
+
+-- 원본 테이블 변경 트리거 함수 (문장 단위, TG_ARGV[0] = 날짜 컬럼명)
+CREATE OR REPLACE FUNCTION refresh_user_daily_rollups_from_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed_rows TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM new_rows';
+    ELSIF TG_OP = 'UPDATE' THEN
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM new_rows UNION ALL SELECT user_id, %1$I FROM old_rows';
+    ELSE
+        changed_rows := 'SELECT user_id, %1$I AS changed_date FROM old_rows';
+    END IF;
+    
+    EXECUTE format('SELECT refresh_user_daily_rollups(user_id, MIN(changed_date), MAX(changed_date)) FROM ('
+                   || changed_rows || ') changed GROUP BY user_id ORDER BY user_id', TG_ARGV[0]);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- 전체 사용자 일간 집계 재생성 (백필: run_migration.py --rebuild-rollups)
+CREATE OR REPLACE FUNCTION rebuild_user_daily_rollups(p_from DATE, p_to DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    user_count INTEGER;
+BEGIN
+    PERFORM refresh_user_daily_rollups(user_id, p_from, p_to) FROM users ORDER BY user_id;
+    GET DIAGNOSTICS user_count = ROW_COUNT;
+    RETURN user_count;
+END;
+$$ language 'plpgsql';
+
+-- 일간 집계 트리거 적용
+CREATE TRIGGER refresh_rollups_on_fatigue_insert AFTER INSERT ON fatigue_assessments
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_fatigue_update AFTER UPDATE ON fatigue_assessments
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_fatigue_delete AFTER DELETE ON fatigue_assessments
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('assessment_date');
+
+CREATE TRIGGER refresh_rollups_on_block_insert AFTER INSERT ON jumpstart_blocks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_block_update AFTER UPDATE ON jumpstart_blocks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_block_delete AFTER DELETE ON jumpstart_blocks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('block_date');
+
+CREATE TRIGGER refresh_rollups_on_task_insert AFTER INSERT ON jumpstart_tasks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+CREATE TRIGGER refresh_rollups_on_task_update AFTER UPDATE ON jumpstart_tasks
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+CREATE TRIGGER refresh_rollups_on_task_delete AFTER DELETE ON jumpstart_tasks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_user_daily_rollups_from_changes('task_date');
+
+-- 3. 최근 1년 집계 백필 (더 오래된 기간은 run_migration.py --rebuild-rollups --rollup-days N)
+SELECT rebuild_user_daily_rollups(CURRENT_DATE - 365, CURRENT_DATE + 31);
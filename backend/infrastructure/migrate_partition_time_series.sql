@@ -0,0 +1,195 @@
+-- schedules / fatigue_assessments / chat_history 테이블을 월별 RANGE 파티션으로 마이그레이션
+-- PostgreSQL 13 이상 필요 (파티션 테이블의 BEFORE ROW 트리거)
+-- 실행 전 백업 권장! (run_migration.py partition_time_series 로 단일 트랜잭션 실행)
+-- 기존 테이블은 *_backup 으로 이름을 바꿔 보관
+
+-- 1. 파티션 관리 함수
+-- 월별 파티션 생성 함수
+-- start_month가 속한 달부터 (현재 달 + months_ahead)까지 없는 파티션을 생성
+-- DEFAULT 파티션에 들어가 있던 해당 월 데이터는 새 파티션으로 옮긴 뒤 ATTACH
+-- 경계값은 UTC 자정 기준 (DATE / TIMESTAMP WITH TIME ZONE 컬럼 모두 사용 가능)
+-- 오래된 데이터는 DELETE 대신 ALTER TABLE ... DETACH PARTITION 후 보관/삭제
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent_table TEXT,
+    partition_column TEXT,
+    start_month DATE DEFAULT CURRENT_DATE,
+    months_ahead INTEGER DEFAULT 3
+)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', start_month)::DATE;
+    last_month DATE := (date_trunc('month', CURRENT_DATE) + make_interval(months => months_ahead))::DATE;
+    month_end DATE;
+    lower_bound TEXT;
+    upper_bound TEXT;
+    partition_name TEXT;
+    default_partition TEXT := parent_table || '_default';
+    created_count INTEGER := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        month_end := (month_start + INTERVAL '1 month')::DATE;
+        partition_name := parent_table || '_' || to_char(month_start, 'YYYYMM');
+        
+        IF to_regclass(partition_name) IS NULL THEN
+            lower_bound := to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00';
+            upper_bound := to_char(month_end, 'YYYY-MM-DD') || ' 00:00:00+00';
+            
+            EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                           partition_name, parent_table);
+            
+            IF to_regclass(default_partition) IS NOT NULL THEN
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+                    'INSERT INTO %I SELECT * FROM moved',
+                    default_partition, partition_column, lower_bound, partition_column, upper_bound,
+                    partition_name
+                );
+            END IF;
+            
+            EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                           parent_table, partition_name, lower_bound, upper_bound);
+            created_count := created_count + 1;
+        END IF;
+        
+        month_start := month_end;
+    END LOOP;
+    
+    RETURN created_count;
+END;
+$$ language 'plpgsql';
+
+-- 시계열 테이블 파티션 유지 (매월 실행: EventBridge 월간 규칙(setup_fatigue_schedule.py) 또는 pg_cron)
+CREATE OR REPLACE FUNCTION maintain_time_series_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+BEGIN
+    RETURN create_monthly_partitions('schedules', 'work_date', CURRENT_DATE, months_ahead)
+         + create_monthly_partitions('fatigue_assessments', 'assessment_date', CURRENT_DATE, months_ahead)
+         + create_monthly_partitions('chat_history', 'created_at', CURRENT_DATE, months_ahead);
+END;
+$$ language 'plpgsql';
+
+-- 2. 기존 테이블 보관 (이름, 시퀀스, 인덱스, PK/UNIQUE 제약조건 이름 변경)
+ALTER TABLE schedules RENAME TO schedules_backup;
+ALTER TABLE fatigue_assessments RENAME TO fatigue_assessments_backup;
+ALTER TABLE chat_history RENAME TO chat_history_backup;
+
+ALTER SEQUENCE IF EXISTS schedules_id_seq RENAME TO schedules_backup_id_seq;
+ALTER SEQUENCE IF EXISTS fatigue_assessments_id_seq RENAME TO fatigue_assessments_backup_id_seq;
+ALTER SEQUENCE IF EXISTS chat_history_id_seq RENAME TO chat_history_backup_id_seq;
+
+ALTER INDEX IF EXISTS idx_schedules_user_date RENAME TO idx_schedules_backup_user_date;
+ALTER INDEX IF EXISTS idx_fatigue_assessments_user_date RENAME TO idx_fatigue_assessments_backup_user_date;
+ALTER INDEX IF EXISTS idx_chat_history_user RENAME TO idx_chat_history_backup_user;
+
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN
+        SELECT conrelid::regclass AS table_name, conname
+        FROM pg_constraint
+        WHERE conrelid IN ('schedules_backup'::regclass, 'fatigue_assessments_backup'::regclass, 'chat_history_backup'::regclass)
+          AND contype IN ('p', 'u')
+    LOOP
+        EXECUTE format('ALTER TABLE %s RENAME CONSTRAINT %I TO %I', r.table_name, r.conname, r.conname || '_backup');
+    END LOOP;
+END;
+$$;
+
+-- 3. 파티션 테이블 생성 (파티션 키를 PK/UNIQUE에 포함)
+CREATE TABLE schedules (
+    id SERIAL,
+    user_id VARCHAR(255) NOT NULL,
+    work_date DATE NOT NULL,
+    shift_type VARCHAR(20) CHECK (shift_type IN ('day', 'evening', 'night', 'off')) NOT NULL,
+    start_time TIME,
+    end_time TIME,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, work_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE (user_id, work_date)
+) PARTITION BY RANGE (work_date);
+
+CREATE TABLE fatigue_assessments (
+    id SERIAL,
+    user_id VARCHAR(255) NOT NULL,
+    assessment_date DATE NOT NULL,
+    sleep_hours DECIMAL(3,1) NOT NULL, -- 수면 시간 (시간.분)
+    consecutive_night_shifts INTEGER DEFAULT 0,
+    commute_time INTEGER NOT NULL, -- 분 단위
+    risk_level VARCHAR(10) CHECK (risk_level IN ('low', 'medium', 'high')) NOT NULL,
+    risk_score INTEGER NOT NULL, -- 0-100 점수
+    safety_recommendations TEXT, -- 안전 권장사항
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, assessment_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE (user_id, assessment_date)
+) PARTITION BY RANGE (assessment_date);
+
+CREATE TABLE chat_history (
+    id SERIAL,
+    user_id VARCHAR(255) NOT NULL,
+    message TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE schedules_default PARTITION OF schedules DEFAULT;
+CREATE TABLE fatigue_assessments_default PARTITION OF fatigue_assessments DEFAULT;
+CREATE TABLE chat_history_default PARTITION OF chat_history DEFAULT;
+
+-- 4. 월별 파티션 생성 (기존 데이터의 첫 달부터, 최대 3년 전까지 / 그 이전 데이터는 DEFAULT 파티션)
+SELECT create_monthly_partitions('schedules', 'work_date',
+    GREATEST(COALESCE((SELECT MIN(work_date) FROM schedules_backup), CURRENT_DATE), (CURRENT_DATE - INTERVAL '3 years')::DATE));
+SELECT create_monthly_partitions('fatigue_assessments', 'assessment_date',
+    GREATEST(COALESCE((SELECT MIN(assessment_date) FROM fatigue_assessments_backup), CURRENT_DATE), (CURRENT_DATE - INTERVAL '3 years')::DATE));
+SELECT create_monthly_partitions('chat_history', 'created_at',
+    GREATEST(COALESCE((SELECT MIN(created_at)::DATE FROM chat_history_backup), CURRENT_DATE), (CURRENT_DATE - INTERVAL '3 years')::DATE));
+
+-- 5. 기존 데이터 복사 및 시퀀스 재설정
+INSERT INTO schedules (id, user_id, work_date, shift_type, start_time, end_time, created_at, updated_at)
+SELECT id, user_id, work_date, shift_type, start_time, end_time, created_at, updated_at
+FROM schedules_backup;
+
+INSERT INTO fatigue_assessments (
+    id, user_id, assessment_date, sleep_hours, consecutive_night_shifts, commute_time,
+    risk_level, risk_score, safety_recommendations, created_at, updated_at
+)
+SELECT id, user_id, assessment_date, sleep_hours, consecutive_night_shifts, commute_time,
+       risk_level, risk_score, safety_recommendations, created_at, updated_at
+FROM fatigue_assessments_backup;
+
+INSERT INTO chat_history (id, user_id, message, response, created_at)
+SELECT id, user_id, message, response, COALESCE(created_at, CURRENT_TIMESTAMP)
+FROM chat_history_backup;
+
+SELECT setval(pg_get_serial_sequence('schedules', 'id'), COALESCE((SELECT MAX(id) FROM schedules), 0) + 1, false);
+SELECT setval(pg_get_serial_sequence('fatigue_assessments', 'id'), COALESCE((SELECT MAX(id) FROM fatigue_assessments), 0) + 1, false);
+SELECT setval(pg_get_serial_sequence('chat_history', 'id'), COALESCE((SELECT MAX(id) FROM chat_history), 0) + 1, false);
+
+-- 6. 인덱스 및 트리거
+CREATE INDEX idx_schedules_user_date ON schedules(user_id, work_date);
+CREATE INDEX idx_fatigue_assessments_user_date ON fatigue_assessments(user_id, assessment_date);
+CREATE INDEX idx_chat_history_user_created ON chat_history(user_id, created_at DESC, id DESC);
+
+CREATE TRIGGER update_schedules_updated_at BEFORE UPDATE ON schedules
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE TRIGGER update_fatigue_assessments_updated_at BEFORE UPDATE ON fatigue_assessments
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- 7. 미래 파티션 자동 생성 (pg_cron이 설치된 경우 매월 1일 03:00 UTC)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule('maintain-time-series-partitions', '0 3 1 * *',
+                              'SELECT maintain_time_series_partitions()');
+    ELSE
+        RAISE NOTICE 'pg_cron 미설치: setup_fatigue_schedule.py로 EventBridge 월간 파티션 유지 규칙을 설정하세요';
+    END IF;
+END;
+$$;
@@ -0,0 +1,102 @@
+-- 근무 롤링 상태(schedule_rolling_state) 마이그레이션
+-- 피로 위험도 계산 시 매번 최근 7일 schedules를 다시 읽지 않도록
+-- 날짜별 연속 야간 근무 수 / 최근 7일 근무 일수를 schedules 트리거로 증분 유지
+-- partition_time_series 마이그레이션 이후 실행 (run_migration.py schedule_rolling_state, 단일 트랜잭션)
+
+-- 1. 테이블
+-- 근무 롤링 상태 테이블 (피로 위험도 계산용, schedules 트리거가 유지)
+-- state_date 기준 최근 7일 [state_date - 6, state_date] 의 연속 야간 근무 수와 근무 일정 수 (off 포함)
+CREATE TABLE schedule_rolling_state (
+    user_id VARCHAR(255) NOT NULL,
+    state_date DATE NOT NULL,
+    consecutive_night_shifts INTEGER NOT NULL DEFAULT 0,
+    workdays_7d INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, state_date),
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+
+-- 2. 재계산 함수 및 트리거
+-- 근무 롤링 상태 재계산 (p_from ~ p_to 날짜만)
+-- 연속 야간 근무: 7일 창 안에서 마지막 비야간 근무일 이후의 야간 근무 수 (일정이 없는 날은 건너뜀)
+CREATE OR REPLACE FUNCTION refresh_schedule_rolling_state(p_user_id VARCHAR, p_from DATE, p_to DATE)
+RETURNS VOID AS $$
+BEGIN
+    -- 같은 사용자의 재계산을 트랜잭션 단위로 직렬화: 먼저 잠근 트랜잭션이 끝난 뒤에 schedules를 읽으므로
+    -- (READ COMMITTED는 문장마다 새 스냅샷) 동시에 저장된 근무 일정을 서로 덮어쓰지 않음
+    PERFORM pg_advisory_xact_lock(hashtext('schedule_rolling_state'), hashtext(p_user_id));
+    
+    -- 사용자 삭제로 schedules가 CASCADE 삭제되는 경우 (상태 행도 함께 삭제됨)
+    IF NOT EXISTS (SELECT 1 FROM users WHERE user_id = p_user_id) THEN
+        RETURN;
+    END IF;
+    
+    INSERT INTO schedule_rolling_state (user_id, state_date, consecutive_night_shifts, workdays_7d)
+    SELECT p_user_id, days.state_date,
+           COUNT(s.work_date) FILTER (WHERE s.shift_type = 'night' AND s.work_date > days.last_non_night),
+           COUNT(s.work_date)
+    FROM (
+        SELECT day::DATE AS state_date,
+               COALESCE((SELECT MAX(work_date) FROM schedules
+                         WHERE user_id = p_user_id AND shift_type <> 'night'
+                           AND work_date BETWEEN day::DATE - 6 AND day::DATE),
+                        day::DATE - 7) AS last_non_night
+        FROM generate_series(p_from, p_to, INTERVAL '1 day') AS day
+    ) days
+    LEFT JOIN schedules s
+        ON s.user_id = p_user_id AND s.work_date BETWEEN days.state_date - 6 AND days.state_date
+    GROUP BY days.state_date
+    ON CONFLICT (user_id, state_date)
+    DO UPDATE SET
+        consecutive_night_shifts = EXCLUDED.consecutive_night_shifts,
+        workdays_7d = EXCLUDED.workdays_7d,
+        updated_at = CURRENT_TIMESTAMP;
+END;
+$$ language 'plpgsql';
+
+-- schedules 변경 트리거 함수 (문장 단위: 일괄 등록도 사용자당 한 번만 재계산)
+-- 변경된 근무일부터 6일 뒤까지가 7일 창에 영향을 받는 범위
+CREATE OR REPLACE FUNCTION refresh_schedule_rolling_state_from_changes()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM new_rows GROUP BY user_id ORDER BY user_id;
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- 근무일이나 근무 유형이 바뀐 행만 (시간만 바뀐 수정은 무시)
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM (
+            (SELECT user_id, work_date, shift_type FROM old_rows
+             EXCEPT SELECT user_id, work_date, shift_type FROM new_rows)
+            UNION ALL
+            (SELECT user_id, work_date, shift_type FROM new_rows
+             EXCEPT SELECT user_id, work_date, shift_type FROM old_rows)
+        ) changed
+        GROUP BY user_id
+        ORDER BY user_id;
+    ELSE
+        PERFORM refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+        FROM old_rows GROUP BY user_id ORDER BY user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- 근무 롤링 상태 트리거 적용
+CREATE TRIGGER refresh_schedule_rolling_state_on_insert AFTER INSERT ON schedules
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+CREATE TRIGGER refresh_schedule_rolling_state_on_update AFTER UPDATE ON schedules
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+CREATE TRIGGER refresh_schedule_rolling_state_on_delete AFTER DELETE ON schedules
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_schedule_rolling_state_from_changes();
+
+-- 3. 기존 근무 일정으로 초기 상태 생성
+SELECT refresh_schedule_rolling_state(user_id, MIN(work_date), MAX(work_date) + 6)
+FROM schedules
+GROUP BY user_id
+ORDER BY user_id;
@@ -0,0 +1,10 @@
+-- 사용자별 마지막 쓰기 시각(user_write_marks) 마이그레이션
+-- 쓰기 직후의 복제본 조회를 primary로 고정하기 위해 Lambda 함수 / 컨테이너 간에 쓰기 시각을 공유
+-- (DB_READER_HOST를 설정하기 전에 실행, run_migration.py user_write_marks)
+
+-- 사용자별 마지막 쓰기 시각 테이블 (utils/database.py, DB_READER_HOST가 있을 때 쓰기 트랜잭션마다 갱신)
+-- user_id: Cognito sub 또는 path parameter user_id (사용자 삭제 요청에서도 기록되므로 외래 키 없음)
+CREATE TABLE IF NOT EXISTS user_write_marks (
+    user_id VARCHAR(255) PRIMARY KEY,
+    written_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
@@ -1,21 +1,77 @@
 import json
 import os
-import boto3
+import base64
 from datetime import datetime, date, time, timedelta
-from typing import Dict, Any, Optional, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import Callable, Dict, Any, Optional, List, Tuple
 import logging
 import random
 import uuid
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from time import monotonic
+
+from utils.aws_clients import get_client
+from utils.bio_rules import lookup_bio_rules
+from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from utils.database import DatabaseManager, pin_reads_after_write
+from utils.pagination import InvalidPaginationError, decode_cursor, paginate, parse_limit
+from utils.ttl_cache import TTLCache
 
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Bedrock Agent 클라이언트는 필요할 때 초기화 (lazy initialization)
-_bedrock_agent_runtime = None
+# 수면/카페인 계획 생성 방식 (BIO_PLAN_MODE)
+# - rules_enrich: 로컬 BIO_RULES로 즉시 생성하고, Bio-Coach Agent로 팁 문구만 비동기 보강 (기본값)
+# - rules: 로컬 BIO_RULES만 사용
+# - agent: Bio-Coach Agent를 동기 호출 (실패 시 로컬 BIO_RULES)
+PLAN_MODE_AGENT = 'agent'
+PLAN_MODE_RULES = 'rules'
+PLAN_MODE_RULES_ENRICH = 'rules_enrich'
+BIO_PLAN_MODE = os.environ.get('BIO_PLAN_MODE', PLAN_MODE_RULES_ENRICH)
+
+# 팁 보강 비동기 자기 호출 이벤트
+PLAN_ENRICHMENT_EVENT_SOURCE = 'rhythm-fairy.plan-enrichment'
+
+# 계획 종류별 Bio-Coach 프롬프트 (daily: 수면 + 카페인 한 번에)
+PLAN_PROMPTS = {
+    'sleep': "{plan_date}의 최적 수면 시간을 알려주세요",
+    'caffeine': "{plan_date}의 카페인 섭취 마감 시간을 알려주세요",
+    'daily': "{plan_date}의 최적 수면 시간과 카페인 섭취 마감 시간을 알려주세요"
+}
+
+# 계획 종류별 팁 보강 대상 (sleep_plans.rationale / caffeine_plans.recommendations)
+PLAN_TIP_UPDATES = {
+    'sleep': ["UPDATE sleep_plans SET rationale = %s, updated_at = CURRENT_TIMESTAMP WHERE user_id = %s AND plan_date = %s"],
+    'caffeine': ["UPDATE caffeine_plans SET recommendations = %s, updated_at = CURRENT_TIMESTAMP WHERE user_id = %s AND plan_date = %s"]
+}
+PLAN_TIP_UPDATES['daily'] = PLAN_TIP_UPDATES['sleep'] + PLAN_TIP_UPDATES['caffeine']
+
+# Bio-Coach 응답 캐시: 파싱된 Agent 응답을 (계획 종류, 근무 유형, 전날 근무 유형, 로케일) 키로 재사용
+# - 웜 컨테이너 내 TTL + LRU 캐시, BIO_COACH_SHARED_CACHE=true이면 bio_coach_cache 테이블을 공유 캐시로 사용
+BIO_COACH_CACHE_TTL_SECONDS = int(os.environ.get('BIO_COACH_CACHE_TTL_SECONDS', '21600'))
+BIO_COACH_CACHE_MAX_ENTRIES = int(os.environ.get('BIO_COACH_CACHE_MAX_ENTRIES', '256'))
+BIO_COACH_SHARED_CACHE = os.environ.get('BIO_COACH_SHARED_CACHE', 'false').lower() == 'true'
+BIO_COACH_LOCALE = os.environ.get('BIO_COACH_LOCALE', 'ko')
+bio_coach_cache = TTLCache(BIO_COACH_CACHE_MAX_ENTRIES, BIO_COACH_CACHE_TTL_SECONDS)
+bio_coach_shared_cache_stats = {'hits': 0, 'misses': 0}
+
+# agent 모드 헤징: 규칙 기반 계획을 먼저 만들고 Agent 호출은 별도 스레드에서 실행
+# 마감 시각 = 지금 + min(BIO_AGENT_BUDGET_MS, 남은 Lambda 실행 시간 - DB 저장 여유분 BIO_AGENT_DEADLINE_MARGIN_MS)
+# 요청 스레드는 마감 시각까지만 기다린 뒤 규칙 기반 계획을 쓰고, Agent 스레드도 응답 스트림을 읽으며 같은 마감 시각을 넘으면 중단
+# 진행 중인 Agent 호출이 BIO_AGENT_MAX_INFLIGHT건이면 새로 호출하지 않고 규칙 기반 계획 사용
+BIO_AGENT_BUDGET_MS = int(os.environ.get('BIO_AGENT_BUDGET_MS', '6000'))
+BIO_AGENT_DEADLINE_MARGIN_MS = int(os.environ.get('BIO_AGENT_DEADLINE_MARGIN_MS', '3000'))
+BIO_AGENT_MAX_INFLIGHT = 4
+BIO_AGENT_HEDGE_PROFILE = 'bio_coach_hedge'
+_agent_executor = ThreadPoolExecutor(max_workers=BIO_AGENT_MAX_INFLIGHT, thread_name_prefix='bio-coach')
+_agent_slots = threading.BoundedSemaphore(BIO_AGENT_MAX_INFLIGHT)
+
+# Bedrock Agent 서킷 브레이커: 연속 실패 시 Agent를 호출하지 않고 바로 더미 응답 / 규칙 기반 계획 사용
+# (CIRCUIT_BREAKER_SHARED_STATE=true이면 circuit_breakers 테이블로 컨테이너 간 상태 공유, DB 연결 정보는 첫 조회 시 사용)
+bedrock_chat_breaker = get_circuit_breaker('bedrock-chat-agent', db_factory=DatabaseManager)
+bio_coach_breaker = get_circuit_breaker('bedrock-bio-coach-agent', db_factory=DatabaseManager)
 
 
 # ============================================================================
@@ -69,15 +125,66 @@ class ValidationError(Exception):
         self.details = details or {}
         super().__init__(self.message)
 
-def get_bedrock_client():
-    """Bedrock Agent Runtime 클라이언트 가져오기 (lazy initialization)"""
-    global _bedrock_agent_runtime
-    if _bedrock_agent_runtime is None:
-        _bedrock_agent_runtime = boto3.client(
-            'bedrock-agent-runtime',
-            region_name=os.environ.get('BEDROCK_REGION', 'us-east-1')
+def get_bedrock_client(profile: str = 'bio_coach'):
+    """Bedrock Agent Runtime 클라이언트 가져오기 (용도별 프로필, 웜 컨테이너에서 재사용)"""
+    return get_client('bedrock-agent-runtime', profile, region_name=os.environ.get('BEDROCK_REGION', 'us-east-1'))
+
+
+def get_lambda_client():
+    """비동기 자기 호출용 Lambda 클라이언트 가져오기"""
+    return get_client('lambda', 'async')
+
+
+def request_plan_enrichment(plan_type: str, user_id: str, plan_date: str):
+    """
+    Bio-Coach Agent 팁 보강을 비동기 자기 호출로 요청
+    
+    실패해도 이미 저장된 규칙 기반 계획에는 영향이 없음
+    """
+    try:
+        get_lambda_client().invoke(
+            FunctionName=os.environ['AWS_LAMBDA_FUNCTION_NAME'],
+            InvocationType='Event',
+            Payload=json.dumps({
+                'source': PLAN_ENRICHMENT_EVENT_SOURCE,
+                'plan_type': plan_type,
+                'user_id': user_id,
+                'plan_date': plan_date
+            })
         )
-    return _bedrock_agent_runtime
+        logger.info(f"📨 Plan enrichment requested: type={plan_type}, user={user_id}, date={plan_date}")
+    except Exception as e:
+        logger.warning(f"⚠️  Plan enrichment request failed, keeping rule-based tip: {e}")
+
+
+def bio_coach_cache_key(plan_type: str, shift_type: Optional[str], previous_shift_type: Optional[str]) -> str:
+    """Bio-Coach 응답 캐시 키 (일정이 없는 날은 '-')"""
+    return ':'.join([plan_type, shift_type or '-', previous_shift_type or '-', BIO_COACH_LOCALE])
+
+
+def get_agent_deadline(context) -> Optional[float]:
+    """Agent 응답 마감 시각 (monotonic 기준, 기다릴 시간이 없으면 None)"""
+    budget_ms = BIO_AGENT_BUDGET_MS
+    if context is not None:
+        budget_ms = min(budget_ms, context.get_remaining_time_in_millis() - BIO_AGENT_DEADLINE_MARGIN_MS)
+    if budget_ms <= 0:
+        return None
+    return monotonic() + budget_ms / 1000
+
+
+def is_valid_bio_plan(plan: Dict[str, Any]) -> bool:
+    """Agent 응답의 sleep_time / coffee_time이 저장 가능한 HH:MM 값인지 확인"""
+    try:
+        for key in ('sleep_time', 'coffee_time'):
+            datetime.strptime(plan[key], '%H:%M')
+        return True
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def get_bio_coach_cache_stats() -> Dict[str, Any]:
+    """Bio-Coach 응답 캐시 통계 (프로세스 내 캐시 + 공유 테이블)"""
+    return {**bio_coach_cache.snapshot(), 'shared': dict(bio_coach_shared_cache_stats)}
 
 
 # ============================================================================
@@ -168,7 +275,8 @@ def validate_input(user_id: str, target_date: str):
 # Bedrock Agent Integration Functions (Task 2.1, 2.2, 2.3)
 # ============================================================================
 
-def invoke_bedrock_agent(user_id: str, target_date: str, prompt: str, use_bio_coach: bool = False) -> Dict[str, Any]:
+def invoke_bedrock_agent(user_id: str, target_date: str, prompt: str, use_bio_coach: bool = False,
+                         profile: Optional[str] = None, deadline: Optional[float] = None) -> Dict[str, Any]:
     """
     Invoke Bedrock Agent with specified prompt (Task 2.1)
     
@@ -177,11 +285,14 @@ def invoke_bedrock_agent(user_id: str, target_date: str, prompt: str, use_bio_co
         target_date: Date for recommendations (YYYY-MM-DD)
         prompt: Korean prompt for agent
         use_bio_coach: If True, use Bio-Coach agent for sleep/caffeine recommendations
+        profile: Client profile (default: 'bio_coach' or 'chat')
+        deadline: monotonic() deadline checked while reading the completion stream
         
     Returns:
         Parsed agent response with biorhythm data
         
     Raises:
+        AgentTimeoutError: If the deadline passes before the response is complete
         Exception: If agent invocation fails
     """
     try:
@@ -207,30 +318,47 @@ def invoke_bedrock_agent(user_id: str, target_date: str, prompt: str, use_bio_co
         logger.info(f"📝 Prompt: {prompt}")
         logger.info(f"📅 Target date: {target_date}")
         
-        # Get Bedrock client
-        bedrock_client = get_bedrock_client()
-        
-        # Invoke agent
-        response = bedrock_client.invoke_agent(
-            agentId=agent_id,
-            agentAliasId=agent_alias_id,
-            sessionId=session_id,
-            inputText=f"{prompt} (날짜: {target_date}, 사용자: {user_id})"
-        )
-        
-        # Parse response stream
-        completion_text = ""
-        event_stream = response.get('completion')
+        if deadline is not None and monotonic() >= deadline:
+            raise AgentTimeoutError(f"{agent_name} Agent deadline passed before invocation")
         
-        if not event_stream:
-            raise ValueError("No completion stream in Bedrock Agent response")
+        # 서킷 open이면 Bedrock을 기다리지 않고 바로 실패 (호출자가 규칙 기반 계획 / 더미 응답 사용)
+        breaker = bio_coach_breaker if use_bio_coach else bedrock_chat_breaker
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{agent_name} Agent circuit is open")
         
-        for event in event_stream:
-            if 'chunk' in event:
-                chunk = event['chunk']
-                if 'bytes' in chunk:
-                    text = chunk['bytes'].decode('utf-8')
-                    completion_text += text
+        try:
+            # Get Bedrock client
+            bedrock_client = get_bedrock_client(profile or ('bio_coach' if use_bio_coach else 'chat'))
+            
+            # Invoke agent
+            response = bedrock_client.invoke_agent(
+                agentId=agent_id,
+                agentAliasId=agent_alias_id,
+                sessionId=session_id,
+                inputText=f"{prompt} (날짜: {target_date}, 사용자: {user_id})"
+            )
+            
+            # Parse response stream
+            completion_text = ""
+            event_stream = response.get('completion')
+            
+            if not event_stream:
+                raise ValueError("No completion stream in Bedrock Agent response")
+            
+            for event in event_stream:
+                if 'chunk' in event:
+                    chunk = event['chunk']
+                    if 'bytes' in chunk:
+                        text = chunk['bytes'].decode('utf-8')
+                        completion_text += text
+                # 응답이 여러 청크로 느리게 오면 마감 시각에 스트림을 닫고 중단
+                if deadline is not None and monotonic() >= deadline:
+                    event_stream.close()
+                    raise AgentTimeoutError(f"{agent_name} Agent response exceeded deadline")
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
         
         logger.info(f"✅ {agent_name} Agent response: {completion_text[:200]}...")
         
@@ -244,10 +372,101 @@ def invoke_bedrock_agent(user_id: str, target_date: str, prompt: str, use_bio_co
         raise
 
 
+# parse_agent_response 토큰 패턴/키워드 (모듈 로드 시 한 번만 컴파일)
+AGENT_TIME_TOKEN_PATTERN = re.compile(r'\b([0-2]?[0-9]):([0-5][0-9])\b')
+# 근무 유형 토큰: 'day'와 한 글자 'd'는 모두 'D'로 매핑되므로 한 글자 클래스로 합침
+AGENT_SHIFT_TOKEN_PATTERN = re.compile(r'(주간|야간|초저녁|휴무|night|evening|off|[deno])', re.IGNORECASE)
+AGENT_TIME_CONTEXT_CHARS = 20
+AGENT_SLEEP_KEYWORDS = ('수면', '잠', 'sleep', '취침', '자는')
+AGENT_CAFFEINE_KEYWORDS = ('카페인', '커피', 'caffeine', 'coffee', '중단', '마감')
+AGENT_TIP_KEYWORDS = ('팁:', '권장사항:', '조언:', 'tip:', 'advice:')
+# 소문자로 찾은 근무 유형 토큰 -> BIO_RULES 키 (한 글자 토큰 d/e/n/o는 매핑이 없어 기본값 'D')
+AGENT_SHIFT_TOKEN_MAPPING = {
+    '주간': 'D',
+    '야간': 'N', 'night': 'N',
+    '초저녁': 'E', 'evening': 'E',
+    '휴무': 'O', 'off': 'O'
+}
+
+
+def scan_agent_time_tokens(response_text: str) -> List[Tuple[int, int, str]]:
+    """
+    응답의 HH:MM 시간 후보를 한 번에 스캔
+    
+    "12:01:30"처럼 시간 바로 뒤에 ':'가 오면 분 자리에서 시작하는 겹치는 후보(01:30)도 함께 포함
+    
+    Returns:
+        (시작 위치, 끝 위치, 'HH:MM') 목록 - 위치 순서
+    """
+    tokens = []
+    for match in AGENT_TIME_TOKEN_PATTERN.finditer(response_text):
+        tokens.append((match.start(), match.end(), f"{match.group(1).zfill(2)}:{match.group(2)}"))
+        if response_text.startswith(':', match.end()):
+            overlap = AGENT_TIME_TOKEN_PATTERN.match(response_text, match.start(2))
+            if overlap:
+                tokens.append((overlap.start(), overlap.end(), f"{overlap.group(1).zfill(2)}:{overlap.group(2)}"))
+    return tokens
+
+
+def find_agent_context_times(response_text: str, tokens: List[Tuple[int, int, str]]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    시간 후보 앞뒤 문맥(각 최대 20자, 줄바꿈 미포함)의 키워드로 수면/카페인 시간 판별
+    
+    기존 정규식 r'(.{0,20})\b시간\b(.{0,20})' + findall과 같은 결과가 나오도록,
+    앞 문맥이 닿는 가장 뒤의 후보를 고르고 뒤 문맥까지 소비한 위치에서 다음 탐색을 이어감
+    """
+    sleep_time = None
+    coffee_time = None
+    position = 0
+    index = 0
+    
+    while index < len(tokens):
+        # 탐색 위치 이후 첫 후보에 닿을 수 있는 가장 이른 앞 문맥 시작 위치
+        while index < len(tokens) and tokens[index][0] < position:
+            index += 1
+        if index == len(tokens):
+            break
+        
+        first_start = tokens[index][0]
+        context_start = max(position, first_start - AGENT_TIME_CONTEXT_CHARS,
+                            response_text.rfind('\n', 0, first_start) + 1)
+        newline = response_text.find('\n', context_start)
+        limit = context_start + AGENT_TIME_CONTEXT_CHARS
+        if newline != -1:
+            limit = min(limit, newline)
+        
+        # 앞 문맥은 greedy - 범위 안에서 가장 뒤의 후보
+        while index + 1 < len(tokens) and tokens[index + 1][0] <= limit:
+            index += 1
+        start, end, time_str = tokens[index]
+        
+        after_end = end + AGENT_TIME_CONTEXT_CHARS
+        newline = response_text.find('\n', end, after_end)
+        if newline != -1:
+            after_end = newline
+        after_end = min(after_end, len(response_text))
+        
+        context = (response_text[context_start:start] + response_text[end:after_end]).lower()
+        if any(keyword in context for keyword in AGENT_SLEEP_KEYWORDS):
+            if not sleep_time:  # Take first sleep time found
+                sleep_time = time_str
+        elif any(keyword in context for keyword in AGENT_CAFFEINE_KEYWORDS):
+            if not coffee_time:  # Take first caffeine time found
+                coffee_time = time_str
+        
+        position = after_end
+        index += 1
+    
+    return sleep_time, coffee_time
+
+
 def parse_agent_response(response_text: str, user_id: str, target_date: str) -> Dict[str, Any]:
     """
     Parse Bedrock Agent response and extract biorhythm data (Task 2.2)
     
+    Structured JSON replies take a fast path; otherwise time tokens are scanned once
+    and classified by their surrounding keywords.
+    
     Args:
         response_text: Raw agent response text
         user_id: User identifier
@@ -256,85 +475,54 @@ def parse_agent_response(response_text: str, user_id: str, target_date: str) ->
     Returns:
         Structured biorhythm data with sleep_time, coffee_time, shift_type, tip
     """
-    import re
-    import json as json_lib
-    
     try:
         # Try to parse as JSON first (if agent returns structured data)
-        try:
-            data = json_lib.loads(response_text)
-            if isinstance(data, dict) and 'sleep' in data:
-                return {
-                    'sleep_time': data.get('sleep'),
-                    'coffee_time': data.get('coffee'),
-                    'shift_type': data.get('shift'),
-                    'tip': data.get('tip', ''),
-                    'date': target_date
-                }
-        except json_lib.JSONDecodeError:
-            pass
-        
-        # Extract time patterns (HH:MM format) with context
-        # Look for sleep-related keywords near times
-        sleep_keywords = ['수면', '잠', 'sleep', '취침', '자는']
-        caffeine_keywords = ['카페인', '커피', 'caffeine', 'coffee', '중단', '마감']
-        
-        # Find all times with their context
-        time_pattern = r'(.{0,20})\b([0-2]?[0-9]):([0-5][0-9])\b(.{0,20})'
-        time_matches = re.findall(time_pattern, response_text, re.IGNORECASE)
-        
-        sleep_time = None
-        coffee_time = None
-        
-        # Analyze each time with context
-        for before, hour, minute, after in time_matches:
-            time_str = f"{hour.zfill(2)}:{minute}"
-            context = (before + after).lower()
-            
-            # Check if this is a sleep time
-            if any(keyword in context for keyword in sleep_keywords):
-                if not sleep_time:  # Take first sleep time found
-                    sleep_time = time_str
-            
-            # Check if this is a caffeine time
-            elif any(keyword in context for keyword in caffeine_keywords):
-                if not coffee_time:  # Take first caffeine time found
-                    coffee_time = time_str
+        if response_text.lstrip().startswith('{'):
+            try:
+                data = json.loads(response_text)
+                if isinstance(data, dict) and 'sleep' in data:
+                    return {
+                        'sleep_time': data.get('sleep'),
+                        'coffee_time': data.get('coffee'),
+                        'shift_type': data.get('shift'),
+                        'tip': data.get('tip', ''),
+                        'date': target_date
+                    }
+            except json.JSONDecodeError:
+                pass
+        
+        tokens = scan_agent_time_tokens(response_text)
+        sleep_time, coffee_time = find_agent_context_times(response_text, tokens)
         
         # Fallback: if we couldn't identify times by context, use position
+        # (겹치지 않는 순서대로의 시간: 첫 번째는 카페인, 두 번째는 수면 시간일 가능성이 높음)
         if not sleep_time or not coffee_time:
-            times = re.findall(r'\b([0-2]?[0-9]):([0-5][0-9])\b', response_text)
+            times = []
+            next_start = 0
+            for start, end, time_str in tokens:
+                if start >= next_start:
+                    times.append(time_str)
+                    next_start = end
+                    if len(times) == 2:
+                        break
             if not sleep_time and len(times) > 1:
-                # Second time is more likely to be sleep time
-                sleep_time = f"{times[1][0].zfill(2)}:{times[1][1]}"
-            if not coffee_time and len(times) > 0:
-                # First time is more likely to be caffeine time
-                coffee_time = f"{times[0][0].zfill(2)}:{times[0][1]}"
+                sleep_time = times[1]
+            if not coffee_time and times:
+                coffee_time = times[0]
         
         # Final defaults
         sleep_time = sleep_time or "23:00"
         coffee_time = coffee_time or "14:00"
         
-        # Extract shift type
-        shift_pattern = r'(주간|야간|초저녁|휴무|day|night|evening|off|D|E|N|O)'
-        shift_matches = re.findall(shift_pattern, response_text, re.IGNORECASE)
-        
-        # Map Korean to shift type
-        shift_mapping = {
-            '주간': 'D', 'day': 'D', 'D': 'D',
-            '야간': 'N', 'night': 'N', 'N': 'N',
-            '초저녁': 'E', 'evening': 'E', 'E': 'E',
-            '휴무': 'O', 'off': 'O', 'O': 'O'
-        }
-        
-        shift_type = 'D'  # Default
-        if shift_matches:
-            shift_type = shift_mapping.get(shift_matches[0].lower(), 'D')
+        # Extract shift type (first token only)
+        shift_match = AGENT_SHIFT_TOKEN_PATTERN.search(response_text)
+        shift_type = AGENT_SHIFT_TOKEN_MAPPING.get(shift_match.group(1).lower(), 'D') if shift_match else 'D'
         
         # Extract tip (everything after certain keywords)
         tip = response_text
-        for keyword in ['팁:', '권장사항:', '조언:', 'tip:', 'advice:']:
-            if keyword in response_text.lower():
+        lowered_text = response_text.lower()
+        for keyword in AGENT_TIP_KEYWORDS:
+            if keyword in lowered_text:
                 tip = response_text.split(keyword, 1)[1].strip()
                 break
         
@@ -414,216 +602,320 @@ def create_error_response(status_code: int, error_type: str, message: str, detai
         'body': json.dumps(body, ensure_ascii=False)
     }
 
-class DatabaseManager:
+class AIService:
     def __init__(self):
-        self.db_config = {
-            'host': os.environ['DB_HOST'],
-            'port': os.environ.get('DB_PORT', '5432'),
-            'database': os.environ.get('DB_NAME', 'rhythm_fairy'),
-            'user': os.environ.get('DB_USER', 'postgres'),
-            'password': os.environ['DB_PASSWORD']
+        self.db = DatabaseManager()
+    
+    def get_shift_context(self, user_id: str, plan_date: str) -> Tuple[Optional[str], Optional[str]]:
+        """계획일과 전날의 근무 유형을 한 번에 조회 (일정이 없는 날은 None)"""
+        target = datetime.strptime(plan_date, '%Y-%m-%d').date()
+        previous = target - timedelta(days=1)
+        schedule_query = """
+        SELECT work_date, shift_type FROM schedules 
+        WHERE user_id = %s AND work_date BETWEEN %s AND %s
+        """
+        shifts = {row['work_date']: row['shift_type'] for row in self.db.execute_query(schedule_query, (user_id, previous, target))}
+        return shifts.get(target), shifts.get(previous)
+    
+    def get_rule_based_plan(self, plan_date: str, shift_type: Optional[str]) -> Dict[str, Any]:
+        """
+        로컬 규칙 엔진: 근무 유형 + BIO_RULES로 수면/카페인 시간 계산 (Bedrock 호출 없음)
+        
+        biopathway_calculator와 같은 utils.bio_rules 규칙을 사용하며, 일정이 없으면 주간(D) 규칙
+        """
+        rules = lookup_bio_rules(shift_type or 'day')
+        
+        return {
+            'sleep_time': rules['sleep'],
+            'coffee_time': rules['coffee'],
+            'shift_type': rules['shift_type'],
+            'tip': rules['tip'],
+            'date': plan_date
         }
     
-    def get_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(**self.db_config)
+    def get_cached_bio_coach_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 Bio-Coach 응답 조회 (프로세스 내 캐시 → 공유 테이블 순서)"""
+        cached = bio_coach_cache.get(cache_key)
+        if cached is not None or not BIO_COACH_SHARED_CACHE:
+            return cached
+        
+        try:
+            rows = self.db.execute_query(
+                """
+                SELECT response, EXTRACT(EPOCH FROM expires_at - CURRENT_TIMESTAMP) AS ttl_seconds
+                FROM bio_coach_cache
+                WHERE cache_key = %s AND expires_at > CURRENT_TIMESTAMP
+                """,
+                (cache_key,)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Bio-Coach shared cache lookup failed: {e}")
+            return None
+        
+        if not rows:
+            bio_coach_shared_cache_stats['misses'] += 1
+            return None
+        
+        bio_coach_shared_cache_stats['hits'] += 1
+        cached = rows[0]['response']
+        bio_coach_cache.set(cache_key, cached, float(rows[0]['ttl_seconds']))
+        return cached
     
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+    def store_bio_coach_response(self, cache_key: str, response: Dict[str, Any]):
+        """Bio-Coach 응답 캐시 저장 (공유 테이블 저장 실패는 무시)"""
+        bio_coach_cache.set(cache_key, response)
+        if not BIO_COACH_SHARED_CACHE:
+            return
+        
+        try:
+            self.db.execute_update(
+                """
+                INSERT INTO bio_coach_cache (cache_key, response, expires_at)
+                VALUES (%s, %s, CURRENT_TIMESTAMP + %s * INTERVAL '1 second')
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    response = EXCLUDED.response,
+                    expires_at = EXCLUDED.expires_at
+                """,
+                (cache_key, json.dumps(response, ensure_ascii=False), BIO_COACH_CACHE_TTL_SECONDS)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Bio-Coach shared cache store failed: {e}")
     
-    def execute_update(self, query: str, params: tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
+    def invoke_bio_coach_cached(self, cache_key: str, user_id: str, plan_date: str, prompt: str,
+                                profile: str = 'bio_coach', deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        캐시를 거쳐 Bio-Coach Agent 호출
+        
+        같은 근무 맥락(키)의 파싱 결과가 캐시에 있으면 Bedrock을 호출하지 않고 date만 바꿔 반환
+        """
+        cached = self.get_cached_bio_coach_response(cache_key)
+        if cached is None:
+            agent_response = invoke_bedrock_agent(user_id, plan_date, prompt, use_bio_coach=True,
+                                                  profile=profile, deadline=deadline)
+            if not is_valid_bio_plan(agent_response):
+                raise ValueError(f"Invalid Bio-Coach times: sleep={agent_response.get('sleep_time')}, coffee={agent_response.get('coffee_time')}")
+            cached = {key: value for key, value in agent_response.items() if key != 'date'}
+            self.store_bio_coach_response(cache_key, cached)
+            logger.info(f"🧠 Bio-Coach cache miss: key={cache_key}, stats={get_bio_coach_cache_stats()}")
+        else:
+            logger.info(f"⚡ Bio-Coach cache hit: key={cache_key}, stats={get_bio_coach_cache_stats()}")
+        
+        return {**cached, 'date': plan_date}
     
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict]:
-        """INSERT 쿼리 실행 후 결과 반환"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                result = cursor.fetchone()
-                return dict(result) if result else None
-
-class AIService:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def get_bio_plan(self, plan_type: str, user_id: str, plan_date: str, prompt: str, context=None) -> Dict[str, Any]:
+        """
+        BIO_PLAN_MODE에 따라 Bio-Coach Agent 또는 로컬 규칙 엔진으로 계획 데이터 생성
+        
+        agent 모드는 규칙 기반 계획을 먼저 만들어 두고 Agent를 마감 시각(get_agent_deadline)까지만 기다림
+        (마감을 넘긴 Agent 호출은 응답 스트림을 읽다가 같은 마감 시각에 중단)
+        rules_enrich 모드에서 같은 근무 맥락의 Agent 팁이 이미 캐시되어 있으면 바로 사용하고,
+        없을 때만 needs_enrichment=True로 표시해 비동기 보강을 요청하게 함
+        """
+        shift_type, previous_shift_type = self.get_shift_context(user_id, plan_date)
+        cache_key = bio_coach_cache_key(plan_type, shift_type, previous_shift_type)
+        plan = self.get_rule_based_plan(plan_date, shift_type)
+        
+        if BIO_PLAN_MODE == PLAN_MODE_AGENT:
+            deadline = get_agent_deadline(context)
+            if deadline is None:
+                logger.warning("⏱️  No time left for Bio-Coach Agent, using rule-based plan")
+                return plan
+            if not _agent_slots.acquire(blocking=False):
+                logger.warning(f"⏱️  {BIO_AGENT_MAX_INFLIGHT} Bio-Coach calls already in flight, using rule-based plan")
+                return plan
+            
+            future = _agent_executor.submit(self.invoke_bio_coach_cached, cache_key, user_id, plan_date, prompt,
+                                            BIO_AGENT_HEDGE_PROFILE, deadline)
+            future.add_done_callback(lambda _: _agent_slots.release())
+            try:
+                return future.result(timeout=max(0.0, deadline - monotonic()))
+            except FuturesTimeoutError:
+                logger.warning("⏱️  Bio-Coach Agent missed its deadline, using rule-based plan")
+            except Exception as agent_error:
+                logger.warning(f"⚠️  Bedrock Agent failed, using fallback: {agent_error}")
+            return plan
+        
+        if BIO_PLAN_MODE == PLAN_MODE_RULES_ENRICH:
+            cached = self.get_cached_bio_coach_response(cache_key)
+            if cached and cached.get('tip'):
+                plan['tip'] = cached['tip']
+            elif not bio_coach_breaker.is_open():
+                # 서킷 open 동안은 실패할 보강 요청을 보내지 않고 규칙 기반 팁 유지
+                plan['needs_enrichment'] = True
+        return plan
+    
+    def enrich_plan_tip(self, plan_type: str, user_id: str, plan_date: str):
+        """
+        저장된 규칙 기반 계획의 팁 문구를 Bio-Coach Agent 응답으로 보강 (비동기 자기 호출에서 실행)
+        
+        시간 값은 바꾸지 않고 sleep_plans.rationale / caffeine_plans.recommendations만 갱신 (daily는 둘 다)
+        """
+        try:
+            prompt = PLAN_PROMPTS[plan_type].format(plan_date=plan_date)
+            shift_type, previous_shift_type = self.get_shift_context(user_id, plan_date)
+            cache_key = bio_coach_cache_key(plan_type, shift_type, previous_shift_type)
+            agent_response = self.invoke_bio_coach_cached(cache_key, user_id, plan_date, prompt)
+            tip = agent_response.get('tip')
+            if not tip:
+                return
+            
+            with self.db.unit_of_work():
+                updated = sum(self.db.execute_update(update_query, (tip, user_id, plan_date))
+                              for update_query in PLAN_TIP_UPDATES[plan_type])
+            logger.info(f"✅ Plan tip enriched: type={plan_type}, user={user_id}, date={plan_date}, rows={updated}")
+        except Exception as e:
+            logger.warning(f"⚠️  Plan tip enrichment failed, keeping rule-based tip: {e}")
     
-    def generate_sleep_plan(self, user_id: str, plan_date: str) -> Dict[str, Any]:
+    def build_sleep_plan(self, user_id: str, plan_date: str, bio_plan: Dict[str, Any]) -> Dict[str, Any]:
         """
-        수면 계획 생성 (Bedrock Agent 사용) 및 DB 저장
+        Bio 계획 데이터로 수면 계획 응답 구성 (DB 저장 전, id=None)
         
-        Uses Bedrock Agent to generate personalized sleep recommendations
-        based on user's work schedule and saves to database.
+        Converts sleep_time to a sleep window and adds nap recommendations by shift type.
+        """
+        sleep_time = bio_plan.get('sleep_time', '23:00')
+        shift_type = bio_plan.get('shift_type', 'D')
+        tip = bio_plan.get('tip', '규칙적인 수면 패턴을 유지하세요.')
+        
+        # Calculate sleep duration (8 hours recommended)
+        sleep_duration_hours = 8
+        
+        try:
+            # Calculate end time (sleep_time + duration), e.g. "09:00" -> "17:00"
+            sleep_start = datetime.strptime(sleep_time, '%H:%M')
+            sleep_end = sleep_start + timedelta(hours=sleep_duration_hours)
+            
+            main_sleep_start = sleep_start.strftime('%H:%M')
+            main_sleep_end = sleep_end.strftime('%H:%M')
+            
+            # Nap recommendations based on shift type
+            nap_start = None
+            nap_end = None
+            if shift_type == 'N':  # Night shift - recommend pre-work nap
+                # 야간 근무 전 저녁 낮잠 (출근 전 20:00-20:30)
+                nap_start = '20:00'
+                nap_end = '20:30'
+            elif shift_type == 'E':  # Evening shift - recommend afternoon nap
+                # 저녁 근무 전 오후 낮잠
+                nap_start = '15:00'
+                nap_end = '15:30'
+            # Day shift (D) - no nap needed
+            
+        except Exception as parse_error:
+            logger.warning(f"Sleep time parsing error: {parse_error}, using defaults")
+            main_sleep_start = '23:00'
+            main_sleep_end = '07:00'
+            nap_start = None
+            nap_end = None
+        
+        # Structured response matching frontend expectations (returned as-is if DB save fails)
+        return {
+            'id': None,
+            'user_id': user_id,
+            'plan_date': plan_date,
+            'main_sleep_start': main_sleep_start,
+            'main_sleep_end': main_sleep_end,
+            'main_sleep_duration': sleep_duration_hours,
+            'nap_start': nap_start,
+            'nap_end': nap_end,
+            'nap_duration': 0.5 if nap_start else None,  # 30 minutes
+            'rationale': tip,
+            'created_at': datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat()
+        }
+    
+    def upsert_sleep_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """수면 계획 저장 (build_sleep_plan 결과, 실패 시 예외 발생)"""
+        plan_date = plan['plan_date']
+        
+        # Convert time strings to TIMESTAMP WITH TIME ZONE
+        # Format: plan_date + time
+        main_sleep_start_ts = f"{plan_date} {plan['main_sleep_start']}:00"
+        main_sleep_end_ts = f"{plan_date} {plan['main_sleep_end']}:00"
+        
+        # Handle next day for sleep end time
+        if plan['main_sleep_end'] < plan['main_sleep_start']:
+            # Sleep crosses midnight
+            next_day = datetime.strptime(plan_date, '%Y-%m-%d') + timedelta(days=1)
+            main_sleep_end_ts = f"{next_day.strftime('%Y-%m-%d')} {plan['main_sleep_end']}:00"
+        
+        nap_start_ts = f"{plan_date} {plan['nap_start']}:00" if plan['nap_start'] else None
+        nap_end_ts = f"{plan_date} {plan['nap_end']}:00" if plan['nap_end'] else None
+        
+        # Insert or update sleep plan
+        upsert_query = """
+        INSERT INTO sleep_plans (
+            user_id, plan_date, main_sleep_start, main_sleep_end, 
+            main_sleep_duration, nap_start, nap_end, nap_duration, rationale
+        )
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (user_id, plan_date) 
+        DO UPDATE SET
+            main_sleep_start = EXCLUDED.main_sleep_start,
+            main_sleep_end = EXCLUDED.main_sleep_end,
+            main_sleep_duration = EXCLUDED.main_sleep_duration,
+            nap_start = EXCLUDED.nap_start,
+            nap_end = EXCLUDED.nap_end,
+            nap_duration = EXCLUDED.nap_duration,
+            rationale = EXCLUDED.rationale,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING id, user_id, plan_date, 
+                  main_sleep_start, main_sleep_end, main_sleep_duration,
+                  nap_start, nap_end, nap_duration, rationale,
+                  created_at, updated_at
+        """
+        
+        result = self.db.execute_insert_returning(
+            upsert_query,
+            (
+                plan['user_id'], plan_date, main_sleep_start_ts, main_sleep_end_ts,
+                plan['main_sleep_duration'] * 60,  # Convert to minutes
+                nap_start_ts, nap_end_ts,
+                30 if plan['nap_start'] else None,  # 30 minutes nap
+                plan['rationale']
+            )
+        )
+        
+        logger.info(f"✅ Sleep plan saved to database: id={result['id']}")
+        # Convert TIMESTAMP to time strings for response
+        result['main_sleep_start'] = result['main_sleep_start'].strftime('%H:%M') if result['main_sleep_start'] else None
+        result['main_sleep_end'] = result['main_sleep_end'].strftime('%H:%M') if result['main_sleep_end'] else None
+        result['nap_start'] = result['nap_start'].strftime('%H:%M') if result['nap_start'] else None
+        result['nap_end'] = result['nap_end'].strftime('%H:%M') if result['nap_end'] else None
+        result['created_at'] = result['created_at'].isoformat() if result['created_at'] else None
+        result['updated_at'] = result['updated_at'].isoformat() if result['updated_at'] else None
+        result['main_sleep_duration'] = result['main_sleep_duration'] / 60  # Convert to hours
+        result['nap_duration'] = result['nap_duration'] / 60 if result['nap_duration'] else None
+        return result
+    
+    def generate_sleep_plan(self, user_id: str, plan_date: str, context=None) -> Dict[str, Any]:
+        """
+        수면 계획 생성 (BIO_PLAN_MODE: 로컬 규칙 엔진 또는 Bedrock Agent) 및 DB 저장
+        
+        Generates sleep recommendations based on user's work schedule
+        and saves to database.
         """
         try:
             # Invoke Bedrock Agent with sleep-focused prompt
-            prompt = f"{plan_date}의 최적 수면 시간을 알려주세요"
+            prompt = PLAN_PROMPTS['sleep'].format(plan_date=plan_date)
             
             logger.info(f"🛏️  Generating sleep plan for user={user_id}, date={plan_date}")
             
-            try:
-                # Call Bio-Coach Agent (use_bio_coach=True)
-                agent_response = invoke_bedrock_agent(user_id, plan_date, prompt, use_bio_coach=True)
-                
-                sleep_time = agent_response.get('sleep_time', '23:00')
-                shift_type = agent_response.get('shift_type', 'D')
-                tip = agent_response.get('tip', '규칙적인 수면 패턴을 유지하세요.')
-                
-                logger.info(f"✅ Sleep plan generated: sleep_time={sleep_time}, shift_type={shift_type}")
-                
-            except Exception as agent_error:
-                logger.warning(f"⚠️  Bedrock Agent failed, using fallback: {agent_error}")
-                # Fallback to schedule-based logic
-                schedule_query = """
-                SELECT shift_type, start_time, end_time FROM schedules 
-                WHERE user_id = %s AND work_date = %s
-                """
-                schedules = self.db.execute_query(schedule_query, (user_id, plan_date))
-                
-                if schedules and schedules[0]['shift_type'] == 'night':
-                    # 야간 근무: 퇴근 후 아침에 수면 (08:00 - 16:00)
-                    sleep_time = "08:00"
-                    shift_type = "N"
-                    tip = "야간 근무 후 충분한 주간 수면을 취하세요. 퇴근 후 바로 암막 커튼을 치고 수면하는 것이 중요합니다."
-                elif schedules and schedules[0]['shift_type'] == 'evening':
-                    # 저녁 근무: 늦은 밤 수면 (02:00 - 10:00)
-                    sleep_time = "02:00"
-                    shift_type = "E"
-                    tip = "저녁 근무 후 늦은 취침과 충분한 아침 수면을 권장합니다."
-                else:
-                    # 주간 근무 또는 휴무: 일반적인 수면 시간 (23:00 - 07:00)
-                    sleep_time = "23:00"
-                    shift_type = "D"
-                    tip = "밤 11시 이전 취침하여 규칙적인 생체 리듬을 유지하세요."
-            
-            # Calculate sleep window based on shift type
-            # Convert sleep_time to sleep window (start and end times)
-            from datetime import datetime as dt, timedelta
+            bio_plan = self.get_bio_plan('sleep', user_id, plan_date, prompt, context)
+            sleep_plan = self.build_sleep_plan(user_id, plan_date, bio_plan)
             
-            try:
-                # Parse sleep_time (e.g., "09:00")
-                sleep_hour, sleep_minute = map(int, sleep_time.split(':'))
-                
-                # Calculate sleep duration (8 hours recommended)
-                sleep_duration_hours = 8
-                
-                # Calculate end time (sleep_time + duration)
-                sleep_start = dt.strptime(sleep_time, '%H:%M')
-                sleep_end = sleep_start + timedelta(hours=sleep_duration_hours)
-                
-                main_sleep_start = sleep_start.strftime('%H:%M')
-                main_sleep_end = sleep_end.strftime('%H:%M')
-                
-                # Nap recommendations based on shift type
-                nap_start = None
-                nap_end = None
-                if shift_type == 'N':  # Night shift - recommend pre-work nap
-                    # 야간 근무 전 저녁 낮잠 (출근 전 20:00-20:30)
-                    nap_start = '20:00'
-                    nap_end = '20:30'
-                elif shift_type == 'E':  # Evening shift - recommend afternoon nap
-                    # 저녁 근무 전 오후 낮잠
-                    nap_start = '15:00'
-                    nap_end = '15:30'
-                # Day shift (D) - no nap needed
-                
-            except Exception as parse_error:
-                logger.warning(f"Sleep time parsing error: {parse_error}, using defaults")
-                main_sleep_start = '23:00'
-                main_sleep_end = '07:00'
-                nap_start = None
-                nap_end = None
+            logger.info(f"✅ Sleep plan generated: sleep_time={sleep_plan['main_sleep_start']}, shift_type={bio_plan.get('shift_type')}, mode={BIO_PLAN_MODE}")
             
             # Save to database
             try:
-                # Convert time strings to TIMESTAMP WITH TIME ZONE
-                # Format: plan_date + time
-                main_sleep_start_ts = f"{plan_date} {main_sleep_start}:00"
-                main_sleep_end_ts = f"{plan_date} {main_sleep_end}:00"
-                
-                # Handle next day for sleep end time
-                if main_sleep_end < main_sleep_start:
-                    # Sleep crosses midnight
-                    next_day = dt.strptime(plan_date, '%Y-%m-%d') + timedelta(days=1)
-                    main_sleep_end_ts = f"{next_day.strftime('%Y-%m-%d')} {main_sleep_end}:00"
-                
-                nap_start_ts = f"{plan_date} {nap_start}:00" if nap_start else None
-                nap_end_ts = f"{plan_date} {nap_end}:00" if nap_end else None
-                
-                # Insert or update sleep plan
-                upsert_query = """
-                INSERT INTO sleep_plans (
-                    user_id, plan_date, main_sleep_start, main_sleep_end, 
-                    main_sleep_duration, nap_start, nap_end, nap_duration, rationale
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (user_id, plan_date) 
-                DO UPDATE SET
-                    main_sleep_start = EXCLUDED.main_sleep_start,
-                    main_sleep_end = EXCLUDED.main_sleep_end,
-                    main_sleep_duration = EXCLUDED.main_sleep_duration,
-                    nap_start = EXCLUDED.nap_start,
-                    nap_end = EXCLUDED.nap_end,
-                    nap_duration = EXCLUDED.nap_duration,
-                    rationale = EXCLUDED.rationale,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id, user_id, plan_date, 
-                          main_sleep_start, main_sleep_end, main_sleep_duration,
-                          nap_start, nap_end, nap_duration, rationale,
-                          created_at, updated_at
-                """
-                
-                result = self.db.execute_insert_returning(
-                    upsert_query,
-                    (
-                        user_id, plan_date, main_sleep_start_ts, main_sleep_end_ts,
-                        sleep_duration_hours * 60,  # Convert to minutes
-                        nap_start_ts, nap_end_ts,
-                        30 if nap_start else None,  # 30 minutes nap
-                        tip
-                    )
-                )
-                
-                if result:
-                    logger.info(f"✅ Sleep plan saved to database: id={result['id']}")
-                    # Convert TIMESTAMP to time strings for response
-                    result['main_sleep_start'] = result['main_sleep_start'].strftime('%H:%M') if result['main_sleep_start'] else None
-                    result['main_sleep_end'] = result['main_sleep_end'].strftime('%H:%M') if result['main_sleep_end'] else None
-                    result['nap_start'] = result['nap_start'].strftime('%H:%M') if result['nap_start'] else None
-                    result['nap_end'] = result['nap_end'].strftime('%H:%M') if result['nap_end'] else None
-                    result['created_at'] = result['created_at'].isoformat() if result['created_at'] else None
-                    result['updated_at'] = result['updated_at'].isoformat() if result['updated_at'] else None
-                    result['main_sleep_duration'] = result['main_sleep_duration'] / 60  # Convert to hours
-                    result['nap_duration'] = result['nap_duration'] / 60 if result['nap_duration'] else None
-                    return result
-                    
+                result = self.upsert_sleep_plan(sleep_plan)
             except Exception as db_error:
                 logger.error(f"❌ Failed to save sleep plan to database: {db_error}")
                 # Continue with in-memory response if DB save fails
+                return sleep_plan
             
-            # Return structured response matching frontend expectations (fallback if DB save fails)
-            return {
-                'id': None,
-                'user_id': user_id,
-                'plan_date': plan_date,
-                'main_sleep_start': main_sleep_start,
-                'main_sleep_end': main_sleep_end,
-                'main_sleep_duration': sleep_duration_hours,
-                'nap_start': nap_start,
-                'nap_end': nap_end,
-                'nap_duration': 0.5 if nap_start else None,  # 30 minutes
-                'rationale': tip,
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat()
-            }
+            if bio_plan.get('needs_enrichment'):
+                request_plan_enrichment('sleep', user_id, plan_date)
+            return result
             
         except Exception as e:
             logger.error(f"❌ Sleep plan generation error: {e}")
@@ -662,108 +954,124 @@ class AIService:
             logger.error(f"수면 계획 조회 오류: {e}")
             raise
     
-    def generate_caffeine_plan(self, user_id: str, plan_date: str) -> Dict[str, Any]:
+    def build_caffeine_plan(self, user_id: str, plan_date: str, bio_plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Bio 계획 데이터로 카페인 계획 응답 구성 (DB 저장 전, id=None)"""
+        # Structured response matching frontend expectations (returned as-is if DB save fails)
+        return {
+            'id': None,
+            'user_id': user_id,
+            'plan_date': plan_date,
+            'cutoff_time': bio_plan.get('coffee_time', '14:00'),
+            'max_intake_mg': 400,  # Standard recommendation
+            'recommendations': bio_plan.get('tip', '오후 2시 이후 카페인 섭취를 피하세요.'),
+            'alternative_methods': '물, 가벼운 스트레칭, 짧은 산책',
+            'created_at': datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat()
+        }
+    
+    def upsert_caffeine_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """카페인 계획 저장 (build_caffeine_plan 결과, 실패 시 예외 발생)"""
+        # Insert or update caffeine plan
+        upsert_query = """
+        INSERT INTO caffeine_plans (
+            user_id, plan_date, cutoff_time, max_intake_mg, 
+            recommendations, alternative_methods
+        )
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (user_id, plan_date) 
+        DO UPDATE SET
+            cutoff_time = EXCLUDED.cutoff_time,
+            max_intake_mg = EXCLUDED.max_intake_mg,
+            recommendations = EXCLUDED.recommendations,
+            alternative_methods = EXCLUDED.alternative_methods,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING id, user_id, plan_date, cutoff_time, max_intake_mg,
+                  recommendations, alternative_methods, created_at, updated_at
         """
-        카페인 계획 생성 (Bedrock Agent 사용) 및 DB 저장
         
-        Uses Bedrock Agent to generate personalized caffeine cutoff recommendations
-        based on user's work schedule and sleep time and saves to database.
+        result = self.db.execute_insert_returning(
+            upsert_query,
+            (
+                plan['user_id'], plan['plan_date'], plan['cutoff_time'], plan['max_intake_mg'],
+                plan['recommendations'], plan['alternative_methods']
+            )
+        )
+        
+        logger.info(f"✅ Caffeine plan saved to database: id={result['id']}")
+        # Convert TIME to string for response
+        result['cutoff_time'] = result['cutoff_time'].strftime('%H:%M') if result['cutoff_time'] else None
+        result['created_at'] = result['created_at'].isoformat() if result['created_at'] else None
+        result['updated_at'] = result['updated_at'].isoformat() if result['updated_at'] else None
+        return result
+    
+    def generate_caffeine_plan(self, user_id: str, plan_date: str, context=None) -> Dict[str, Any]:
+        """
+        카페인 계획 생성 (BIO_PLAN_MODE: 로컬 규칙 엔진 또는 Bedrock Agent) 및 DB 저장
+        
+        Generates caffeine cutoff recommendations based on user's work schedule
+        and saves to database.
         """
         try:
             # Invoke Bedrock Agent with caffeine-focused prompt
-            prompt = f"{plan_date}의 카페인 섭취 마감 시간을 알려주세요"
+            prompt = PLAN_PROMPTS['caffeine'].format(plan_date=plan_date)
             
             logger.info(f"☕ Generating caffeine plan for user={user_id}, date={plan_date}")
             
-            try:
-                # Call Bio-Coach Agent (use_bio_coach=True)
-                agent_response = invoke_bedrock_agent(user_id, plan_date, prompt, use_bio_coach=True)
-                
-                coffee_time = agent_response.get('coffee_time', '14:00')
-                shift_type = agent_response.get('shift_type', 'D')
-                tip = agent_response.get('tip', '오후 2시 이후 카페인 섭취를 피하세요.')
-                
-                logger.info(f"✅ Caffeine plan generated: coffee_time={coffee_time}, shift_type={shift_type}")
-                
-            except Exception as agent_error:
-                logger.warning(f"⚠️  Bedrock Agent failed, using fallback: {agent_error}")
-                # Fallback to schedule-based logic
-                schedule_query = """
-                SELECT shift_type FROM schedules 
-                WHERE user_id = %s AND work_date = %s
-                """
-                schedules = self.db.execute_query(schedule_query, (user_id, plan_date))
-                
-                if schedules and schedules[0]['shift_type'] == 'night':
-                    coffee_time = "03:00"
-                    shift_type = "N"
-                    tip = "야간 근무 초반에만 카페인을 섭취하고, 새벽 3시 이후에는 피하세요."
-                elif schedules and schedules[0]['shift_type'] == 'evening':
-                    coffee_time = "18:00"
-                    shift_type = "E"
-                    tip = "저녁 근무 전 적당한 카페인 섭취 후 야간에는 피하세요."
-                else:
-                    coffee_time = "14:00"
-                    shift_type = "D"
-                    tip = "오후 2시 이후 카페인 섭취를 피해 야간 수면의 질을 보장하세요."
+            bio_plan = self.get_bio_plan('caffeine', user_id, plan_date, prompt, context)
+            caffeine_plan = self.build_caffeine_plan(user_id, plan_date, bio_plan)
+            
+            logger.info(f"✅ Caffeine plan generated: coffee_time={caffeine_plan['cutoff_time']}, shift_type={bio_plan.get('shift_type')}, mode={BIO_PLAN_MODE}")
             
             # Save to database
             try:
-                # Insert or update caffeine plan
-                upsert_query = """
-                INSERT INTO caffeine_plans (
-                    user_id, plan_date, cutoff_time, max_intake_mg, 
-                    recommendations, alternative_methods
-                )
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (user_id, plan_date) 
-                DO UPDATE SET
-                    cutoff_time = EXCLUDED.cutoff_time,
-                    max_intake_mg = EXCLUDED.max_intake_mg,
-                    recommendations = EXCLUDED.recommendations,
-                    alternative_methods = EXCLUDED.alternative_methods,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id, user_id, plan_date, cutoff_time, max_intake_mg,
-                          recommendations, alternative_methods, created_at, updated_at
-                """
-                
-                result = self.db.execute_insert_returning(
-                    upsert_query,
-                    (
-                        user_id, plan_date, coffee_time, 400,  # 400mg standard
-                        tip, '물, 가벼운 스트레칭, 짧은 산책'
-                    )
-                )
-                
-                if result:
-                    logger.info(f"✅ Caffeine plan saved to database: id={result['id']}")
-                    # Convert TIME to string for response
-                    result['cutoff_time'] = result['cutoff_time'].strftime('%H:%M') if result['cutoff_time'] else None
-                    result['created_at'] = result['created_at'].isoformat() if result['created_at'] else None
-                    result['updated_at'] = result['updated_at'].isoformat() if result['updated_at'] else None
-                    return result
-                    
+                result = self.upsert_caffeine_plan(caffeine_plan)
             except Exception as db_error:
                 logger.error(f"❌ Failed to save caffeine plan to database: {db_error}")
                 # Continue with in-memory response if DB save fails
+                return caffeine_plan
             
-            # Return structured response matching frontend expectations (fallback if DB save fails)
-            return {
-                'id': None,
-                'user_id': user_id,
-                'plan_date': plan_date,
-                'cutoff_time': coffee_time,
-                'max_intake_mg': 400,  # Standard recommendation
-                'recommendations': tip,
-                'alternative_methods': '물, 가벼운 스트레칭, 짧은 산책',
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat()
-            }
+            if bio_plan.get('needs_enrichment'):
+                request_plan_enrichment('caffeine', user_id, plan_date)
+            return result
             
         except Exception as e:
             logger.error(f"❌ Caffeine plan generation error: {e}")
             raise
     
+    def generate_daily_plan(self, user_id: str, plan_date: str, context=None) -> Dict[str, Any]:
+        """
+        수면 + 카페인 계획을 한 번에 생성 (Bio-Coach Agent 1회 호출, 응답 1회 파싱)
+        
+        두 계획의 저장은 하나의 트랜잭션 - 하나라도 실패하면 둘 다 저장하지 않고 메모리 응답 반환
+        """
+        try:
+            prompt = PLAN_PROMPTS['daily'].format(plan_date=plan_date)
+            
+            logger.info(f"🗓️  Generating daily plan for user={user_id}, date={plan_date}")
+            
+            bio_plan = self.get_bio_plan('daily', user_id, plan_date, prompt, context)
+            sleep_plan = self.build_sleep_plan(user_id, plan_date, bio_plan)
+            caffeine_plan = self.build_caffeine_plan(user_id, plan_date, bio_plan)
+            
+            logger.info(f"✅ Daily plan generated: sleep_time={sleep_plan['main_sleep_start']}, coffee_time={caffeine_plan['cutoff_time']}, mode={BIO_PLAN_MODE}")
+            
+            try:
+                with self.db.unit_of_work():
+                    saved_sleep_plan = self.upsert_sleep_plan(sleep_plan)
+                    saved_caffeine_plan = self.upsert_caffeine_plan(caffeine_plan)
+            except Exception as db_error:
+                logger.error(f"❌ Failed to save daily plan to database: {db_error}")
+                # Continue with in-memory response if DB save fails
+                return {'sleep_plan': sleep_plan, 'caffeine_plan': caffeine_plan}
+            
+            if bio_plan.get('needs_enrichment'):
+                request_plan_enrichment('daily', user_id, plan_date)
+            return {'sleep_plan': saved_sleep_plan, 'caffeine_plan': saved_caffeine_plan}
+            
+        except Exception as e:
+            logger.error(f"❌ Daily plan generation error: {e}")
+            raise
+    
     def get_caffeine_plan(self, user_id: str, plan_date: str) -> Optional[Dict[str, Any]]:
         """카페인 계획 조회"""
         try:
@@ -790,8 +1098,13 @@ class AIService:
             logger.error(f"카페인 계획 조회 오류: {e}")
             raise
     
-    def chat_with_ai(self, user_id: str, message: str) -> Dict[str, Any]:
-        """AI 챗봇 상담 (Bedrock Agent 사용)"""
+    def chat_with_ai(self, user_id: str, message: str, on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        AI 챗봇 상담 (Bedrock Agent 사용)
+        
+        on_chunk가 주어지면 Agent 응답 텍스트 청크를 도착하는 즉시 전달 (스트리밍),
+        chat_history 저장은 스트림이 끝난 뒤 한 번만 수행
+        """
         try:
             # Bedrock Agent 설정
             agent_id = os.environ.get('BEDROCK_AGENT_ID')
@@ -801,33 +1114,34 @@ class AIService:
                 logger.warning("Bedrock Agent 설정이 없습니다. 더미 응답을 사용합니다.")
                 return self._chat_with_dummy_ai(user_id, message)
             
+            # 서킷 open이면 Agent 타임아웃/재시도를 기다리지 않고 바로 더미 응답
+            if not bedrock_chat_breaker.allow_request():
+                logger.warning(f"⚡ Bedrock Agent 서킷 open - 더미 응답 사용: {bedrock_chat_breaker.snapshot()}")
+                return self._chat_with_dummy_ai(user_id, message)
+            
             # 세션 ID 생성 (사용자별 고유 세션)
             session_id = f"{user_id}-{datetime.now().strftime('%Y%m%d')}"
             
             logger.info(f"Bedrock Agent 호출 시작: agent_id={agent_id}, alias_id={agent_alias_id}, session_id={session_id}")
             
-            # Bedrock Agent 클라이언트 가져오기 (타임아웃 설정)
-            bedrock_client = boto3.client(
-                'bedrock-agent-runtime',
-                region_name=os.environ.get('BEDROCK_REGION', 'us-east-1'),
-                config=boto3.session.Config(
-                    connect_timeout=30,  # VPC 엔드포인트 연결을 위해 증가
-                    read_timeout=90,
-                    retries={'max_attempts': 2}  # 재시도 추가
+            try:
+                # Bedrock Agent 클라이언트 가져오기 (chat 프로필: VPC 엔드포인트 연결 30초, 읽기 90초, 재시도 2회)
+                bedrock_client = get_bedrock_client('chat')
+                
+                logger.info("Bedrock Agent invoke_agent 호출 중...")
+                logger.info(f"요청 파라미터: agentId={agent_id}, agentAliasId={agent_alias_id}, sessionId={session_id}")
+                
+                # Bedrock Agent 호출
+                response = bedrock_client.invoke_agent(
+                    agentId=agent_id,
+                    agentAliasId=agent_alias_id,
+                    sessionId=session_id,
+                    inputText=message,
+                    enableTrace=True  # 디버깅을 위해 trace 활성화
                 )
-            )
-            
-            logger.info("Bedrock Agent invoke_agent 호출 중...")
-            logger.info(f"요청 파라미터: agentId={agent_id}, agentAliasId={agent_alias_id}, sessionId={session_id}")
-            
-            # Bedrock Agent 호출
-            response = bedrock_client.invoke_agent(
-                agentId=agent_id,
-                agentAliasId=agent_alias_id,
-                sessionId=session_id,
-                inputText=message,
-                enableTrace=True  # 디버깅을 위해 trace 활성화
-            )
+            except Exception:
+                bedrock_chat_breaker.record_failure()
+                raise
             
             logger.info(f"Bedrock Agent 응답 수신: {list(response.keys())}")
             logger.info("스트림 처리 시작...")
@@ -838,6 +1152,7 @@ class AIService:
             
             if not event_stream:
                 logger.error("Bedrock Agent 응답에 completion 스트림이 없습니다")
+                bedrock_chat_breaker.record_failure()
                 return self._chat_with_dummy_ai(user_id, message)
             
             chunk_count = 0
@@ -862,6 +1177,8 @@ class AIService:
                             text = chunk['bytes'].decode('utf-8')
                             ai_response += text
                             logger.info(f"텍스트 청크 ({len(text)}자): {text[:100]}...")
+                            if on_chunk:
+                                on_chunk(text)
                     
                     # 오류 이벤트 확인
                     if 'internalServerException' in event:
@@ -884,7 +1201,9 @@ class AIService:
             
             if error_occurred or not ai_response:
                 logger.warning("Bedrock Agent 응답이 비어있거나 오류 발생. 더미 응답 사용")
+                bedrock_chat_breaker.record_failure()
                 return self._chat_with_dummy_ai(user_id, message)
+            bedrock_chat_breaker.record_success()
             
             # 채팅 기록 저장
             query = """
@@ -936,17 +1255,26 @@ class AIService:
             logger.error(f"더미 AI 챗봇 오류: {e}")
             raise
     
-    def get_chat_history(self, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """채팅 기록 조회"""
+    def get_chat_history(self, user_id: str, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """채팅 기록 조회 ((created_at, id) 키셋 페이지네이션, 최신순)"""
         try:
             query = """
             SELECT id, user_id, message, response, created_at
             FROM chat_history 
             WHERE user_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
             """
-            return self.db.execute_query(query, (user_id, limit))
+            params = [user_id]
+            
+            after = decode_cursor(cursor, 2)
+            if after:
+                query += " AND (created_at, id) < (%s, %s)"
+                params.extend(after)
+            
+            query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+            params.append(limit + 1)
+            
+            rows = self.db.execute_query(query, tuple(params))
+            return paginate(rows, limit, ('created_at', 'id'))
         except Exception as e:
             logger.error(f"채팅 기록 조회 오류: {e}")
             raise
@@ -964,6 +1292,122 @@ def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
         'body': json.dumps(body, ensure_ascii=False, default=str)
     }
 
+def get_websocket_client(endpoint_url: str):
+    """API Gateway WebSocket 관리 클라이언트 가져오기 (엔드포인트별로 재사용)"""
+    return get_client('apigatewaymanagementapi', 'async', endpoint_url=endpoint_url)
+
+
+def verify_cognito_access_token(token: str) -> Optional[str]:
+    """
+    Cognito Access Token 검증 후 사용자 ID(sub) 반환 (유효하지 않으면 None)
+    
+    서명 / 만료 / 폐기 여부는 Cognito GetUser 호출로 확인하고,
+    이 앱의 User Pool / App Client가 발급한 토큰인지는 토큰의 iss / client_id로 확인
+    """
+    user_pool_id = os.environ.get('COGNITO_USER_POOL_ID', '')
+    client_id = os.environ.get('COGNITO_CLIENT_ID', '')
+    if not token or not user_pool_id:
+        return None
+    
+    region = user_pool_id.split('_', 1)[0]
+    try:
+        user = get_client('cognito-idp', region_name=region).get_user(AccessToken=token)
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except Exception as e:
+        logger.warning(f"⚠️  Cognito 토큰 검증 실패: {type(e).__name__}: {e}")
+        return None
+    
+    if claims.get('iss') != f"https://cognito-idp.{region}.amazonaws.com/{user_pool_id}":
+        logger.warning(f"⚠️  다른 User Pool의 토큰: iss={claims.get('iss')}")
+        return None
+    if client_id and claims.get('client_id') != client_id:
+        logger.warning(f"⚠️  다른 App Client의 토큰: client_id={claims.get('client_id')}")
+        return None
+    return next((attr['Value'] for attr in user.get('UserAttributes', []) if attr['Name'] == 'sub'), None)
+
+
+def handle_chat_websocket_authorizer(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AI 챗봇 WebSocket $connect Lambda authorizer (REQUEST, identity source: 쿼리 문자열 token)
+    
+    브라우저 WebSocket은 헤더를 보낼 수 없으므로 Cognito Access Token을 ?token=으로 받아 검증하고,
+    principalId(sub)는 이 연결의 모든 메시지 이벤트 requestContext.authorizer로 전달됨
+    """
+    token = (event.get('queryStringParameters') or {}).get('token')
+    user_id = verify_cognito_access_token(token)
+    logger.info(f"🔐 WebSocket 연결 인증: {'허용 ' + user_id if user_id else '거부'}")
+    return {
+        'principalId': user_id or 'anonymous',
+        'policyDocument': {
+            'Version': '2012-10-17',
+            'Statement': [{
+                'Action': 'execute-api:Invoke',
+                'Effect': 'Allow' if user_id else 'Deny',
+                'Resource': event['methodArn']
+            }]
+        }
+    }
+
+
+def handle_chat_websocket(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AI 챗봇 스트리밍 (API Gateway WebSocket API, route: chat)
+    
+    요청: {"action": "chat", "message": "..."} (사용자는 $connect authorizer가 검증한 principalId)
+    응답 프레임: {"type": "chunk", "text": ...} 를 Agent 청크 도착 즉시 전송한 뒤
+                 {"type": "done", "chat": 저장된 채팅 기록} 또는 {"type": "error", "error": ...}
+    done의 chat.response가 최종 응답 (Agent 오류로 더미 응답을 사용한 경우 스트리밍된 텍스트와 다를 수 있음)
+    """
+    request_context = event['requestContext']
+    if request_context['eventType'] != 'MESSAGE':
+        # $connect / $disconnect - 연결 상태는 저장하지 않음
+        return {'statusCode': 200}
+    
+    connection_id = request_context['connectionId']
+    client = get_websocket_client(f"https://{request_context['domainName']}/{request_context['stage']}")
+    connection = {'open': True}
+    
+    def send(frame: Dict[str, Any]):
+        # 클라이언트가 끊겨도 Agent 응답은 끝까지 받아 채팅 기록으로 저장
+        if not connection['open']:
+            return
+        try:
+            client.post_to_connection(
+                ConnectionId=connection_id,
+                Data=json.dumps(frame, ensure_ascii=False, default=str).encode('utf-8')
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  WebSocket 전송 실패, 이후 청크 전송 중단: {e}")
+            connection['open'] = False
+    
+    try:
+        body = json.loads(event.get('body') or '{}')
+    except json.JSONDecodeError:
+        send({'type': 'error', 'error': '잘못된 JSON 형식입니다'})
+        return {'statusCode': 400}
+    
+    # $connect authorizer가 검증한 사용자만 허용 (메시지 본문의 user_id는 신뢰하지 않음)
+    user_id = (request_context.get('authorizer') or {}).get('principalId')
+    if not user_id or user_id == 'anonymous':
+        send({'type': 'error', 'error': '인증이 필요합니다'})
+        return {'statusCode': 401}
+    
+    message = body.get('message')
+    if not message:
+        send({'type': 'error', 'error': 'message 필드가 필요합니다'})
+        return {'statusCode': 400}
+    
+    try:
+        chat_result = AIService().chat_with_ai(user_id, message, on_chunk=lambda text: send({'type': 'chunk', 'text': text}))
+        send({'type': 'done', 'chat': chat_result})
+        return {'statusCode': 200}
+    except Exception as e:
+        logger.error(f"WebSocket 채팅 오류: {e}")
+        send({'type': 'error', 'error': '서버 내부 오류가 발생했습니다'})
+        return {'statusCode': 500}
+
+
 def extract_user_id_from_event(event: Dict[str, Any]) -> str:
     """이벤트에서 사용자 ID 추출"""
     try:
@@ -980,11 +1424,25 @@ def extract_user_id_from_event(event: Dict[str, Any]) -> str:
         logger.error(f"사용자 ID 추출 오류: {e}")
         return None
 
+@pin_reads_after_write
 def lambda_handler(event, context):
     """Lambda 메인 핸들러"""
     try:
+        # WebSocket $connect authorizer (토큰이 담긴 이벤트는 로그에 남기지 않음)
+        if event.get('type') == 'REQUEST' and event.get('methodArn'):
+            return handle_chat_websocket_authorizer(event)
+        
         logger.info(f"이벤트 수신: {json.dumps(event)}")
         
+        # 비동기 자기 호출: 규칙 기반 계획의 팁 문구 보강
+        if event.get('source') == PLAN_ENRICHMENT_EVENT_SOURCE:
+            AIService().enrich_plan_tip(event['plan_type'], event['user_id'], event['plan_date'])
+            return {'statusCode': 200}
+        
+        # WebSocket API: AI 챗봇 스트리밍 ($connect / $disconnect / chat)
+        if event.get('requestContext', {}).get('eventType') in ('CONNECT', 'DISCONNECT', 'MESSAGE'):
+            return handle_chat_websocket(event)
+        
         # HTTP 메서드 및 경로 추출 (API Gateway v2 형식 지원)
         http_method = event.get('requestContext', {}).get('http', {}).get('method', event.get('httpMethod', ''))
         raw_path = event.get('rawPath', event.get('path', ''))
@@ -1015,7 +1473,7 @@ def lambda_handler(event, context):
             if not plan_date:
                 return create_response(400, {'error': 'plan_date 필드가 필요합니다'})
             
-            sleep_plan = ai_service.generate_sleep_plan(user_id, plan_date)
+            sleep_plan = ai_service.generate_sleep_plan(user_id, plan_date, context)
             return create_response(201, {'sleep_plan': sleep_plan})
         
         elif http_method == 'GET' and '/sleep-plans' in path:
@@ -1050,9 +1508,27 @@ def lambda_handler(event, context):
             if not plan_date:
                 return create_response(400, {'error': 'plan_date 필드가 필요합니다'})
             
-            caffeine_plan = ai_service.generate_caffeine_plan(user_id, plan_date)
+            caffeine_plan = ai_service.generate_caffeine_plan(user_id, plan_date, context)
             return create_response(201, {'caffeine_plan': caffeine_plan})
         
+        elif http_method == 'POST' and '/daily-plan' in path:
+            # POST /users/{user_id}/daily-plan - 수면 + 카페인 계획 동시 생성
+            user_id = extract_user_id_from_event(event)
+            if not user_id:
+                return create_response(400, {'error': '사용자 ID가 필요합니다'})
+            
+            try:
+                body = json.loads(event.get('body', '{}'))
+            except json.JSONDecodeError:
+                return create_response(400, {'error': '잘못된 JSON 형식입니다'})
+            
+            plan_date = body.get('plan_date')
+            if not plan_date:
+                return create_response(400, {'error': 'plan_date 필드가 필요합니다'})
+            
+            daily_plan = ai_service.generate_daily_plan(user_id, plan_date, context)
+            return create_response(201, daily_plan)
+        
         elif http_method == 'GET' and '/caffeine-plans' in path:
             # GET /users/{user_id}/caffeine-plans?date=YYYY-MM-DD - 카페인 계획 조회
             user_id = extract_user_id_from_event(event)
@@ -1095,10 +1571,13 @@ def lambda_handler(event, context):
                 return create_response(400, {'error': '사용자 ID가 필요합니다'})
             
             query_params = event.get('queryStringParameters') or {}
-            limit = int(query_params.get('limit', 20))
+            try:
+                limit = parse_limit(query_params.get('limit'), default=20, maximum=100)
+                chat_history, next_cursor = ai_service.get_chat_history(user_id, limit, query_params.get('cursor'))
+            except InvalidPaginationError as e:
+                return create_response(400, {'error': str(e)})
             
-            chat_history = ai_service.get_chat_history(user_id, limit)
-            return create_response(200, {'chat_history': chat_history})
+            return create_response(200, {'chat_history': chat_history, 'next_cursor': next_cursor})
         
         else:
             return create_response(404, {'error': '지원하지 않는 경로입니다'})
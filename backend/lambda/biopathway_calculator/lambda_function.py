@@ -1,61 +1,16 @@
 import json
 import os
-import pg8000
-from datetime import datetime
-
-# BIO_RULES: 근무 유형별 바이오리듬 규칙
-BIO_RULES = {
-    "D": {
-        "sleep": "23:00",
-        "coffee": "14:00",
-        "tip": "밤 11시 이전 취침하여 규칙적인 생체 리듬을 유지하세요."
-    },
-    "N": {
-        "sleep": "09:00",
-        "coffee": "03:00",
-        "tip": "퇴근길 햇빛 노출을 최소화하고 즉시 암막 커튼 아래서 수면하세요."
-    },
-    "E": {
-        "sleep": "02:00",
-        "coffee": "18:00",
-        "tip": "퇴근 후 가벼운 식사를 하고 미온수로 샤워하여 숙면을 유도하세요."
-    },
-    "O": {
-        "sleep": "23:00",
-        "coffee": "15:00",
-        "tip": "부족한 잠을 보충하되 오후 3시 이후의 긴 낮잠은 피하세요."
-    }
-}
+from datetime import datetime, timedelta
 
-# Shift type mapping: database format -> BIO_RULES key
-SHIFT_TYPE_MAPPING = {
-    'day': 'D',
-    'evening': 'E',
-    'night': 'N',
-    'off': 'O'
-}
+from utils.bio_rules import lookup_bio_rules
+from utils.database import DatabaseManager
 
+# 기간 조회 최대 일수 (start_date/end_date 또는 dates)
+MAX_RANGE_DAYS = 31
 
-def get_db_connection():
-    """
-    Create database connection using environment variables
-    
-    Returns:
-        pg8000 connection object
-    """
-    try:
-        conn = pg8000.connect(
-            host=os.environ['DB_HOST'],
-            port=int(os.environ.get('DB_PORT', '5432')),
-            database=os.environ['DB_NAME'],
-            user=os.environ['DB_USER'],
-            password=os.environ['DB_PASSWORD'],
-            ssl_context=True  # Enable SSL for RDS
-        )
-        return conn
-    except Exception as e:
-        print(f"❌ Database connection error: {str(e)}")
-        raise
+
+# 공통 DatabaseManager (pg8000 드라이버, 웜 컨테이너 간 커넥션 풀 재사용)
+db = DatabaseManager(driver=os.environ.get('DB_DRIVER', 'pg8000'))
 
 
 def get_user_schedule(user_id: str, target_date: str):
@@ -69,11 +24,7 @@ def get_user_schedule(user_id: str, target_date: str):
     Returns:
         Dictionary with shift_type or None if not found
     """
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         query = """
             SELECT shift_type, start_time, end_time
             FROM schedules
@@ -83,28 +34,93 @@ def get_user_schedule(user_id: str, target_date: str):
         """
         
         print(f"🔍 Querying schedule for user_id={user_id}, date={target_date}")
-        cursor.execute(query, (user_id, target_date))
-        result = cursor.fetchone()
+        results = db.execute_query(query, (user_id, target_date))
         
-        if not result:
+        if not results:
             print(f"⚠️  No schedule found for user {user_id} on {target_date}")
             return None
         
-        shift_type_db, start_time, end_time = result
-        print(f"✅ Found schedule: shift_type={shift_type_db}")
+        result = results[0]
+        print(f"✅ Found schedule: shift_type={result['shift_type']}")
         
         return {
-            'shift_type': shift_type_db,
-            'start_time': str(start_time) if start_time else None,
-            'end_time': str(end_time) if end_time else None
+            'shift_type': result['shift_type'],
+            'start_time': str(result['start_time']) if result['start_time'] else None,
+            'end_time': str(result['end_time']) if result['end_time'] else None
         }
         
     except Exception as e:
         print(f"❌ Error querying schedule: {str(e)}")
         raise
-    finally:
-        if conn:
-            conn.close()
+
+
+def get_user_schedules(user_id: str, dates: list):
+    """
+    Query RDS for user schedules on several dates in one round trip
+    
+    Args:
+        user_id: User identifier
+        dates: List of dates to query (datetime.date)
+        
+    Returns:
+        Dictionary of YYYY-MM-DD -> schedule (dates without a schedule are omitted)
+    """
+    try:
+        query = """
+            SELECT DISTINCT ON (work_date) work_date, shift_type, start_time, end_time
+            FROM schedules
+            WHERE user_id = %s AND work_date = ANY(%s)
+            ORDER BY work_date, created_at DESC
+        """
+        
+        print(f"🔍 Querying schedules for user_id={user_id}, {len(dates)} dates ({dates[0]} ~ {dates[-1]})")
+        results = db.execute_query(query, (user_id, dates))
+        print(f"✅ Found {len(results)} schedules")
+        
+        return {
+            str(result['work_date']): {
+                'shift_type': result['shift_type'],
+                'start_time': str(result['start_time']) if result['start_time'] else None,
+                'end_time': str(result['end_time']) if result['end_time'] else None
+            }
+            for result in results
+        }
+        
+    except Exception as e:
+        print(f"❌ Error querying schedules: {str(e)}")
+        raise
+
+
+def parse_target_dates(start_date: str = None, end_date: str = None, dates=None):
+    """
+    Build the sorted list of target dates for range mode
+    
+    Args:
+        start_date, end_date: Inclusive range (YYYY-MM-DD)
+        dates: List of YYYY-MM-DD strings, or a comma separated string from Bedrock Agent
+        
+    Returns:
+        Sorted list of unique datetime.date
+        
+    Raises:
+        ValueError: Invalid format or more than MAX_RANGE_DAYS dates
+    """
+    if dates:
+        if isinstance(dates, str):
+            dates = dates.strip().strip('[]').split(',')
+        target_dates = sorted({
+            datetime.strptime(str(value).strip().strip('"\''), '%Y-%m-%d').date() for value in dates
+        })
+    else:
+        start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        end = datetime.strptime(end_date or start_date, '%Y-%m-%d').date()
+        if end < start:
+            raise ValueError('end_date must not be before start_date')
+        target_dates = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    
+    if len(target_dates) > MAX_RANGE_DAYS:
+        raise ValueError(f'At most {MAX_RANGE_DAYS} dates can be requested at once')
+    return target_dates
 
 
 def apply_bio_rules(shift_type: str):
@@ -117,28 +133,90 @@ def apply_bio_rules(shift_type: str):
     Returns:
         Dictionary with sleep, coffee, and tip
     """
-    # Map database shift_type to BIO_RULES key
-    bio_key = SHIFT_TYPE_MAPPING.get(shift_type, shift_type)
-    
-    # Get rules, default to 'D' if not found
-    rules = BIO_RULES.get(bio_key, BIO_RULES['D'])
+    # Map database shift_type to BIO_RULES key (default to 'D' rules if not found)
+    result = lookup_bio_rules(shift_type)
     
-    print(f"📋 Applied BIO_RULES for shift_type={shift_type} (key={bio_key})")
+    print(f"📋 Applied BIO_RULES for shift_type={shift_type} (key={result['shift_type']})")
     
+    return result
+
+
+def format_response(event, status_code: int, data: dict):
+    """
+    Wrap response data in the Bedrock Agent or direct invocation format
+    """
+    if 'parameters' in event:
+        return {
+            'messageVersion': '1.0',
+            'response': {
+                'actionGroup': event.get('actionGroup', 'GetBioPathwayAction'),
+                'function': event.get('function', 'get_daily_biorhythm'),
+                'functionResponse': {
+                    'responseBody': {
+                        'TEXT': {
+                            'body': json.dumps(data, ensure_ascii=False)
+                        }
+                    }
+                }
+            }
+        }
     return {
-        'sleep': rules['sleep'],
-        'coffee': rules['coffee'],
-        'tip': rules['tip'],
-        'shift_type': bio_key
+        'statusCode': status_code,
+        'body': json.dumps(data, ensure_ascii=False)
     }
 
 
+def handle_range_request(event, user_id: str, start_date: str, end_date: str, dates):
+    """
+    Range mode: one schedule query for every requested date, then BIO_RULES per date
+    """
+    try:
+        target_dates = parse_target_dates(start_date, end_date, dates)
+    except ValueError as e:
+        return format_response(event, 400, {
+            'error': 'ValidationError',
+            'message': str(e)
+        })
+    
+    print(f"👤 Processing range request for user_id={user_id}, {len(target_dates)} dates")
+    
+    schedules = get_user_schedules(user_id, target_dates)
+    if not schedules:
+        return format_response(event, 404, {
+            'error': 'NoScheduleFound',
+            'message': f'No schedule found for user {user_id} between {target_dates[0]} and {target_dates[-1]}'
+        })
+    
+    days = []
+    missing_dates = []
+    for target_date in map(str, target_dates):
+        schedule = schedules.get(target_date)
+        if not schedule:
+            missing_dates.append(target_date)
+            continue
+        
+        bio_result = apply_bio_rules(schedule['shift_type'])
+        days.append({
+            'date': target_date,
+            'shift': bio_result['shift_type'],
+            'sleep': bio_result['sleep'],
+            'coffee': bio_result['coffee'],
+            'tip': bio_result['tip']
+        })
+    
+    response_data = {'days': days, 'missing_dates': missing_dates}
+    print(f"✅ Successfully generated biorhythm data for {len(days)} dates ({len(missing_dates)} without schedule)")
+    
+    return format_response(event, 200, response_data)
+
+
 def lambda_handler(event, context):
     """
     Main handler for biorhythm calculation
     
     Args:
         event: Contains user_id and target_date (or parameters array from Bedrock Agent)
+               Range mode: start_date/end_date or dates instead of target_date
         context: Lambda context
         
     Returns:
@@ -152,17 +230,27 @@ def lambda_handler(event, context):
             parameters = event.get('parameters', [])
             user_id = next((p['value'] for p in parameters if p['name'] == 'user_id'), None)
             target_date = next((p['value'] for p in parameters if p['name'] == 'target_date'), None)
+            start_date = next((p['value'] for p in parameters if p['name'] == 'start_date'), None)
+            end_date = next((p['value'] for p in parameters if p['name'] == 'end_date'), None)
+            dates = next((p['value'] for p in parameters if p['name'] == 'dates'), None)
         else:
             # Handle direct invocation format
             user_id = event.get('user_id')
             target_date = event.get('target_date')
+            start_date = event.get('start_date')
+            end_date = event.get('end_date')
+            dates = event.get('dates')
+        
+        # Range mode (start_date/end_date or dates)
+        if user_id and (start_date or dates):
+            return handle_range_request(event, user_id, start_date, end_date, dates)
         
         if not user_id or not target_date:
             return {
                 'statusCode': 400,
                 'body': json.dumps({
                     'error': 'ValidationError',
-                    'message': 'user_id and target_date are required'
+                    'message': 'user_id and target_date (or start_date/end_date, dates) are required'
                 }, ensure_ascii=False)
             }
         
@@ -194,28 +282,7 @@ def lambda_handler(event, context):
         
         print(f"✅ Successfully generated biorhythm data: {json.dumps(response_data, ensure_ascii=False)}")
         
-        # Return format for Bedrock Agent
-        if 'parameters' in event:
-            return {
-                'messageVersion': '1.0',
-                'response': {
-                    'actionGroup': event.get('actionGroup', 'GetBioPathwayAction'),
-                    'function': event.get('function', 'get_daily_biorhythm'),
-                    'functionResponse': {
-                        'responseBody': {
-                            'TEXT': {
-                                'body': json.dumps(response_data, ensure_ascii=False)
-                            }
-                        }
-                    }
-                }
-            }
-        else:
-            # Direct invocation format
-            return {
-                'statusCode': 200,
-                'body': json.dumps(response_data, ensure_ascii=False)
-            }
+        return format_response(event, 200, response_data)
         
     except Exception as e:
         print(f"❌ Error in lambda_handler: {str(e)}")
@@ -224,23 +291,4 @@ def lambda_handler(event, context):
             'message': str(e)
         }
         
-        if 'parameters' in event:
-            return {
-                'messageVersion': '1.0',
-                'response': {
-                    'actionGroup': event.get('actionGroup', 'GetBioPathwayAction'),
-                    'function': event.get('function', 'get_daily_biorhythm'),
-                    'functionResponse': {
-                        'responseBody': {
-                            'TEXT': {
-                                'body': json.dumps(error_response, ensure_ascii=False)
-                            }
-                        }
-                    }
-                }
-            }
-        else:
-            return {
-                'statusCode': 500,
-                'body': json.dumps(error_response, ensure_ascii=False)
-            }
+        return format_response(event, 500, error_response)
@@ -1,53 +1,87 @@
 import json
 import os
-import boto3
+import numpy as np
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, Optional, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 import logging
 
+from utils.aws_clients import get_client
+from utils.database import DatabaseManager, transactional
+from utils.json_stream import iter_json_object, upload_json_export
+from utils.pagination import InvalidPaginationError, decode_cursor, paginate, parse_limit
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-class DatabaseManager:
-    def __init__(self):
-        self.db_config = {
-            'host': os.environ['DB_HOST'],
-            'port': os.environ.get('DB_PORT', '5432'),
-            'database': os.environ.get('DB_NAME', 'rhythm_fairy'),
-            'user': os.environ.get('DB_USER', 'postgres'),
-            'password': os.environ['DB_PASSWORD']
-        }
-    
-    def get_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(**self.db_config)
-    
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+# 위험도 레벨별 안전 권고 문구
+SAFETY_RECOMMENDATIONS = {
+    'low': "현재 피로 수준이 낮습니다. 규칙적인 수면 패턴을 유지하세요.",
+    'medium': "중간 수준의 피로가 감지됩니다. 충분한 휴식과 수면을 취하고, 운전 시 주의하세요.",
+    'high': "높은 피로 위험도입니다. 가능하면 운전을 피하고, 즉시 휴식을 취하세요. 필요시 의료진과 상담하세요."
+}
+
+# 배치 평가 설정 (야간 일괄 계산)
+FATIGUE_BATCH_USER_CHUNK = int(os.environ.get('FATIGUE_BATCH_USER_CHUNK', '500'))
+FATIGUE_BATCH_TIME_MARGIN_MS = int(os.environ.get('FATIGUE_BATCH_TIME_MARGIN_MS', '15000'))
+FATIGUE_BATCH_EVENT_SOURCE = 'rhythm-fairy.fatigue-batch'
+
+# 시계열 파티션 유지 (EventBridge 월간 스케줄, setup_fatigue_schedule.py)
+PARTITION_MAINTENANCE_EVENT_SOURCE = 'rhythm-fairy.partition-maintenance'
+PARTITION_MONTHS_AHEAD = 3
+
+# 기간 계산(POST start_date/end_date) 최대 일수
+MAX_FATIGUE_RANGE_DAYS = 366
+
+FATIGUE_UPSERT_QUERY = """
+INSERT INTO fatigue_assessments (user_id, assessment_date, sleep_hours, 
+                               consecutive_night_shifts, commute_time, 
+                               risk_level, risk_score, safety_recommendations)
+VALUES %s
+ON CONFLICT (user_id, assessment_date) 
+DO UPDATE SET 
+    sleep_hours = EXCLUDED.sleep_hours,
+    consecutive_night_shifts = EXCLUDED.consecutive_night_shifts,
+    commute_time = EXCLUDED.commute_time,
+    risk_level = EXCLUDED.risk_level,
+    risk_score = EXCLUDED.risk_score,
+    safety_recommendations = EXCLUDED.safety_recommendations,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+FATIGUE_RETURNING_COLUMNS = """
+RETURNING id, user_id, assessment_date, sleep_hours, consecutive_night_shifts, 
+         commute_time, risk_level, risk_score, safety_recommendations, 
+         created_at, updated_at
+"""
+
+def score_fatigue_arrays(sleep_hours: np.ndarray, consecutive_night_shifts: np.ndarray,
+                         commute_time: np.ndarray, workdays: np.ndarray) -> Dict[str, np.ndarray]:
+    """피로 위험도 점수 규칙 (단건 calculate_fatigue_risk와 배치 / 기간 계산이 함께 사용하는 유일한 구현)"""
+    # 1. 수면 시간 점수 (40점 만점)
+    sleep_score = np.select(
+        [sleep_hours >= 8, sleep_hours >= 6, sleep_hours >= 4], [0, 10, 25], default=40)
+    # 2. 연속 야간 근무 점수 (30점 만점)
+    night_score = np.select(
+        [consecutive_night_shifts == 0, consecutive_night_shifts <= 2, consecutive_night_shifts <= 4], [0, 10, 20], default=30)
+    # 3. 통근 시간 점수 (20점 만점)
+    commute_score = np.select(
+        [commute_time <= 30, commute_time <= 60, commute_time <= 90], [0, 5, 10], default=20)
+    # 4. 근무 패턴 점수 (10점 만점, 최근 일주일 근무 일수)
+    pattern_score = np.select(
+        [workdays >= 5, workdays >= 3], [10, 5], default=0)
     
-    def execute_update(self, query: str, params: tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
+    risk_score = sleep_score + night_score + commute_score + pattern_score
+    risk_level = np.select([risk_score <= 30, risk_score <= 60], ['low', 'medium'], default='high')
     
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict]:
-        """INSERT 쿼리 실행 후 결과 반환"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                result = cursor.fetchone()
-                return dict(result) if result else None
+    return {
+        'sleep_score': sleep_score,
+        'night_shift_score': night_score,
+        'commute_score': commute_score,
+        'pattern_score': pattern_score,
+        'risk_score': risk_score,
+        'risk_level': risk_level
+    }
 
 class FatigueAssessmentService:
     def __init__(self):
@@ -69,17 +103,15 @@ class FatigueAssessmentService:
             user = users[0]
             commute_time = user['commute_time'] or 30
             
-            # 최근 7일간의 스케줄 조회
-            end_date = datetime.strptime(assessment_date, '%Y-%m-%d').date()
-            start_date = end_date - timedelta(days=6)
-            
-            schedule_query = """
-            SELECT work_date, shift_type, start_time, end_time
-            FROM schedules 
-            WHERE user_id = %s AND work_date BETWEEN %s AND %s
-            ORDER BY work_date DESC
+            # 최근 7일 근무 롤링 상태 조회 (schedules 트리거가 유지, 행이 없으면 근무 일정 없음)
+            state_query = """
+            SELECT consecutive_night_shifts, workdays_7d
+            FROM schedule_rolling_state 
+            WHERE user_id = %s AND state_date = %s
             """
-            schedules = self.db.execute_query(schedule_query, (user_id, start_date, end_date))
+            states = self.db.execute_query(state_query, (user_id, assessment_date))
+            consecutive_night_shifts = states[0]['consecutive_night_shifts'] if states else 0
+            workdays = states[0]['workdays_7d'] if states else 0
             
             # 수면 계획에서 수면 시간 조회
             sleep_query = """
@@ -99,73 +131,16 @@ class FatigueAssessmentService:
                 # 기본값: 일반적인 수면 시간
                 sleep_hours = 7.0
             
-            # 연속 야간 근무 일수 계산
-            consecutive_night_shifts = 0
-            for schedule in schedules:
-                if schedule['shift_type'] == 'night':
-                    consecutive_night_shifts += 1
-                else:
-                    break
-            
-            # 피로 위험도 점수 계산 (0-100)
-            risk_score = 0
-            
-            # 1. 수면 시간 점수 (40점 만점)
-            if sleep_hours >= 8:
-                sleep_score = 0  # 충분한 수면
-            elif sleep_hours >= 6:
-                sleep_score = 10  # 약간 부족
-            elif sleep_hours >= 4:
-                sleep_score = 25  # 부족
-            else:
-                sleep_score = 40  # 매우 부족
-            
-            risk_score += sleep_score
-            
-            # 2. 연속 야간 근무 점수 (30점 만점)
-            if consecutive_night_shifts == 0:
-                night_score = 0
-            elif consecutive_night_shifts <= 2:
-                night_score = 10
-            elif consecutive_night_shifts <= 4:
-                night_score = 20
-            else:
-                night_score = 30
-            
-            risk_score += night_score
-            
-            # 3. 통근 시간 점수 (20점 만점)
-            if commute_time <= 30:
-                commute_score = 0
-            elif commute_time <= 60:
-                commute_score = 5
-            elif commute_time <= 90:
-                commute_score = 10
-            else:
-                commute_score = 20
-            
-            risk_score += commute_score
-            
-            # 4. 근무 패턴 점수 (10점 만점)
-            if len(schedules) >= 5:  # 최근 일주일 중 5일 이상 근무
-                pattern_score = 10
-            elif len(schedules) >= 3:
-                pattern_score = 5
-            else:
-                pattern_score = 0
-            
-            risk_score += pattern_score
-            
-            # 위험도 레벨 결정
-            if risk_score <= 30:
-                risk_level = 'low'
-                safety_recommendations = "현재 피로 수준이 낮습니다. 규칙적인 수면 패턴을 유지하세요."
-            elif risk_score <= 60:
-                risk_level = 'medium'
-                safety_recommendations = "중간 수준의 피로가 감지됩니다. 충분한 휴식과 수면을 취하고, 운전 시 주의하세요."
-            else:
-                risk_level = 'high'
-                safety_recommendations = "높은 피로 위험도입니다. 가능하면 운전을 피하고, 즉시 휴식을 취하세요. 필요시 의료진과 상담하세요."
+            # 피로 위험도 점수 계산 (0-100) - 배치 계산과 같은 score_fatigue_arrays 규칙을 1건짜리 배열로 적용
+            scores = score_fatigue_arrays(np.array([sleep_hours]), np.array([consecutive_night_shifts]),
+                                          np.array([commute_time]), np.array([workdays]))
+            sleep_score = int(scores['sleep_score'][0])
+            night_score = int(scores['night_shift_score'][0])
+            commute_score = int(scores['commute_score'][0])
+            pattern_score = int(scores['pattern_score'][0])
+            risk_score = int(scores['risk_score'][0])
+            risk_level = str(scores['risk_level'][0])
+            safety_recommendations = SAFETY_RECOMMENDATIONS[risk_level]
             
             # 데이터베이스에 저장
             query = """
@@ -198,7 +173,7 @@ class FatigueAssessmentService:
                 'night_shift_score': night_score,
                 'commute_score': commute_score,
                 'pattern_score': pattern_score,
-                'total_schedules': len(schedules)
+                'total_schedules': workdays
             }
             
             return result
@@ -206,6 +181,110 @@ class FatigueAssessmentService:
             logger.error(f"피로 위험도 계산 오류: {e}")
             raise
     
+    def calculate_fatigue_risk_batch(self, start_date: date, end_date: date, user_ids: Optional[List[str]] = None,
+                                     after_user_id: Optional[str] = None, context=None) -> Dict[str, Any]:
+        """여러 사용자 x 여러 날짜의 피로 위험도를 일괄 계산하여 저장
+        
+        사용자를 FATIGUE_BATCH_USER_CHUNK명씩 나누어 청크마다 3개의 집합 쿼리로 데이터를 가져오고,
+        NumPy 배열 연산으로 점수를 계산한 뒤 한 번에 upsert하고 commit
+        (연속 야간 근무/근무 일수는 schedule_rolling_state에서 조회)
+        context가 주어지면 남은 실행 시간이 부족할 때 멈추고 이어서 처리할 next_user_id를 반환
+        """
+        try:
+            summary = {'users': 0, 'assessments': 0, 'next_user_id': None}
+            
+            while True:
+                if user_ids is not None:
+                    users = self.db.execute_query(
+                        "SELECT user_id, commute_time FROM users WHERE user_id = ANY(%s) AND user_id > %s ORDER BY user_id LIMIT %s",
+                        (list(user_ids), after_user_id or '', FATIGUE_BATCH_USER_CHUNK))
+                else:
+                    users = self.db.execute_query(
+                        "SELECT user_id, commute_time FROM users WHERE user_id > %s ORDER BY user_id LIMIT %s",
+                        (after_user_id or '', FATIGUE_BATCH_USER_CHUNK))
+                if not users:
+                    break
+                
+                rows = self._score_user_chunk(users, start_date, end_date)
+                self.db.execute_values(FATIGUE_UPSERT_QUERY, rows)
+                self.db.commit()
+                
+                summary['users'] += len(users)
+                summary['assessments'] += len(rows)
+                after_user_id = users[-1]['user_id']
+                logger.info(f"✅ 피로 위험도 배치 청크 완료: 사용자 {len(users)}명, 평가 {len(rows)}건 (~{after_user_id})")
+                
+                if len(users) < FATIGUE_BATCH_USER_CHUNK:
+                    break
+                if context is not None and context.get_remaining_time_in_millis() < FATIGUE_BATCH_TIME_MARGIN_MS:
+                    summary['next_user_id'] = after_user_id
+                    break
+            
+            return summary
+        except Exception as e:
+            logger.error(f"피로 위험도 배치 계산 오류: {e}")
+            raise
+    
+    def calculate_fatigue_risk_range(self, user_id: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """기간 피로 위험도 계산 (사용자/롤링 상태/수면 계획 조회 3번 + upsert 1번으로 기간 전체 저장)"""
+        try:
+            users = self.db.execute_query(
+                "SELECT user_id, commute_time FROM users WHERE user_id = %s", (user_id,))
+            if not users:
+                raise ValueError("사용자를 찾을 수 없습니다")
+            
+            rows = self._score_user_chunk(users, datetime.strptime(start_date, '%Y-%m-%d').date(),
+                                          datetime.strptime(end_date, '%Y-%m-%d').date())
+            assessments = self.db.execute_values(FATIGUE_UPSERT_QUERY + FATIGUE_RETURNING_COLUMNS, rows, fetch=True)
+            return sorted(assessments, key=lambda assessment: assessment['assessment_date'])
+        except Exception as e:
+            logger.error(f"기간 피로 위험도 계산 오류: {e}")
+            raise
+    
+    def _score_user_chunk(self, users: List[Dict[str, Any]], start_date: date, end_date: date) -> List[tuple]:
+        """사용자 청크의 (사용자 x 날짜) 격자를 만들어 배열 연산으로 점수 계산"""
+        user_index = {user['user_id']: i for i, user in enumerate(users)}
+        user_list = list(user_index)
+        days = (end_date - start_date).days + 1
+        
+        # 근무 롤링 상태 격자: 행이 없으면 최근 7일 근무 일정 없음
+        consecutive_night_shifts = np.zeros((len(users), days), dtype=int)
+        workdays = np.zeros((len(users), days), dtype=int)
+        states = self.db.execute_query("""
+            SELECT user_id, state_date, consecutive_night_shifts, workdays_7d
+            FROM schedule_rolling_state 
+            WHERE user_id = ANY(%s) AND state_date BETWEEN %s AND %s
+        """, (user_list, start_date, end_date))
+        for state in states:
+            i, j = user_index[state['user_id']], (state['state_date'] - start_date).days
+            consecutive_night_shifts[i, j] = state['consecutive_night_shifts']
+            workdays[i, j] = state['workdays_7d']
+        
+        # 수면 시간 격자: 수면 계획이 없으면 기본 7시간
+        sleep_hours = np.full((len(users), days), 7.0)
+        sleep_plans = self.db.execute_query("""
+            SELECT user_id, plan_date, main_sleep_duration, nap_duration
+            FROM sleep_plans 
+            WHERE user_id = ANY(%s) AND plan_date BETWEEN %s AND %s
+        """, (user_list, start_date, end_date))
+        for plan in sleep_plans:
+            total_sleep_minutes = (plan['main_sleep_duration'] or 0) + (plan['nap_duration'] or 0)
+            sleep_hours[user_index[plan['user_id']], (plan['plan_date'] - start_date).days] = total_sleep_minutes / 60.0
+        
+        commute_time = np.array([user['commute_time'] or 30 for user in users])[:, None].repeat(days, axis=1)
+        
+        scores = score_fatigue_arrays(sleep_hours, consecutive_night_shifts, commute_time, workdays)
+        
+        # DB 드라이버가 NumPy 타입을 받지 않으므로 tolist()로 Python 값으로 변환
+        dates = [start_date + timedelta(days=d) for d in range(days)]
+        columns = zip(sleep_hours.tolist(), consecutive_night_shifts.tolist(), commute_time.tolist(),
+                      scores['risk_level'].tolist(), scores['risk_score'].tolist())
+        return [
+            (user_id, assessment_date, sleep, nights, commute, level, score, SAFETY_RECOMMENDATIONS[level])
+            for user_id, row in zip(user_list, columns)
+            for assessment_date, sleep, nights, commute, level, score in zip(dates, *row)
+        ]
+    
     def get_fatigue_assessment(self, user_id: str, assessment_date: str) -> Optional[Dict[str, Any]]:
         """피로 위험도 평가 조회"""
         try:
@@ -222,8 +301,9 @@ class FatigueAssessmentService:
             logger.error(f"피로 위험도 조회 오류: {e}")
             raise
     
-    def get_fatigue_history(self, user_id: str, days: int = 30) -> List[Dict[str, Any]]:
-        """피로 위험도 기록 조회"""
+    def get_fatigue_history(self, user_id: str, days: int = 30, limit: int = 30,
+                            cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """피로 위험도 기록 조회 (assessment_date 키셋 페이지네이션, 최신순)"""
         try:
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days-1)
@@ -234,17 +314,42 @@ class FatigueAssessmentService:
                    created_at, updated_at
             FROM fatigue_assessments 
             WHERE user_id = %s AND assessment_date BETWEEN %s AND %s
-            ORDER BY assessment_date DESC
             """
-            return self.db.execute_query(query, (user_id, start_date, end_date))
+            params = [user_id, start_date, end_date]
+            
+            before = decode_cursor(cursor, 1)
+            if before:
+                query += " AND assessment_date < %s"
+                params.extend(before)
+            
+            query += " ORDER BY assessment_date DESC LIMIT %s"
+            params.append(limit + 1)
+            
+            rows = self.db.execute_query(query, tuple(params))
+            return paginate(rows, limit, ('assessment_date',))
         except Exception as e:
             logger.error(f"피로 위험도 기록 조회 오류: {e}")
             raise
     
+    def iter_fatigue_history(self, user_id: str, days: int = 365) -> Iterator[Dict[str, Any]]:
+        """내보내기용 피로 위험도 기록 조회 (서버 측 커서로 나누어 가져옴)"""
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=days-1)
+        
+        query = """
+        SELECT id, user_id, assessment_date, sleep_hours, consecutive_night_shifts, 
+               commute_time, risk_level, risk_score, safety_recommendations, 
+               created_at, updated_at
+        FROM fatigue_assessments 
+        WHERE user_id = %s AND assessment_date BETWEEN %s AND %s
+        ORDER BY assessment_date DESC
+        """
+        return self.db.stream_query(query, (user_id, start_date, end_date))
+    
     def get_risk_statistics(self, user_id: str) -> Dict[str, Any]:
         """피로 위험도 통계"""
         try:
-            # 최근 30일 통계
+            # 최근 30일 통계 (트리거가 유지하는 일간 집계 행에서 계산, 분석용 조회 - 읽기 전용 복제본)
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=29)
             
@@ -257,11 +362,11 @@ class FatigueAssessmentService:
                 COUNT(CASE WHEN risk_level = 'medium' THEN 1 END) as medium_risk_days,
                 COUNT(CASE WHEN risk_level = 'high' THEN 1 END) as high_risk_days,
                 MAX(consecutive_night_shifts) as max_consecutive_nights
-            FROM fatigue_assessments 
-            WHERE user_id = %s AND assessment_date BETWEEN %s AND %s
+            FROM user_daily_rollups 
+            WHERE user_id = %s AND rollup_date BETWEEN %s AND %s AND risk_score IS NOT NULL
             """
             
-            results = self.db.execute_query(stats_query, (user_id, start_date, end_date))
+            results = self.db.execute_query(stats_query, (user_id, start_date, end_date), replica=True)
             
             if results and results[0]['total_assessments'] > 0:
                 stats = results[0]
@@ -290,8 +395,8 @@ class FatigueAssessmentService:
             logger.error(f"피로 위험도 통계 조회 오류: {e}")
             raise
 
-def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
-    """API 응답 생성"""
+def create_response(status_code: int, body: Any) -> Dict[str, Any]:
+    """API 응답 생성 (body가 문자열이면 이미 인코딩된 JSON으로 보고 그대로 사용)"""
     return {
         'statusCode': status_code,
         'headers': {
@@ -300,7 +405,7 @@ def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
             'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
             'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
         },
-        'body': json.dumps(body, ensure_ascii=False, default=str)
+        'body': body if isinstance(body, str) else json.dumps(body, ensure_ascii=False, default=str)
     }
 
 def extract_user_id_from_event(event: Dict[str, Any]) -> str:
@@ -319,11 +424,56 @@ def extract_user_id_from_event(event: Dict[str, Any]) -> str:
         logger.error(f"사용자 ID 추출 오류: {e}")
         return None
 
+def run_fatigue_batch(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """야간 배치: 전체 사용자의 피로 위험도를 계산하고, 시간이 부족하면 남은 사용자를 비동기 자기 호출로 넘김"""
+    tomorrow = (datetime.now().date() + timedelta(days=1)).strftime('%Y-%m-%d')
+    start_date = datetime.strptime(event.get('start_date', tomorrow), '%Y-%m-%d').date()
+    end_date = datetime.strptime(event.get('end_date', event.get('start_date', tomorrow)), '%Y-%m-%d').date()
+    
+    summary = FatigueAssessmentService().calculate_fatigue_risk_batch(
+        start_date, end_date, event.get('user_ids'), event.get('after_user_id'), context)
+    logger.info(f"✅ 피로 위험도 배치 완료: {json.dumps(summary)}")
+    
+    if summary['next_user_id'] and context is not None:
+        get_client('lambda', 'async').invoke(
+            FunctionName=context.function_name,
+            InvocationType='Event',
+            Payload=json.dumps({
+                'source': FATIGUE_BATCH_EVENT_SOURCE,
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d'),
+                'user_ids': event.get('user_ids'),
+                'after_user_id': summary['next_user_id']
+            })
+        )
+        logger.info(f"🔄 남은 사용자 이어서 처리: {summary['next_user_id']} 이후")
+    
+    return create_response(200, {'batch': summary})
+
+def run_partition_maintenance(event: Dict[str, Any]) -> Dict[str, Any]:
+    """EventBridge 월간 스케줄 - 미래 월 파티션 생성 (실패하면 예외를 그대로 올려 Lambda 오류로 남김)"""
+    months_ahead = int(event.get('months_ahead', PARTITION_MONTHS_AHEAD))
+    result = DatabaseManager().execute_insert_returning(
+        "SELECT maintain_time_series_partitions(%s) AS created", (months_ahead,))
+    logger.info(f"✅ 파티션 유지 완료: 새 파티션 {result['created']}개 ({months_ahead}개월 앞까지)")
+    return create_response(200, {'created_partitions': result['created'], 'months_ahead': months_ahead})
+
+@transactional
 def lambda_handler(event, context):
     """Lambda 메인 핸들러"""
+    # EventBridge 월간 스케줄 - 시계열 테이블 미래 파티션 생성
+    # (500 응답으로 삼키지 않고 예외를 올려 Lambda Errors 지표 / 알람에 잡히도록 try 밖에서 처리)
+    if event.get('source') == PARTITION_MAINTENANCE_EVENT_SOURCE:
+        logger.info(f"이벤트 수신: {json.dumps(event)}")
+        return run_partition_maintenance(event)
+    
     try:
         logger.info(f"이벤트 수신: {json.dumps(event)}")
         
+        # EventBridge 야간 스케줄 (또는 이어서 처리하는 자기 호출) - 내일 피로 위험도 일괄 계산
+        if event.get('source') in ('aws.events', FATIGUE_BATCH_EVENT_SOURCE):
+            return run_fatigue_batch(event, context)
+        
         # HTTP 메서드 및 경로 추출 (API Gateway v2 형식 지원)
         http_method = event.get('requestContext', {}).get('http', {}).get('method', event.get('httpMethod', ''))
         raw_path = event.get('rawPath', event.get('path', ''))
@@ -350,6 +500,25 @@ def lambda_handler(event, context):
             except json.JSONDecodeError:
                 return create_response(400, {'error': '잘못된 JSON 형식입니다'})
             
+            # 기간 계산: {"start_date": "YYYY-MM-DD", "end_date": "YYYY-MM-DD"}
+            start_date = body.get('start_date')
+            end_date = body.get('end_date')
+            if start_date or end_date:
+                if not start_date or not end_date:
+                    return create_response(400, {'error': 'start_date와 end_date를 함께 지정해야 합니다'})
+                try:
+                    range_days = (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days
+                except ValueError:
+                    return create_response(400, {'error': '날짜 형식은 YYYY-MM-DD여야 합니다'})
+                if range_days < 0 or range_days >= MAX_FATIGUE_RANGE_DAYS:
+                    return create_response(400, {'error': f'계산 기간은 1~{MAX_FATIGUE_RANGE_DAYS}일이어야 합니다'})
+                
+                try:
+                    assessments = fatigue_service.calculate_fatigue_risk_range(user_id, start_date, end_date)
+                except ValueError as e:
+                    return create_response(404, {'error': str(e)})
+                return create_response(201, {'assessments': assessments})
+            
             assessment_date = body.get('assessment_date')
             if not assessment_date:
                 # 기본값: 오늘 날짜
@@ -358,6 +527,20 @@ def lambda_handler(event, context):
             assessment = fatigue_service.calculate_fatigue_risk(user_id, assessment_date)
             return create_response(201, {'assessment': assessment})
         
+        elif http_method == 'GET' and '/fatigue-assessment/export' in path:
+            # GET /users/{user_id}/fatigue-assessment/export?days=365 - 피로 위험도 기록 내보내기
+            # (서버 측 커서로 조회한 행을 S3로 스트리밍 업로드하고 presigned URL 반환)
+            user_id = extract_user_id_from_event(event)
+            if not user_id:
+                return create_response(400, {'error': '사용자 ID가 필요합니다'})
+            
+            query_params = event.get('queryStringParameters') or {}
+            days = int(query_params.get('days', 365))
+            
+            rows = fatigue_service.iter_fatigue_history(user_id, days)
+            export_key = f"temp/exports/{user_id}/fatigue_history_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+            return create_response(200, upload_json_export(iter_json_object('history', rows), export_key))
+        
         elif http_method == 'GET' and '/fatigue-assessment' in path and '/history' not in path and '/statistics' not in path:
             # GET /users/{user_id}/fatigue-assessment?date=YYYY-MM-DD - 피로 위험도 조회
             user_id = extract_user_id_from_event(event)
@@ -384,8 +567,13 @@ def lambda_handler(event, context):
             query_params = event.get('queryStringParameters') or {}
             days = int(query_params.get('days', 30))
             
-            history = fatigue_service.get_fatigue_history(user_id, days)
-            return create_response(200, {'history': history})
+            try:
+                limit = parse_limit(query_params.get('limit'), default=min(days, 366), maximum=366)
+                history, next_cursor = fatigue_service.get_fatigue_history(user_id, days, limit, query_params.get('cursor'))
+            except InvalidPaginationError as e:
+                return create_response(400, {'error': str(e)})
+            
+            return create_response(200, {'history': history, 'next_cursor': next_cursor})
         
         elif http_method == 'GET' and '/fatigue-assessment/statistics' in path:
             # GET /users/{user_id}/fatigue-assessment/statistics - 피로 위험도 통계
@@ -3,51 +3,58 @@ import os
 import boto3
 from datetime import datetime, date, timedelta
 from typing import Dict, Any, Optional, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import logging
 
+from utils.database import DatabaseManager, transactional
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-class DatabaseManager:
-    def __init__(self):
-        self.db_config = {
-            'host': os.environ['DB_HOST'],
-            'port': os.environ.get('DB_PORT', '5432'),
-            'database': os.environ.get('DB_NAME', 'rhythm_fairy'),
-            'user': os.environ.get('DB_USER', 'postgres'),
-            'password': os.environ['DB_PASSWORD']
-        }
-    
-    def get_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(**self.db_config)
-    
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
-    
-    def execute_update(self, query: str, params: tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
-    
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict]:
-        """INSERT 쿼리 실행 후 결과 반환"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                result = cursor.fetchone()
-                return dict(result) if result else None
+# 기본 점프스타트 블록 정의
+DEFAULT_JUMPSTART_BLOCKS = [
+    {
+        'block_type': 'now',
+        'block_name': 'Now',
+        'total_duration': 15,  # 15분
+        'tasks': [
+            {'task_name': '물 한 잔 마시기', 'duration_minutes': 2, 'task_order': 1},
+            {'task_name': '깊게 숨쉬기 (5회)', 'duration_minutes': 3, 'task_order': 2},
+            {'task_name': '간단한 스트레칭', 'duration_minutes': 5, 'task_order': 3},
+            {'task_name': '오늘의 목표 확인', 'duration_minutes': 5, 'task_order': 4}
+        ]
+    },
+    {
+        'block_type': 'must_do',
+        'block_name': 'Must-do',
+        'total_duration': 90,  # 90분
+        'tasks': [
+            {'task_name': '업무 우선순위 정리', 'duration_minutes': 15, 'task_order': 1},
+            {'task_name': '중요한 이메일 확인', 'duration_minutes': 20, 'task_order': 2},
+            {'task_name': '핵심 업무 처리', 'duration_minutes': 45, 'task_order': 3},
+            {'task_name': '진행상황 점검', 'duration_minutes': 10, 'task_order': 4}
+        ]
+    },
+    {
+        'block_type': 'recovery',
+        'block_name': 'Recovery',
+        'total_duration': 10,  # 10분
+        'tasks': [
+            {'task_name': '눈 마사지', 'duration_minutes': 3, 'task_order': 1},
+            {'task_name': '목과 어깨 스트레칭', 'duration_minutes': 4, 'task_order': 2},
+            {'task_name': '명상 또는 휴식', 'duration_minutes': 3, 'task_order': 3}
+        ]
+    }
+]
+
+# 기간 조회 최대 일수
+MAX_JUMPSTART_RANGE_DAYS = 31
+
+# 점프스타트 작업 조회 컬럼
+JUMPSTART_TASK_COLUMNS = (
+    'id', 'block_id', 'user_id', 'task_date', 'task_name',
+    'duration_minutes', 'completed', 'completed_at', 'task_order', 'created_at'
+)
 
 class JumpstartService:
     def __init__(self):
@@ -56,182 +63,187 @@ class JumpstartService:
     def create_daily_jumpstart(self, user_id: str, block_date: str) -> Dict[str, Any]:
         """일일 점프스타트 블록 생성"""
         try:
-            # 기본 점프스타트 블록 정의
-            default_blocks = [
-                {
-                    'block_type': 'now',
-                    'block_name': 'Now',
-                    'total_duration': 15,  # 15분
-                    'tasks': [
-                        {'task_name': '물 한 잔 마시기', 'duration_minutes': 2, 'task_order': 1},
-                        {'task_name': '깊게 숨쉬기 (5회)', 'duration_minutes': 3, 'task_order': 2},
-                        {'task_name': '간단한 스트레칭', 'duration_minutes': 5, 'task_order': 3},
-                        {'task_name': '오늘의 목표 확인', 'duration_minutes': 5, 'task_order': 4}
-                    ]
-                },
-                {
-                    'block_type': 'must_do',
-                    'block_name': 'Must-do',
-                    'total_duration': 90,  # 90분
-                    'tasks': [
-                        {'task_name': '업무 우선순위 정리', 'duration_minutes': 15, 'task_order': 1},
-                        {'task_name': '중요한 이메일 확인', 'duration_minutes': 20, 'task_order': 2},
-                        {'task_name': '핵심 업무 처리', 'duration_minutes': 45, 'task_order': 3},
-                        {'task_name': '진행상황 점검', 'duration_minutes': 10, 'task_order': 4}
-                    ]
-                },
+            return self.create_daily_jumpstarts([(user_id, block_date)])[0]
+        except Exception as e:
+            logger.error(f"점프스타트 생성 오류: {e}")
+            raise
+    
+    def create_daily_jumpstarts(self, targets: List[tuple]) -> List[Dict[str, Any]]:
+        """여러 (user_id, block_date)의 점프스타트 블록 일괄 생성
+        
+        블록 upsert, 기존 작업 삭제, 작업 생성을 각각 한 번의 쿼리로 처리
+        """
+        try:
+            # 같은 upsert에 중복 키가 들어가지 않도록 날짜 정규화 후 중복 제거
+            targets = list(dict.fromkeys(
+                (user_id, datetime.strptime(block_date, '%Y-%m-%d').date().isoformat())
+                for user_id, block_date in targets
+            ))
+            
+            # 1. 블록 일괄 upsert (작업을 미완료 상태로 다시 만들므로 completed_tasks도 0으로 초기화)
+            block_query = """
+            INSERT INTO jumpstart_blocks (user_id, block_date, block_type, block_name, 
+                                        total_duration, completed_tasks, total_tasks)
+            VALUES %s
+            ON CONFLICT (user_id, block_date, block_type) 
+            DO UPDATE SET 
+                block_name = EXCLUDED.block_name,
+                total_duration = EXCLUDED.total_duration,
+                total_tasks = EXCLUDED.total_tasks,
+                completed_tasks = EXCLUDED.completed_tasks,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id, user_id, block_date, block_type, block_name, 
+                     total_duration, completed_tasks, total_tasks, created_at, updated_at
+            """
+            block_rows = [
+                (user_id, block_date, block_data['block_type'], block_data['block_name'],
+                 block_data['total_duration'], 0, len(block_data['tasks']))
+                for user_id, block_date in targets
+                for block_data in DEFAULT_JUMPSTART_BLOCKS
+            ]
+            blocks = self.db.execute_values(block_query, block_rows, fetch=True)
+            
+            blocks_by_key = {}
+            for block in blocks:
+                block['tasks'] = []
+                blocks_by_key[(block['user_id'], str(block['block_date']), block['block_type'])] = block
+            
+            # 2. 기존 작업 일괄 삭제
+            delete_tasks_query = "DELETE FROM jumpstart_tasks WHERE block_id = ANY(%s)"
+            self.db.execute_update(delete_tasks_query, ([block['id'] for block in blocks],))
+            
+            # 3. 작업 일괄 생성
+            task_query = """
+            INSERT INTO jumpstart_tasks (block_id, user_id, task_date, task_name, 
+                                       duration_minutes, completed, task_order)
+            VALUES %s
+            RETURNING id, block_id, user_id, task_date, task_name, 
+                     duration_minutes, completed, completed_at, task_order, created_at
+            """
+            task_rows = []
+            for user_id, block_date in targets:
+                for block_data in DEFAULT_JUMPSTART_BLOCKS:
+                    block = blocks_by_key[(user_id, block_date, block_data['block_type'])]
+                    for task_data in block_data['tasks']:
+                        task_rows.append((
+                            block['id'], user_id, block_date, task_data['task_name'],
+                            task_data['duration_minutes'], False, task_data['task_order']
+                        ))
+            tasks = self.db.execute_values(task_query, task_rows, fetch=True)
+            
+            blocks_by_id = {block['id']: block for block in blocks}
+            for task in sorted(tasks, key=lambda t: t['task_order']):
+                blocks_by_id[task['block_id']]['tasks'].append(task)
+            
+            return [
                 {
-                    'block_type': 'recovery',
-                    'block_name': 'Recovery',
-                    'total_duration': 10,  # 10분
-                    'tasks': [
-                        {'task_name': '눈 마사지', 'duration_minutes': 3, 'task_order': 1},
-                        {'task_name': '목과 어깨 스트레칭', 'duration_minutes': 4, 'task_order': 2},
-                        {'task_name': '명상 또는 휴식', 'duration_minutes': 3, 'task_order': 3}
-                    ]
+                    'user_id': user_id,
+                    'block_date': block_date,
+                    'blocks': [blocks_by_key[(user_id, block_date, block_data['block_type'])]
+                               for block_data in DEFAULT_JUMPSTART_BLOCKS]
                 }
+                for user_id, block_date in targets
             ]
-            
-            created_blocks = []
-            
-            for block_data in default_blocks:
-                # 블록 생성
-                block_query = """
-                INSERT INTO jumpstart_blocks (user_id, block_date, block_type, block_name, 
-                                            total_duration, completed_tasks, total_tasks)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (user_id, block_date, block_type) 
-                DO UPDATE SET 
-                    block_name = EXCLUDED.block_name,
-                    total_duration = EXCLUDED.total_duration,
-                    total_tasks = EXCLUDED.total_tasks,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id, user_id, block_date, block_type, block_name, 
-                         total_duration, completed_tasks, total_tasks, created_at, updated_at
-                """
-                
-                block_params = (
-                    user_id, block_date, block_data['block_type'], block_data['block_name'],
-                    block_data['total_duration'], 0, len(block_data['tasks'])
-                )
-                
-                block = self.db.execute_insert_returning(block_query, block_params)
-                
-                # 기존 작업 삭제 후 새로 생성
-                delete_tasks_query = "DELETE FROM jumpstart_tasks WHERE block_id = %s"
-                self.db.execute_update(delete_tasks_query, (block['id'],))
-                
-                # 작업 생성
-                tasks = []
-                for task_data in block_data['tasks']:
-                    task_query = """
-                    INSERT INTO jumpstart_tasks (block_id, user_id, task_date, task_name, 
-                                               duration_minutes, completed, task_order)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id, block_id, user_id, task_date, task_name, 
-                             duration_minutes, completed, completed_at, task_order, created_at
-                    """
-                    
-                    task_params = (
-                        block['id'], user_id, block_date, task_data['task_name'],
-                        task_data['duration_minutes'], False, task_data['task_order']
-                    )
-                    
-                    task = self.db.execute_insert_returning(task_query, task_params)
-                    tasks.append(task)
-                
-                block['tasks'] = tasks
-                created_blocks.append(block)
-            
-            return {
-                'user_id': user_id,
-                'block_date': block_date,
-                'blocks': created_blocks
-            }
         except Exception as e:
-            logger.error(f"점프스타트 생성 오류: {e}")
+            logger.error(f"점프스타트 일괄 생성 오류: {e}")
             raise
     
     def get_daily_jumpstart(self, user_id: str, block_date: str) -> Dict[str, Any]:
         """일일 점프스타트 조회"""
         try:
-            # 블록 조회
-            blocks_query = """
-            SELECT id, user_id, block_date, block_type, block_name, 
-                   total_duration, completed_tasks, total_tasks, created_at, updated_at
-            FROM jumpstart_blocks 
-            WHERE user_id = %s AND block_date = %s
+            jumpstarts = self.get_jumpstart_range(user_id, block_date, block_date)
+            return jumpstarts[0] if jumpstarts else None
+        except Exception as e:
+            logger.error(f"점프스타트 조회 오류: {e}")
+            raise
+    
+    def get_jumpstart_range(self, user_id: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """기간 점프스타트 조회 (블록과 작업을 한 번의 쿼리로 조회 후 날짜/블록별로 묶음)"""
+        try:
+            task_columns = ', '.join(f"t.{column} AS t_{column}" for column in JUMPSTART_TASK_COLUMNS)
+            query = f"""
+            SELECT b.id, b.user_id, b.block_date, b.block_type, b.block_name, 
+                   b.total_duration, b.completed_tasks, b.total_tasks, b.created_at, b.updated_at,
+                   {task_columns}
+            FROM jumpstart_blocks b
+            LEFT JOIN jumpstart_tasks t ON t.block_id = b.id
+            WHERE b.user_id = %s AND b.block_date BETWEEN %s AND %s
             ORDER BY 
-                CASE block_type 
+                b.block_date,
+                CASE b.block_type 
                     WHEN 'now' THEN 1 
                     WHEN 'must_do' THEN 2 
                     WHEN 'recovery' THEN 3 
-                END
+                END,
+                t.task_order
             """
-            blocks = self.db.execute_query(blocks_query, (user_id, block_date))
+            rows = self.db.execute_query(query, (user_id, start_date, end_date))
             
-            if not blocks:
-                return None
+            days = {}
+            blocks = {}
+            for row in rows:
+                task = {column: row.pop(f"t_{column}") for column in JUMPSTART_TASK_COLUMNS}
+                
+                block = blocks.get(row['id'])
+                if block is None:
+                    block = blocks[row['id']] = dict(row, tasks=[])
+                    day_key = str(row['block_date'])
+                    if day_key not in days:
+                        days[day_key] = {'user_id': user_id, 'block_date': day_key, 'blocks': []}
+                    days[day_key]['blocks'].append(block)
+                
+                if task['id'] is not None:
+                    block['tasks'].append(task)
             
-            # 각 블록의 작업 조회
-            for block in blocks:
-                tasks_query = """
-                SELECT id, block_id, user_id, task_date, task_name, 
-                       duration_minutes, completed, completed_at, task_order, created_at
-                FROM jumpstart_tasks 
-                WHERE block_id = %s
-                ORDER BY task_order
-                """
-                tasks = self.db.execute_query(tasks_query, (block['id'],))
-                block['tasks'] = tasks
-            
-            return {
-                'user_id': user_id,
-                'block_date': block_date,
-                'blocks': blocks
-            }
+            return list(days.values())
         except Exception as e:
-            logger.error(f"점프스타트 조회 오류: {e}")
+            logger.error(f"기간 점프스타트 조회 오류: {e}")
             raise
     
     def update_task_completion(self, user_id: str, task_id: int, completed: bool) -> Dict[str, Any]:
-        """작업 완료 상태 업데이트"""
+        """작업 완료 상태 업데이트
+        
+        작업 갱신과 블록 completed_tasks 증감(+1/-1)을 한 문장에서 처리
+        (작업 행을 FOR UPDATE로 잠가 동시 토글 시에도 카운터 일관성 유지)
+        """
         try:
-            # 작업 업데이트
-            if completed:
-                task_query = """
-                UPDATE jumpstart_tasks 
-                SET completed = %s, completed_at = CURRENT_TIMESTAMP
+            completed_at = 'CURRENT_TIMESTAMP' if completed else 'NULL'
+            query = f"""
+            WITH previous AS (
+                SELECT id, completed
+                FROM jumpstart_tasks
                 WHERE id = %s AND user_id = %s
-                RETURNING id, block_id, user_id, task_date, task_name, 
-                         duration_minutes, completed, completed_at, task_order, created_at
-                """
-            else:
-                task_query = """
-                UPDATE jumpstart_tasks 
-                SET completed = %s, completed_at = NULL
-                WHERE id = %s AND user_id = %s
-                RETURNING id, block_id, user_id, task_date, task_name, 
-                         duration_minutes, completed, completed_at, task_order, created_at
-                """
+                FOR UPDATE
+            ), task AS (
+                UPDATE jumpstart_tasks t
+                SET completed = %s, completed_at = {completed_at}
+                FROM previous
+                WHERE t.id = previous.id
+                RETURNING t.id, t.block_id, t.user_id, t.task_date, t.task_name, 
+                         t.duration_minutes, t.completed, t.completed_at, t.task_order, t.created_at,
+                         COALESCE(previous.completed, false) AS was_completed
+            ), block AS (
+                UPDATE jumpstart_blocks b
+                SET completed_tasks = b.completed_tasks + CASE
+                        WHEN task.completed AND NOT task.was_completed THEN 1
+                        WHEN NOT task.completed AND task.was_completed THEN -1
+                        ELSE 0
+                    END
+                FROM task
+                WHERE b.id = task.block_id
+                RETURNING b.completed_tasks
+            )
+            SELECT task.id, task.block_id, task.user_id, task.task_date, task.task_name, 
+                   task.duration_minutes, task.completed, task.completed_at, task.task_order, task.created_at,
+                   (SELECT completed_tasks FROM block) AS block_completed_tasks
+            FROM task
+            """
             
-            task = self.db.execute_insert_returning(task_query, (completed, task_id, user_id))
+            task = self.db.execute_insert_returning(query, (task_id, user_id, completed))
             
             if not task:
                 raise ValueError("작업을 찾을 수 없습니다")
             
-            # 블록의 완료된 작업 수 업데이트
-            update_block_query = """
-            UPDATE jumpstart_blocks 
-            SET completed_tasks = (
-                SELECT COUNT(*) 
-                FROM jumpstart_tasks 
-                WHERE block_id = %s AND completed = true
-            )
-            WHERE id = %s
-            """
-            self.db.execute_update(update_block_query, (task['block_id'], task['block_id']))
-            
             return task
         except Exception as e:
             logger.error(f"작업 완료 상태 업데이트 오류: {e}")
@@ -298,63 +310,59 @@ class JumpstartService:
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days-1)
             
-            # 전체 통계
+            # 트리거가 유지하는 일간 집계 행(최대 days개)을 합산 (분석용 조회 - 읽기 전용 복제본)
             stats_query = """
             SELECT 
-                COUNT(DISTINCT jb.block_date) as active_days,
-                COUNT(jt.id) as total_tasks,
-                COUNT(CASE WHEN jt.completed = true THEN 1 END) as completed_tasks,
-                AVG(CASE WHEN jt.completed = true THEN jt.duration_minutes END) as avg_task_duration,
-                SUM(CASE WHEN jt.completed = true THEN jt.duration_minutes ELSE 0 END) as total_completed_minutes
-            FROM jumpstart_blocks jb
-            LEFT JOIN jumpstart_tasks jt ON jb.id = jt.block_id
-            WHERE jb.user_id = %s AND jb.block_date BETWEEN %s AND %s
+                COUNT(CASE WHEN jumpstart_blocks > 0 THEN 1 END) as active_days,
+                COALESCE(SUM(now_total_tasks), 0) as now_total_tasks,
+                COALESCE(SUM(now_completed_tasks), 0) as now_completed_tasks,
+                COALESCE(SUM(now_completed_minutes), 0) as now_completed_minutes,
+                COALESCE(SUM(must_do_total_tasks), 0) as must_do_total_tasks,
+                COALESCE(SUM(must_do_completed_tasks), 0) as must_do_completed_tasks,
+                COALESCE(SUM(must_do_completed_minutes), 0) as must_do_completed_minutes,
+                COALESCE(SUM(recovery_total_tasks), 0) as recovery_total_tasks,
+                COALESCE(SUM(recovery_completed_tasks), 0) as recovery_completed_tasks,
+                COALESCE(SUM(recovery_completed_minutes), 0) as recovery_completed_minutes
+            FROM user_daily_rollups
+            WHERE user_id = %s AND rollup_date BETWEEN %s AND %s
             """
             
-            stats = self.db.execute_query(stats_query, (user_id, start_date, end_date))
+            stats = self.db.execute_query(stats_query, (user_id, start_date, end_date), replica=True)[0]
             
-            # 블록별 통계
-            block_stats_query = """
-            SELECT 
-                jb.block_type,
-                jb.block_name,
-                COUNT(jt.id) as total_tasks,
-                COUNT(CASE WHEN jt.completed = true THEN 1 END) as completed_tasks,
-                SUM(CASE WHEN jt.completed = true THEN jt.duration_minutes ELSE 0 END) as completed_minutes
-            FROM jumpstart_blocks jb
-            LEFT JOIN jumpstart_tasks jt ON jb.id = jt.block_id
-            WHERE jb.user_id = %s AND jb.block_date BETWEEN %s AND %s
-            GROUP BY jb.block_type, jb.block_name
-            ORDER BY 
-                CASE jb.block_type 
-                    WHEN 'now' THEN 1 
-                    WHEN 'must_do' THEN 2 
-                    WHEN 'recovery' THEN 3 
-                END
-            """
-            
-            block_stats = self.db.execute_query(block_stats_query, (user_id, start_date, end_date))
+            # 블록 유형별 통계 (now -> must_do -> recovery 순서)
+            block_stats = [
+                {
+                    'block_type': block_data['block_type'],
+                    'block_name': block_data['block_name'],
+                    'total_tasks': stats[f"{block_data['block_type']}_total_tasks"],
+                    'completed_tasks': stats[f"{block_data['block_type']}_completed_tasks"],
+                    'completed_minutes': stats[f"{block_data['block_type']}_completed_minutes"]
+                }
+                for block_data in DEFAULT_JUMPSTART_BLOCKS
+            ]
+            total_tasks = sum(block['total_tasks'] for block in block_stats)
+            completed_tasks = sum(block['completed_tasks'] for block in block_stats)
+            completed_minutes = sum(block['completed_minutes'] for block in block_stats)
             
-            if stats and stats[0]['total_tasks']:
-                main_stats = stats[0]
-                completion_rate = (main_stats['completed_tasks'] / main_stats['total_tasks']) * 100 if main_stats['total_tasks'] > 0 else 0
+            if total_tasks:
+                completion_rate = (completed_tasks / total_tasks) * 100
                 
                 return {
                     'period_days': days,
-                    'active_days': main_stats['active_days'],
-                    'total_tasks': main_stats['total_tasks'],
-                    'completed_tasks': main_stats['completed_tasks'],
+                    'active_days': stats['active_days'],
+                    'total_tasks': total_tasks,
+                    'completed_tasks': completed_tasks,
                     'completion_rate': round(completion_rate, 1),
-                    'total_completed_minutes': main_stats['total_completed_minutes'] or 0,
-                    'average_task_duration': round(float(main_stats['avg_task_duration'] or 0), 1),
+                    'total_completed_minutes': completed_minutes,
+                    'average_task_duration': round(completed_minutes / completed_tasks, 1) if completed_tasks else 0,
                     'block_statistics': [
                         {
                             'block_type': block['block_type'],
                             'block_name': block['block_name'],
                             'total_tasks': block['total_tasks'],
                             'completed_tasks': block['completed_tasks'],
-                            'completion_rate': round((block['completed_tasks'] / block['total_tasks']) * 100, 1) if block['total_tasks'] > 0 else 0,
-                            'completed_minutes': block['completed_minutes'] or 0
+                            'completion_rate': round((block['completed_tasks'] / block['total_tasks']) * 100, 1) if block['total_tasks'] else 0,
+                            'completed_minutes': block['completed_minutes']
                         }
                         for block in block_stats
                     ]
@@ -403,6 +411,7 @@ def extract_user_id_from_event(event: Dict[str, Any]) -> str:
         logger.error(f"사용자 ID 추출 오류: {e}")
         return None
 
+@transactional
 def lambda_handler(event, context):
     """Lambda 메인 핸들러"""
     try:
@@ -448,6 +457,24 @@ def lambda_handler(event, context):
                 return create_response(400, {'error': '사용자 ID가 필요합니다'})
             
             query_params = event.get('queryStringParameters') or {}
+            
+            # GET /users/{user_id}/jumpstart?start=YYYY-MM-DD&end=YYYY-MM-DD - 기간 점프스타트 조회
+            start_date = query_params.get('start')
+            end_date = query_params.get('end')
+            if start_date or end_date:
+                if not start_date or not end_date:
+                    return create_response(400, {'error': 'start와 end를 함께 지정해야 합니다'})
+                try:
+                    range_days = (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days
+                except ValueError:
+                    return create_response(400, {'error': '날짜 형식은 YYYY-MM-DD여야 합니다'})
+                # start와 end를 모두 포함하므로 조회 일수는 range_days + 1
+                if range_days < 0 or range_days + 1 > MAX_JUMPSTART_RANGE_DAYS:
+                    return create_response(400, {'error': f'조회 기간은 최대 {MAX_JUMPSTART_RANGE_DAYS}일이어야 합니다'})
+                
+                jumpstarts = jumpstart_service.get_jumpstart_range(user_id, start_date, end_date)
+                return create_response(200, {'jumpstarts': jumpstarts})
+            
             block_date = query_params.get('date')
             if not block_date:
                 block_date = datetime.now().date().strftime('%Y-%m-%d')
@@ -50,7 +50,7 @@ def lambda_handler(event, context):
             logger.info(f"✅ S3 파일 존재 확인: 크기 {head_response['ContentLength']} bytes")
         except Exception as head_error:
             logger.error(f"❌ S3 파일 존재 확인 실패: {head_error}")
-            raise Exception(f"S3에서 파일을 찾을 수 없습니다: {s3_key}")
+            raise ValueError(f"S3에서 파일을 찾을 수 없습니다: {s3_key}")
         
         # S3에서 이미지 다운로드
         logger.info(f"📥 S3에서 이미지 다운로드 중: s3://{bucket}/{s3_key}")
@@ -155,9 +155,10 @@ def lambda_handler(event, context):
         logger.error(traceback.format_exc())
         
         if is_direct_invoke:
-            # 직접 호출 - 에러 응답
+            # 직접 호출 - 에러 응답 (입력 / 인식 결과 문제는 400, 그 외 서비스 오류는 500)
+            # ValueError: s3_key 누락, S3 파일 없음, 모델 응답을 일정 JSON으로 해석하지 못함
             return {
-                'statusCode': 500,
+                'statusCode': 400 if isinstance(e, ValueError) else 500,
                 'body': json.dumps({
                     'error': str(e),
                     'schedules': []
@@ -2,13 +2,17 @@ import json
 import os
 import boto3
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 import logging
 from io import BytesIO
 import uuid
 
+from utils.aws_clients import get_client
+from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from utils.database import DatabaseManager, transactional
+from utils.json_stream import iter_json_object, upload_json_export
+from utils.pagination import InvalidPaginationError, decode_cursor, paginate, parse_limit
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -21,6 +25,9 @@ WORK_TYPE_SHIFT_MAPPING = {
     'irregular': ['day', 'evening', 'night', 'off']
 }
 
+# OCR(Vision) Lambda 서킷 브레이커: 연속 실패 시 OCR을 호출하지 않고 빈 결과로 응답 (사용자가 직접 입력)
+ocr_breaker = get_circuit_breaker('ocr-vision', db_factory=DatabaseManager)
+
 def get_allowed_shift_types(work_type: str) -> List[str]:
     """근무 유형에 따라 허용되는 교대 타입 반환"""
     return WORK_TYPE_SHIFT_MAPPING.get(work_type, ['day', 'evening', 'night', 'off'])
@@ -30,44 +37,6 @@ def validate_shift_type(work_type: str, shift_type: str) -> bool:
     allowed_types = get_allowed_shift_types(work_type)
     return shift_type in allowed_types
 
-class DatabaseManager:
-    def __init__(self):
-        self.db_config = {
-            'host': os.environ['DB_HOST'],
-            'port': os.environ.get('DB_PORT', '5432'),
-            'database': os.environ.get('DB_NAME', 'rhythm_fairy'),
-            'user': os.environ.get('DB_USER', 'postgres'),
-            'password': os.environ['DB_PASSWORD']
-        }
-    
-    def get_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(**self.db_config)
-    
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
-    
-    def execute_update(self, query: str, params: tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
-    
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict]:
-        """INSERT 쿼리 실행 후 결과 반환"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                result = cursor.fetchone()
-                return dict(result) if result else None
-
 class S3Manager:
     def __init__(self):
         self.s3_client = boto3.client('s3')
@@ -122,8 +91,9 @@ class ScheduleService:
         self.db = DatabaseManager()
         self.s3 = S3Manager()
     
-    def get_user_schedules(self, user_id: str, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
-        """사용자 스케줄 조회"""
+    def get_user_schedules(self, user_id: str, start_date: str = None, end_date: str = None,
+                           limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """사용자 스케줄 조회 (work_date 키셋 페이지네이션)"""
         try:
             base_query = """
             SELECT id, user_id, work_date, shift_type, start_time, end_time, created_at, updated_at
@@ -142,13 +112,32 @@ class ScheduleService:
                 base_query += " AND work_date <= %s"
                 params.append(end_date)
             
-            base_query += " ORDER BY work_date ASC"
+            after = decode_cursor(cursor, 1)
+            if after:
+                base_query += " AND work_date > %s"
+                params.extend(after)
             
-            return self.db.execute_query(base_query, tuple(params))
+            base_query += " ORDER BY work_date ASC LIMIT %s"
+            params.append(limit + 1)
+            
+            rows = self.db.execute_query(base_query, tuple(params))
+            return paginate(rows, limit, ('work_date',))
         except Exception as e:
             logger.error(f"스케줄 조회 오류: {e}")
             raise
     
+    def iter_user_schedules(self, user_id: str, start_date: str = None, end_date: str = None) -> Iterator[Dict[str, Any]]:
+        """내보내기용 전체 스케줄 조회 (서버 측 커서로 나누어 가져옴)"""
+        query = """
+        SELECT id, user_id, work_date, shift_type, start_time, end_time, created_at, updated_at
+        FROM schedules 
+        WHERE user_id = %s
+          AND work_date >= COALESCE(%s::date, '-infinity'::date)
+          AND work_date <= COALESCE(%s::date, 'infinity'::date)
+        ORDER BY work_date ASC
+        """
+        return self.db.stream_query(query, (user_id, start_date, end_date))
+    
     def create_schedule(self, user_id: str, schedule_data: Dict[str, Any]) -> Dict[str, Any]:
         """스케줄 생성 (UPSERT: 중복 시 업데이트)"""
         try:
@@ -291,20 +280,28 @@ class ScheduleService:
             
             result = self.db.execute_insert_returning(query, params)
             
+            # OCR 호출이 수 초 걸리므로 메타데이터는 먼저 commit (트랜잭션을 열어둔 채 대기하지 않음)
+            self.db.commit()
+            
             # OCR Lambda 직접 호출
+            ocr_recorded = False
             try:
                 logger.info(f"🔍 OCR Lambda 직접 호출 시작")
                 logger.info(f"   - S3 키: {s3_key}")
                 logger.info(f"   - 사용자 그룹: {user_group}")
                 logger.info(f"   - 파일 크기: {len(file_content)} bytes")
                 
+                # 서킷 open이면 대기/호출 없이 바로 빈 결과
+                if not ocr_breaker.allow_request():
+                    raise CircuitOpenError("근무표 인식 서비스가 일시적으로 중단되었습니다. 잠시 후 다시 시도하거나 직접 입력해주세요.")
+                
                 # S3 eventual consistency를 위한 대기
                 import time
                 logger.info("⏳ S3 eventual consistency를 위해 1초 대기...")
                 time.sleep(1)
                 
-                # Lambda 클라이언트
-                lambda_client = boto3.client('lambda', region_name='us-east-1')
+                # Lambda 클라이언트 (웜 컨테이너에서 재사용)
+                lambda_client = get_client('lambda', region_name='us-east-1')
                 
                 # OCR Lambda 함수명 (환경 변수에서 가져오기)
                 ocr_lambda_name = os.environ.get('OCR_LAMBDA_NAME', 'ShiftSync-Vision-OCR')
@@ -330,8 +327,17 @@ class ScheduleService:
                 response_payload = json.loads(response['Payload'].read())
                 logger.info(f"✅ OCR Lambda 응답: {json.dumps(response_payload, ensure_ascii=False)}")
                 
+                # 서킷 기록: 함수 오류(FunctionError)와 5xx만 장애로 보고,
+                # 4xx(파일 없음, 근무표 인식 실패 등)는 서비스가 정상 응답한 것으로 간주
+                status_code = response_payload.get('statusCode') if isinstance(response_payload, dict) else None
+                if response.get('FunctionError') or not isinstance(status_code, int) or status_code >= 500:
+                    ocr_breaker.record_failure()
+                else:
+                    ocr_breaker.record_success()
+                ocr_recorded = True
+                
                 # 응답 처리
-                if response_payload.get('statusCode') == 200:
+                if status_code == 200:
                     body = json.loads(response_payload['body'])
                     schedules = body.get('schedules', [])
                     
@@ -381,7 +387,16 @@ class ScheduleService:
                         'error': error_msg
                     }
                 
+            except CircuitOpenError as e:
+                logger.warning(f"⚡ OCR 서킷 open - 호출 생략: {ocr_breaker.snapshot()}")
+                ocr_result = {
+                    'schedules': [],
+                    'error': str(e)
+                }
             except Exception as e:
+                # 호출 자체의 오류(타임아웃, 연결 실패 등)만 장애로 기록 - 응답을 받은 뒤의 파싱 오류는 제외
+                if not ocr_recorded:
+                    ocr_breaker.record_failure()
                 logger.error(f"❌ OCR Lambda 호출 오류: {e}")
                 import traceback
                 logger.error(traceback.format_exc())
@@ -400,35 +415,10 @@ class ScheduleService:
             """
             self.db.execute_update(update_query, (json.dumps(ocr_result), 'processed', result['id']))
             
-            # OCR 결과를 schedules 테이블에 자동 저장
+            # OCR 결과를 schedules 테이블에 자동 저장 (단일 UPSERT, 요청 트랜잭션에 포함)
             if ocr_result.get('schedules'):
                 logger.info(f"📝 OCR 결과를 schedules 테이블에 자동 저장 시작: {len(ocr_result['schedules'])}개")
-                saved_count = 0
-                for schedule in converted_schedules:
-                    try:
-                        # UPSERT: 중복 시 업데이트
-                        upsert_query = """
-                        INSERT INTO schedules (user_id, work_date, shift_type, start_time, end_time)
-                        VALUES (%s, %s, %s, %s, %s)
-                        ON CONFLICT (user_id, work_date) 
-                        DO UPDATE SET 
-                            shift_type = EXCLUDED.shift_type,
-                            start_time = EXCLUDED.start_time,
-                            end_time = EXCLUDED.end_time,
-                            updated_at = CURRENT_TIMESTAMP
-                        """
-                        self.db.execute_update(upsert_query, (
-                            user_id,
-                            schedule['date'],
-                            schedule['shift_type'],
-                            schedule['start_time'],
-                            schedule['end_time']
-                        ))
-                        saved_count += 1
-                    except Exception as save_error:
-                        logger.error(f"❌ 스케줄 저장 실패 ({schedule['date']}): {save_error}")
-                
-                logger.info(f"✅ schedules 테이블에 {saved_count}개 스케줄 저장 완료")
+                result['saved_schedules'] = self.save_ocr_schedules(user_id, ocr_result['schedules'])
             
             result['ocr_result'] = ocr_result
             result['upload_status'] = 'processed'
@@ -440,23 +430,106 @@ class ScheduleService:
             logger.error(traceback.format_exc())
             raise
     
-    def get_schedule_images(self, user_id: str) -> List[Dict[str, Any]]:
-        """사용자의 업로드된 스케줄 이미지 목록 조회"""
+    def save_ocr_schedules(self, user_id: str, schedules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """OCR로 인식한 스케줄을 메모리에서 검증 후 한 번의 UPSERT로 저장
+        
+        Returns:
+            inserted/updated/rejected 건수와 거부된 행 목록
+        """
+        try:
+            user_result = self.db.execute_query("SELECT work_type FROM users WHERE user_id = %s", (user_id,))
+            if not user_result:
+                raise ValueError("사용자를 찾을 수 없습니다")
+            work_type = user_result[0]['work_type']
+            
+            # 1. 행 단위 검증 (같은 날짜가 여러 번 나오면 마지막 값 사용)
+            valid_rows = {}
+            rejected = []
+            for schedule in schedules:
+                work_date = schedule.get('date')
+                shift_type = schedule.get('shift_type')
+                try:
+                    work_date = datetime.strptime(work_date, '%Y-%m-%d').date()
+                except (TypeError, ValueError):
+                    rejected.append({'date': schedule.get('date'), 'shift_type': shift_type, 'reason': '잘못된 날짜 형식'})
+                    continue
+                
+                if not validate_shift_type(work_type, shift_type):
+                    rejected.append({
+                        'date': str(work_date),
+                        'shift_type': shift_type,
+                        'reason': f"{work_type} 근무 유형에서 허용되지 않는 교대"
+                    })
+                    continue
+                
+                if work_date in valid_rows:
+                    rejected.append({
+                        'date': str(work_date),
+                        'shift_type': valid_rows[work_date][2],
+                        'reason': '중복 날짜 (마지막 값으로 대체)'
+                    })
+                valid_rows[work_date] = (
+                    user_id, work_date, shift_type, schedule.get('start_time'), schedule.get('end_time')
+                )
+            
+            # 2. 단일 UPSERT (xmax = 0 이면 새로 삽입된 행)
+            upsert_query = """
+            INSERT INTO schedules (user_id, work_date, shift_type, start_time, end_time)
+            VALUES %s
+            ON CONFLICT (user_id, work_date) 
+            DO UPDATE SET 
+                shift_type = EXCLUDED.shift_type,
+                start_time = EXCLUDED.start_time,
+                end_time = EXCLUDED.end_time,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING (xmax = 0) AS inserted
+            """
+            saved = self.db.execute_values(upsert_query, list(valid_rows.values()), fetch=True)
+            inserted = sum(1 for row in saved if row['inserted'])
+            
+            summary = {
+                'inserted': inserted,
+                'updated': len(saved) - inserted,
+                'rejected': len(rejected),
+                'rejected_rows': rejected
+            }
+            
+            if rejected:
+                logger.warning(f"⚠️  OCR 스케줄 {len(rejected)}건 거부: {rejected}")
+            logger.info(f"✅ schedules 테이블 저장 완료: 신규 {summary['inserted']}건, 수정 {summary['updated']}건")
+            
+            return summary
+        except Exception as e:
+            logger.error(f"OCR 스케줄 저장 오류: {e}")
+            raise
+    
+    def get_schedule_images(self, user_id: str, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """사용자의 업로드된 스케줄 이미지 목록 조회 ((created_at, id) 키셋 페이지네이션, 최신순)"""
         try:
             query = """
             SELECT id, user_id, original_filename, s3_key, file_size, 
                    upload_status, ocr_result, processed_at, created_at
             FROM schedule_images 
             WHERE user_id = %s
-            ORDER BY created_at DESC
             """
-            return self.db.execute_query(query, (user_id,))
+            params = [user_id]
+            
+            after = decode_cursor(cursor, 2)
+            if after:
+                query += " AND (created_at, id) < (%s, %s)"
+                params.extend(after)
+            
+            query += " ORDER BY created_at DESC, id DESC LIMIT %s"
+            params.append(limit + 1)
+            
+            rows = self.db.execute_query(query, tuple(params))
+            return paginate(rows, limit, ('created_at', 'id'))
         except Exception as e:
             logger.error(f"스케줄 이미지 조회 오류: {e}")
             raise
 
-def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
-    """API 응답 생성"""
+def create_response(status_code: int, body: Any) -> Dict[str, Any]:
+    """API 응답 생성 (body가 문자열이면 이미 인코딩된 JSON으로 보고 그대로 사용)"""
     return {
         'statusCode': status_code,
         'headers': {
@@ -465,7 +538,7 @@ def create_response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
             'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
             'Access-Control-Allow-Methods': 'GET,POST,PUT,DELETE,OPTIONS'
         },
-        'body': json.dumps(body, ensure_ascii=False, default=str)
+        'body': body if isinstance(body, str) else json.dumps(body, ensure_ascii=False, default=str)
     }
 
 def extract_user_id_from_event(event: Dict[str, Any]) -> str:
@@ -484,6 +557,7 @@ def extract_user_id_from_event(event: Dict[str, Any]) -> str:
         logger.error(f"사용자 ID 추출 오류: {e}")
         return None
 
+@transactional
 def lambda_handler(event, context):
     """Lambda 메인 핸들러"""
     try:
@@ -504,7 +578,21 @@ def lambda_handler(event, context):
         schedule_service = ScheduleService()
         
         # 라우팅
-        if http_method == 'GET' and '/schedules' in path:
+        if http_method == 'GET' and '/schedules/export' in path:
+            # GET /users/{user_id}/schedules/export?start_date=&end_date= - 전체 스케줄 내보내기
+            # (서버 측 커서로 조회한 행을 S3로 스트리밍 업로드하고 presigned URL 반환)
+            user_id = extract_user_id_from_event(event)
+            if not user_id:
+                return create_response(400, {'error': '사용자 ID가 필요합니다'})
+            
+            query_params = event.get('queryStringParameters') or {}
+            rows = schedule_service.iter_user_schedules(
+                user_id, query_params.get('start_date'), query_params.get('end_date')
+            )
+            export_key = f"temp/exports/{user_id}/schedules_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+            return create_response(200, upload_json_export(iter_json_object('schedules', rows), export_key))
+        
+        elif http_method == 'GET' and '/schedules' in path:
             # GET /users/{user_id}/schedules - 사용자 스케줄 조회
             user_id = extract_user_id_from_event(event)
             if not user_id:
@@ -515,8 +603,15 @@ def lambda_handler(event, context):
             start_date = query_params.get('start_date')
             end_date = query_params.get('end_date')
             
-            schedules = schedule_service.get_user_schedules(user_id, start_date, end_date)
-            return create_response(200, {'schedules': schedules})
+            try:
+                limit = parse_limit(query_params.get('limit'), default=100, maximum=366)
+                schedules, next_cursor = schedule_service.get_user_schedules(
+                    user_id, start_date, end_date, limit, query_params.get('cursor')
+                )
+            except InvalidPaginationError as e:
+                return create_response(400, {'error': str(e)})
+            
+            return create_response(200, {'schedules': schedules, 'next_cursor': next_cursor})
         
         elif http_method == 'POST' and '/schedules' in path:
             # POST /users/{user_id}/schedules - 스케줄 생성
@@ -657,8 +752,14 @@ def lambda_handler(event, context):
             if not user_id:
                 return create_response(400, {'error': '사용자 ID가 필요합니다'})
             
-            images = schedule_service.get_schedule_images(user_id)
-            return create_response(200, {'images': images})
+            query_params = event.get('queryStringParameters') or {}
+            try:
+                limit = parse_limit(query_params.get('limit'), default=20, maximum=100)
+                images, next_cursor = schedule_service.get_schedule_images(user_id, limit, query_params.get('cursor'))
+            except InvalidPaginationError as e:
+                return create_response(400, {'error': str(e)})
+            
+            return create_response(200, {'images': images, 'next_cursor': next_cursor})
         
         else:
             return create_response(404, {'error': '지원하지 않는 경로입니다'})
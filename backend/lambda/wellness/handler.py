@@ -3,52 +3,14 @@ import os
 import boto3
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import logging
 
+from utils.database import DatabaseManager, transactional
+
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-class DatabaseManager:
-    def __init__(self):
-        self.db_config = {
-            'host': os.environ['DB_HOST'],
-            'port': os.environ.get('DB_PORT', '5432'),
-            'database': os.environ.get('DB_NAME', 'rhythm_fairy'),
-            'user': os.environ.get('DB_USER', 'postgres'),
-            'password': os.environ['DB_PASSWORD']
-        }
-    
-    def get_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(**self.db_config)
-    
-    def execute_query(self, query: str, params: tuple = None) -> list:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
-    
-    def execute_update(self, query: str, params: tuple = None) -> int:
-        """INSERT/UPDATE/DELETE 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
-    
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict]:
-        """INSERT 쿼리 실행 후 결과 반환"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                result = cursor.fetchone()
-                return dict(result) if result else None
-
 class S3Manager:
     def __init__(self):
         self.s3_client = boto3.client('s3')
@@ -73,7 +35,7 @@ class WellnessService:
         self.s3 = S3Manager()
     
     def get_audio_files(self, file_type: str = None) -> List[Dict[str, Any]]:
-        """오디오 파일 목록 조회"""
+        """오디오 파일 목록 조회 (공용 카탈로그 - 읽기 전용 복제본)"""
         try:
             if file_type:
                 query = """
@@ -83,7 +45,7 @@ class WellnessService:
                 WHERE file_type = %s
                 ORDER BY title
                 """
-                audio_files = self.db.execute_query(query, (file_type,))
+                audio_files = self.db.execute_query(query, (file_type,), replica=True)
             else:
                 query = """
                 SELECT id, file_name, file_type, title, description, 
@@ -91,7 +53,7 @@ class WellnessService:
                 FROM audio_files 
                 ORDER BY file_type, title
                 """
-                audio_files = self.db.execute_query(query)
+                audio_files = self.db.execute_query(query, replica=True)
             
             # 각 파일에 대한 presigned URL 생성
             for audio_file in audio_files:
@@ -257,6 +219,7 @@ def extract_user_id_from_event(event: Dict[str, Any]) -> str:
         logger.error(f"사용자 ID 추출 오류: {e}")
         return None
 
+@transactional
 def lambda_handler(event, context):
     """Lambda 메인 핸들러"""
     try:
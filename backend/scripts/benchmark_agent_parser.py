@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Bio-Coach Agent 응답 파서 마이크로 벤치마크
+기록된 Agent 응답 코퍼스(data/agent_reply_corpus.jsonl)로 이전 파서와 현재 parse_agent_response의
+결과가 같은지 확인하고 응답 1건당 파싱 시간을 비교합니다.
+
+사용법:
+    python benchmark_agent_parser.py                  # 코퍼스 일치 확인 + 벤치마크
+    python benchmark_agent_parser.py --fuzz 20000     # 코퍼스 조각을 섞은 무작위 응답으로 추가 일치 확인
+    python benchmark_agent_parser.py --repeat 2000    # 벤치마크 반복 횟수
+"""
+
+import sys
+import json
+import random
+import argparse
+import timeit
+import logging
+from pathlib import Path
+
+# 백엔드 루트와 ai_services Lambda를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / 'lambda' / 'ai_services'))
+
+from handler import parse_agent_response
+
+CORPUS_PATH = Path(__file__).parent / 'data' / 'agent_reply_corpus.jsonl'
+
+# 파싱 실패 로그가 벤치마크 출력에 섞이지 않도록
+logging.getLogger().setLevel(logging.CRITICAL)
+
+
+def legacy_parse_agent_response(response_text, user_id, target_date):
+    """이전 parse_agent_response (비교 기준, 호출마다 import / 정규식 다중 스캔)"""
+    import re
+    import json as json_lib
+
+    try:
+        try:
+            data = json_lib.loads(response_text)
+            if isinstance(data, dict) and 'sleep' in data:
+                return {
+                    'sleep_time': data.get('sleep'),
+                    'coffee_time': data.get('coffee'),
+                    'shift_type': data.get('shift'),
+                    'tip': data.get('tip', ''),
+                    'date': target_date
+                }
+        except json_lib.JSONDecodeError:
+            pass
+
+        sleep_keywords = ['수면', '잠', 'sleep', '취침', '자는']
+        caffeine_keywords = ['카페인', '커피', 'caffeine', 'coffee', '중단', '마감']
+
+        time_pattern = r'(.{0,20})\b([0-2]?[0-9]):([0-5][0-9])\b(.{0,20})'
+        time_matches = re.findall(time_pattern, response_text, re.IGNORECASE)
+
+        sleep_time = None
+        coffee_time = None
+
+        for before, hour, minute, after in time_matches:
+            time_str = f"{hour.zfill(2)}:{minute}"
+            context = (before + after).lower()
+            if any(keyword in context for keyword in sleep_keywords):
+                if not sleep_time:
+                    sleep_time = time_str
+            elif any(keyword in context for keyword in caffeine_keywords):
+                if not coffee_time:
+                    coffee_time = time_str
+
+        if not sleep_time or not coffee_time:
+            times = re.findall(r'\b([0-2]?[0-9]):([0-5][0-9])\b', response_text)
+            if not sleep_time and len(times) > 1:
+                sleep_time = f"{times[1][0].zfill(2)}:{times[1][1]}"
+            if not coffee_time and len(times) > 0:
+                coffee_time = f"{times[0][0].zfill(2)}:{times[0][1]}"
+
+        sleep_time = sleep_time or "23:00"
+        coffee_time = coffee_time or "14:00"
+
+        shift_pattern = r'(주간|야간|초저녁|휴무|day|night|evening|off|D|E|N|O)'
+        shift_matches = re.findall(shift_pattern, response_text, re.IGNORECASE)
+        shift_mapping = {
+            '주간': 'D', 'day': 'D', 'D': 'D',
+            '야간': 'N', 'night': 'N', 'N': 'N',
+            '초저녁': 'E', 'evening': 'E', 'E': 'E',
+            '휴무': 'O', 'off': 'O', 'O': 'O'
+        }
+        shift_type = 'D'
+        if shift_matches:
+            shift_type = shift_mapping.get(shift_matches[0].lower(), 'D')
+
+        tip = response_text
+        for keyword in ['팁:', '권장사항:', '조언:', 'tip:', 'advice:']:
+            if keyword in response_text.lower():
+                tip = response_text.split(keyword, 1)[1].strip()
+                break
+
+        return {
+            'sleep_time': sleep_time,
+            'coffee_time': coffee_time,
+            'shift_type': shift_type,
+            'tip': tip[:500],
+            'date': target_date
+        }
+
+    except Exception:
+        return {
+            'sleep_time': "23:00",
+            'coffee_time': "14:00",
+            'shift_type': "D",
+            'tip': "규칙적인 수면 패턴을 유지하세요.",
+            'date': target_date
+        }
+
+
+def load_corpus():
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def fuzz_replies(corpus, count, seed=0):
+    """코퍼스 응답을 조각내어 섞은 무작위 응답 생성 (시간/키워드/줄바꿈이 가까이 붙는 경우 포함)"""
+    rng = random.Random(seed)
+    fragments = [reply['reply'] for reply in corpus if reply['reply']]
+    extras = ['\n', ' ', '09:00', '3:00', '12:01:30', '수면', '커피', '마감', 'Tip:', '팁:', 'day', 'N', '초저녁', '야간']
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.4:
+                parts.append(rng.choice(extras))
+            else:
+                text = rng.choice(fragments)
+                start = rng.randrange(len(text))
+                parts.append(text[start:start + rng.randint(1, 60)])
+        yield ''.join(parts)
+
+
+def check_parity(replies):
+    """이전 파서와 결과가 다른 응답 목록"""
+    return [reply for reply in replies
+            if parse_agent_response(reply, 'bench', '2026-01-30') != legacy_parse_agent_response(reply, 'bench', '2026-01-30')]
+
+
+def benchmark(replies, repeat):
+    """응답 1건당 평균 파싱 시간 (µs)"""
+    results = {}
+    for name, parser in (('legacy', legacy_parse_agent_response), ('current', parse_agent_response)):
+        elapsed = min(timeit.repeat(lambda: [parser(reply, 'bench', '2026-01-30') for reply in replies],
+                                    number=repeat, repeat=3))
+        results[name] = elapsed / (repeat * len(replies)) * 1_000_000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bio-Coach Agent 응답 파서 벤치마크')
+    parser.add_argument('--repeat', type=int, default=500, help='벤치마크 반복 횟수')
+    parser.add_argument('--fuzz', type=int, default=0, help='무작위 응답 일치 확인 개수')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    replies = [reply['reply'] for reply in corpus]
+
+    mismatches = check_parity(replies)
+    if args.fuzz:
+        mismatches += check_parity(fuzz_replies(corpus, args.fuzz))
+    if mismatches:
+        print(f"❌ 이전 파서와 결과가 다른 응답 {len(mismatches)}건")
+        for reply in mismatches[:5]:
+            print(f"   {reply!r}")
+        sys.exit(1)
+    print(f"✅ 결과 일치: 코퍼스 {len(replies)}건" + (f" + 무작위 {args.fuzz}건" if args.fuzz else ''))
+
+    results = benchmark(replies, args.repeat)
+    print(f"⏱️  legacy : {results['legacy']:.1f} µs/응답")
+    print(f"⏱️  current: {results['current']:.1f} µs/응답")
+    print(f"🚀 {results['legacy'] / results['current']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -133,6 +133,7 @@ def create_deployment_package():
     print_info("배포 패키지 생성 중: biopathway_calculator")
     
     lambda_dir = Path(__file__).parent.parent / 'lambda' / 'biopathway_calculator'
+    utils_dir = Path(__file__).parent.parent / 'utils'
     zip_path = Path(__file__).parent.parent / 'biopathway_calculator.zip'
     
     # 기존 zip 파일 삭제
@@ -148,6 +149,11 @@ def create_deployment_package():
             print_error(f"lambda_function.py를 찾을 수 없습니다: {lambda_function_path}")
             sys.exit(1)
         
+        # utils 디렉토리 추가 (공통 DatabaseManager)
+        if utils_dir.exists():
+            for file in utils_dir.glob('*.py'):
+                zipf.write(file, f'utils/{file.name}')
+        
         # requirements.txt 처리
         requirements_path = lambda_dir / 'requirements.txt'
         if requirements_path.exists():
@@ -213,10 +219,12 @@ def deploy_lambda():
     environment = {
         'Variables': {
             'DB_HOST': os.environ.get('DB_HOST', ''),
+            'DB_READER_HOST': os.environ.get('DB_READER_HOST', ''),
             'DB_PORT': os.environ.get('DB_PORT', '5432'),
             'DB_NAME': os.environ.get('DB_NAME', 'rhythm_fairy'),
             'DB_USER': os.environ.get('DB_USER', 'postgres'),
             'DB_PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'DB_DRIVER': 'pg8000',
         }
     }
     
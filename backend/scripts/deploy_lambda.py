@@ -445,17 +445,31 @@ def deploy_lambda_function(function_name, role_arn, vpc_config):
     environment = {
         'Variables': {
             'DB_HOST': os.environ.get('DB_HOST', ''),
+            'DB_READER_HOST': os.environ.get('DB_READER_HOST', ''),
             'DB_PORT': os.environ.get('DB_PORT', '5432'),
             'DB_NAME': os.environ.get('DB_NAME', 'rhythm_fairy'),
             'DB_USER': os.environ.get('DB_USER', 'postgres'),
             'DB_PASSWORD': os.environ.get('DB_PASSWORD', ''),
             'APP_REGION': os.environ.get('AWS_REGION', 'us-east-1'),  # AWS_REGION 대신 APP_REGION 사용
             'S3_BUCKET_NAME': os.environ.get('S3_BUCKET_NAME', 'redhorse-s3-ai-0126'),
+            'COGNITO_USER_POOL_ID': os.environ.get('COGNITO_USER_POOL_ID', ''),
+            'COGNITO_CLIENT_ID': os.environ.get('COGNITO_CLIENT_ID', ''),
             'BEDROCK_AGENT_ID': os.environ.get('BEDROCK_AGENT_ID', ''),
             'BEDROCK_AGENT_ALIAS_ID': os.environ.get('BEDROCK_AGENT_ALIAS_ID', ''),
             'BEDROCK_BIO_AGENT_ID': os.environ.get('BEDROCK_BIO_AGENT_ID', ''),
             'BEDROCK_BIO_AGENT_ALIAS_ID': os.environ.get('BEDROCK_BIO_AGENT_ALIAS_ID', ''),
             'BEDROCK_REGION': os.environ.get('BEDROCK_REGION', 'us-east-1'),
+            'BIO_PLAN_MODE': os.environ.get('BIO_PLAN_MODE', 'rules_enrich'),
+            'BIO_COACH_CACHE_TTL_SECONDS': os.environ.get('BIO_COACH_CACHE_TTL_SECONDS', '21600'),
+            'BIO_COACH_CACHE_MAX_ENTRIES': os.environ.get('BIO_COACH_CACHE_MAX_ENTRIES', '256'),
+            'BIO_COACH_SHARED_CACHE': os.environ.get('BIO_COACH_SHARED_CACHE', 'false'),
+            'BIO_AGENT_BUDGET_MS': os.environ.get('BIO_AGENT_BUDGET_MS', '6000'),
+            'BIO_AGENT_DEADLINE_MARGIN_MS': os.environ.get('BIO_AGENT_DEADLINE_MARGIN_MS', '3000'),
+            'CIRCUIT_BREAKER_FAILURE_THRESHOLD': os.environ.get('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5'),
+            'CIRCUIT_BREAKER_RESET_SECONDS': os.environ.get('CIRCUIT_BREAKER_RESET_SECONDS', '60'),
+            'CIRCUIT_BREAKER_HALF_OPEN_PROBES': os.environ.get('CIRCUIT_BREAKER_HALF_OPEN_PROBES', '1'),
+            'CIRCUIT_BREAKER_SHARED_STATE': os.environ.get('CIRCUIT_BREAKER_SHARED_STATE', 'false'),
+            'EXPORT_URL_EXPIRES_SECONDS': os.environ.get('EXPORT_URL_EXPIRES_SECONDS', '900'),
             'OCR_LAMBDA_NAME': os.environ.get('OCR_LAMBDA_NAME', 'ShiftSync-Vision-OCR')
         }
     }
@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 """
 데이터베이스 마이그레이션 실행 스크립트
+
+사용법:
+    python run_migration.py                          # sleep_plans TIMESTAMP 마이그레이션 (기본)
+    python run_migration.py partition_time_series    # 시계열 테이블 월별 파티션 마이그레이션
+    python run_migration.py schedule_rolling_state   # 근무 롤링 상태 테이블/트리거 (파티션 마이그레이션 이후)
+    python run_migration.py daily_rollups            # 사용자별 일간 집계 테이블/트리거 (파티션 마이그레이션 이후)
+    python run_migration.py bio_coach_cache          # Bio-Coach 응답 공유 캐시 테이블
+    python run_migration.py circuit_breakers         # 서킷 브레이커 공유 상태 테이블
+    python run_migration.py user_write_marks         # 사용자별 마지막 쓰기 시각 테이블 (DB_READER_HOST 설정 전)
+    python run_migration.py --maintain-partitions    # 미래 월 파티션 생성 (수동 실행, 확인 없음)
+    python run_migration.py --rebuild-rollups        # 일간 집계 재생성 (백필, 확인 없음)
 """
 import os
 import sys
+import argparse
 import psycopg2
 from pathlib import Path
 from dotenv import load_dotenv
@@ -12,22 +24,154 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+# 마이그레이션 목록: 이름 -> (SQL 파일, 확인 메시지)
+MIGRATIONS = {
+    'sleep_plans_timestamp': (
+        'migrate_sleep_plans_to_timestamp.sql',
+        "이 작업은 sleep_plans 테이블을 재생성합니다."
+    ),
+    'partition_time_series': (
+        'migrate_partition_time_series.sql',
+        "이 작업은 schedules, fatigue_assessments, chat_history 테이블을 월별 파티션 테이블로 재생성합니다.\n"
+        "   (기존 테이블은 *_backup 으로 보관, 전체가 하나의 트랜잭션으로 실행됩니다)"
+    ),
+    'schedule_rolling_state': (
+        'migrate_schedule_rolling_state.sql',
+        "이 작업은 schedule_rolling_state 테이블과 schedules 트리거를 만들고 기존 근무 일정으로 초기 상태를 계산합니다."
+    ),
+    'daily_rollups': (
+        'migrate_daily_rollups.sql',
+        "이 작업은 user_daily_rollups 테이블과 피로도/점프스타트 트리거를 만들고 최근 1년 집계를 계산합니다."
+    ),
+    'bio_coach_cache': (
+        'migrate_bio_coach_cache.sql',
+        "이 작업은 Bio-Coach 응답 공유 캐시 테이블(bio_coach_cache)을 만듭니다."
+    ),
+    'circuit_breakers': (
+        'migrate_circuit_breakers.sql',
+        "이 작업은 서킷 브레이커 공유 상태 테이블(circuit_breakers)을 만듭니다."
+    ),
+    'user_write_marks': (
+        'migrate_user_write_marks.sql',
+        "이 작업은 사용자별 마지막 쓰기 시각 테이블(user_write_marks)을 만듭니다."
+    ),
+}
+
+def connect():
+    """데이터베이스 연결"""
+    conn = psycopg2.connect(
+        host=os.environ['DB_HOST'],
+        port=os.environ.get('DB_PORT', '5432'),
+        database=os.environ.get('DB_NAME', 'rhythm_fairy'),
+        user=os.environ.get('DB_USER', 'postgres'),
+        password=os.environ['DB_PASSWORD']
+    )
+    print("✅ 데이터베이스 연결 성공")
+    return conn
+
+def run_script_migration(name: str):
+    """plpgsql 함수가 포함된 마이그레이션 (SQL 파일 전체를 단일 트랜잭션으로 실행)"""
+    conn = None
+    try:
+        conn = connect()
+        
+        migration_file = Path(__file__).parent.parent / 'infrastructure' / MIGRATIONS[name][0]
+        with open(migration_file, 'r', encoding='utf-8') as f:
+            migration_sql = f.read()
+        
+        print(f"📄 마이그레이션 파일 로드: {migration_file}")
+        
+        # plpgsql 함수 본문($$ ... $$)에 세미콜론이 있으므로 분리하지 않고 한 번에 실행
+        cursor = conn.cursor()
+        print("\n🔄 실행 중...")
+        cursor.execute(migration_sql)
+        conn.commit()
+        print("✅ 완료")
+        
+        for notice in conn.notices:
+            print(f"ℹ️  {notice.strip()}")
+        
+        if name == 'partition_time_series':
+            print_partition_summary(cursor)
+        
+        cursor.close()
+        conn.close()
+        
+        print("\n🎉 마이그레이션 완료!")
+        
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        print(f"\n❌ 마이그레이션 실패 (모든 변경 롤백): {e}")
+        sys.exit(1)
+
+def maintain_partitions(months_ahead: int = 3):
+    """미래 월 파티션 생성 (수동 실행용, 정기 실행은 EventBridge 월간 규칙 - setup_fatigue_schedule.py)"""
+    try:
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute("SELECT maintain_time_series_partitions(%s)", (months_ahead,))
+        created = cursor.fetchone()[0]
+        conn.commit()
+        
+        print(f"✅ 새 파티션 {created}개 생성 ({months_ahead}개월 앞까지)")
+        print_partition_summary(cursor)
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ 파티션 유지 작업 실패: {e}")
+        sys.exit(1)
+
+def rebuild_rollups(days: int = 365):
+    """사용자별 일간 집계 재생성 (최근 days일 ~ 31일 뒤)"""
+    try:
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT rebuild_user_daily_rollups(CURRENT_DATE - %s, CURRENT_DATE + 31)", (days,))
+        user_count = cursor.fetchone()[0]
+        conn.commit()
+        
+        print(f"✅ 일간 집계 재생성 완료: 사용자 {user_count}명 (최근 {days}일)")
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ 일간 집계 재생성 실패: {e}")
+        sys.exit(1)
+
+def print_partition_summary(cursor):
+    """테이블별 파티션 수와 범위 출력"""
+    cursor.execute("""
+        SELECT parent.relname,
+               COUNT(*),
+               MIN(child.relname) FILTER (WHERE child.relname !~ '_default$'),
+               MAX(child.relname) FILTER (WHERE child.relname !~ '_default$')
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname IN ('schedules', 'fatigue_assessments', 'chat_history')
+        GROUP BY parent.relname
+        ORDER BY parent.relname
+    """)
+    
+    print("\n" + "="*50)
+    print("📊 파티션 현황")
+    print("="*50)
+    for table_name, count, first_partition, last_partition in cursor.fetchall():
+        print(f"  {table_name}: {count}개 ({first_partition} ~ {last_partition}, DEFAULT 포함)")
+
 def run_migration():
     """마이그레이션 SQL 파일 실행"""
     try:
         # 데이터베이스 연결
-        conn = psycopg2.connect(
-            host=os.environ['DB_HOST'],
-            port=os.environ.get('DB_PORT', '5432'),
-            database=os.environ.get('DB_NAME', 'rhythm_fairy'),
-            user=os.environ.get('DB_USER', 'postgres'),
-            password=os.environ['DB_PASSWORD']
-        )
-        
-        print("✅ 데이터베이스 연결 성공")
+        conn = connect()
         
         # 마이그레이션 파일 읽기
-        migration_file = Path(__file__).parent.parent / 'infrastructure' / 'migrate_sleep_plans_to_timestamp.sql'
+        migration_file = Path(__file__).parent.parent / 'infrastructure' / MIGRATIONS['sleep_plans_timestamp'][0]
         
         with open(migration_file, 'r', encoding='utf-8') as f:
             migration_sql = f.read()
@@ -88,16 +232,35 @@ def run_migration():
         sys.exit(1)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='데이터베이스 마이그레이션')
+    parser.add_argument('migration', nargs='?', default='sleep_plans_timestamp', choices=sorted(MIGRATIONS))
+    parser.add_argument('--maintain-partitions', action='store_true', help='미래 월 파티션만 생성 (확인 없이 실행)')
+    parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들 파티션 개월 수')
+    parser.add_argument('--rebuild-rollups', action='store_true', help='사용자별 일간 집계 재생성 (확인 없이 실행)')
+    parser.add_argument('--rollup-days', type=int, default=365, help='재생성할 과거 일수')
+    args = parser.parse_args()
+    
+    if args.maintain_partitions:
+        maintain_partitions(args.months_ahead)
+        sys.exit(0)
+    
+    if args.rebuild_rollups:
+        rebuild_rollups(args.rollup_days)
+        sys.exit(0)
+    
     print("="*50)
     print("🔄 데이터베이스 마이그레이션 시작")
     print("="*50)
-    print("\n⚠️  주의: 이 작업은 sleep_plans 테이블을 재생성합니다.")
+    print(f"\n⚠️  주의: {MIGRATIONS[args.migration][1]}")
     print("계속하시겠습니까? (y/n): ", end='')
     
     response = input().strip().lower()
     
     if response == 'y':
-        run_migration()
+        if args.migration == 'sleep_plans_timestamp':
+            run_migration()
+        else:
+            run_script_migration(args.migration)
     else:
         print("\n❌ 마이그레이션 취소됨")
         sys.exit(0)
@@ -71,6 +71,7 @@ API_ROUTES = {
     ],
     'schedule_management': [
         ('GET', '/users/{user_id}/schedules'),
+        ('GET', '/users/{user_id}/schedules/export'),
         ('POST', '/users/{user_id}/schedules'),
         ('PUT', '/users/{user_id}/schedules/{schedule_id}'),
         ('DELETE', '/users/{user_id}/schedules/{schedule_id}'),
@@ -82,6 +83,7 @@ API_ROUTES = {
         ('GET', '/users/{user_id}/sleep-plans'),
         ('POST', '/users/{user_id}/caffeine-plans'),
         ('GET', '/users/{user_id}/caffeine-plans'),
+        ('POST', '/users/{user_id}/daily-plan'),
         ('POST', '/users/{user_id}/chat'),
         ('GET', '/users/{user_id}/chat')
     ],
@@ -89,6 +91,7 @@ API_ROUTES = {
         ('POST', '/users/{user_id}/fatigue-assessment'),
         ('GET', '/users/{user_id}/fatigue-assessment'),
         ('GET', '/users/{user_id}/fatigue-assessment/history'),
+        ('GET', '/users/{user_id}/fatigue-assessment/export'),
         ('GET', '/users/{user_id}/fatigue-assessment/statistics')
     ],
     'jumpstart': [
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+AI 챗봇 스트리밍용 WebSocket API 설정 스크립트
+API Gateway WebSocket API($connect, $disconnect, chat 라우트)를 ai_services Lambda에 연결하고
+Lambda가 연결로 응답 청크를 보낼 수 있도록 execute-api:ManageConnections 권한을 추가합니다.
+$connect에는 ai_services Lambda를 REQUEST authorizer로 붙여 쿼리 문자열의 Cognito Access Token(?token=)을 검증합니다.
+(ai_services가 VPC 안에 있으면 cognito-idp로 나가는 NAT 또는 VPC 엔드포인트가 필요)
+
+사용법:
+    python setup_chat_websocket.py
+"""
+
+import os
+import sys
+import json
+import boto3
+from pathlib import Path
+
+# 색상 코드
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    END = '\033[0m'
+
+def print_success(msg):
+    print(f"{Colors.GREEN}✅ {msg}{Colors.END}")
+
+def print_info(msg):
+    print(f"{Colors.BLUE}ℹ️  {msg}{Colors.END}")
+
+def print_error(msg):
+    print(f"{Colors.RED}❌ {msg}{Colors.END}")
+
+# 환경 변수 로드
+def load_env_file():
+    env_path = Path(__file__).parent.parent / '.env'
+    if not env_path.exists():
+        return
+
+    with open(env_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                os.environ[key.strip()] = value.strip()
+
+load_env_file()
+
+# AWS 클라이언트
+region = os.environ.get('AWS_REGION', 'us-east-1')
+apigateway = boto3.client('apigatewayv2', region_name=region)
+lambda_client = boto3.client('lambda', region_name=region)
+iam_client = boto3.client('iam', region_name=region)
+sts_client = boto3.client('sts', region_name=region)
+
+API_NAME = 'shift-worker-wellness-chat-ws'
+LAMBDA_FUNCTION_NAME = 'shift-worker-wellness-ai_services'
+ROUTE_KEYS = ['$connect', '$disconnect', 'chat']
+AUTHORIZER_NAME = 'chat-cognito-token'
+STAGE_NAME = 'prod'
+
+def create_or_get_api():
+    """WebSocket API 생성 또는 가져오기 (route: $request.body.action)"""
+    for api in apigateway.get_apis()['Items']:
+        if api['Name'] == API_NAME:
+            print_info(f"기존 API 사용: {API_NAME}")
+            return api['ApiId'], api['ApiEndpoint']
+
+    response = apigateway.create_api(
+        Name=API_NAME,
+        ProtocolType='WEBSOCKET',
+        RouteSelectionExpression='$request.body.action',
+        Description='Streaming AI chat for Shift Worker Wellness App'
+    )
+    print_success(f"API 생성 완료: {response['ApiId']}")
+    return response['ApiId'], response['ApiEndpoint']
+
+def setup_authorizer(api_id, account_id, authorizer_uri):
+    """$connect용 Lambda authorizer 생성 또는 가져오기 (identity source: 쿼리 문자열 token)"""
+    authorizer_id = next(
+        (item['AuthorizerId'] for item in apigateway.get_authorizers(ApiId=api_id)['Items']
+         if item['Name'] == AUTHORIZER_NAME),
+        None
+    )
+    if authorizer_id:
+        print_info(f"기존 authorizer 사용: {AUTHORIZER_NAME}")
+    else:
+        authorizer_id = apigateway.create_authorizer(
+            ApiId=api_id,
+            Name=AUTHORIZER_NAME,
+            AuthorizerType='REQUEST',
+            AuthorizerUri=authorizer_uri,
+            IdentitySource=['route.request.querystring.token']
+        )['AuthorizerId']
+        print_success(f"authorizer 생성 완료: {AUTHORIZER_NAME}")
+
+    try:
+        lambda_client.add_permission(
+            FunctionName=LAMBDA_FUNCTION_NAME,
+            StatementId=f'apigateway-ws-authorizer-{api_id}',
+            Action='lambda:InvokeFunction',
+            Principal='apigateway.amazonaws.com',
+            SourceArn=f'arn:aws:execute-api:{region}:{account_id}:{api_id}/authorizers/{authorizer_id}'
+        )
+    except lambda_client.exceptions.ResourceConflictException:
+        # 권한이 이미 존재하는 경우
+        pass
+    return authorizer_id
+
+def setup_routes(api_id, account_id):
+    """Lambda 통합, $connect authorizer 및 라우트 생성"""
+    function_arn = lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME)['Configuration']['FunctionArn']
+
+    integration_uri = f'arn:aws:apigateway:{region}:lambda:path/2015-03-31/functions/{function_arn}/invocations'
+    integration_id = next(
+        (item['IntegrationId'] for item in apigateway.get_integrations(ApiId=api_id)['Items']
+         if item.get('IntegrationUri') == integration_uri),
+        None
+    )
+    if not integration_id:
+        integration_id = apigateway.create_integration(
+            ApiId=api_id,
+            IntegrationType='AWS_PROXY',
+            IntegrationUri=integration_uri
+        )['IntegrationId']
+
+    try:
+        lambda_client.add_permission(
+            FunctionName=LAMBDA_FUNCTION_NAME,
+            StatementId=f'apigateway-ws-{api_id}',
+            Action='lambda:InvokeFunction',
+            Principal='apigateway.amazonaws.com',
+            SourceArn=f'arn:aws:execute-api:{region}:{account_id}:{api_id}/*'
+        )
+    except lambda_client.exceptions.ResourceConflictException:
+        # 권한이 이미 존재하는 경우
+        pass
+
+    authorizer_id = setup_authorizer(api_id, account_id, integration_uri)
+    # 인증은 $connect에서만 (이후 메시지는 연결의 principalId를 그대로 전달받음)
+    auth_settings = {
+        '$connect': {'AuthorizationType': 'CUSTOM', 'AuthorizerId': authorizer_id}
+    }
+
+    existing = {route['RouteKey']: route['RouteId'] for route in apigateway.get_routes(ApiId=api_id)['Items']}
+    for route_key in ROUTE_KEYS:
+        auth = auth_settings.get(route_key, {})
+        if route_key in existing:
+            if auth:
+                apigateway.update_route(ApiId=api_id, RouteId=existing[route_key], **auth)
+            print_info(f"기존 라우트 사용: {route_key}")
+            continue
+        apigateway.create_route(ApiId=api_id, RouteKey=route_key, Target=f'integrations/{integration_id}', **auth)
+        print_info(f"라우트 생성: {route_key}")
+
+def create_stage(api_id):
+    """스테이지 생성 (자동 배포)"""
+    try:
+        apigateway.get_stage(ApiId=api_id, StageName=STAGE_NAME)
+        print_info(f"기존 스테이지 사용: {STAGE_NAME}")
+    except apigateway.exceptions.NotFoundException:
+        apigateway.create_stage(ApiId=api_id, StageName=STAGE_NAME, AutoDeploy=True)
+        print_success(f"스테이지 생성 완료: {STAGE_NAME}")
+
+def grant_manage_connections(api_id, account_id):
+    """Lambda 실행 역할에 WebSocket 연결 전송 권한 추가"""
+    role_arn = lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME)['Configuration']['Role']
+    iam_client.put_role_policy(
+        RoleName=role_arn.split('/')[-1],
+        PolicyName='chat-websocket-manage-connections',
+        PolicyDocument=json.dumps({
+            'Version': '2012-10-17',
+            'Statement': [{
+                'Effect': 'Allow',
+                'Action': 'execute-api:ManageConnections',
+                'Resource': f'arn:aws:execute-api:{region}:{account_id}:{api_id}/{STAGE_NAME}/POST/@connections/*'
+            }]
+        })
+    )
+    print_success("execute-api:ManageConnections 권한 추가 완료")
+
+def main():
+    account_id = sts_client.get_caller_identity()['Account']
+    api_id, api_endpoint = create_or_get_api()
+    setup_routes(api_id, account_id)
+    create_stage(api_id)
+    grant_manage_connections(api_id, account_id)
+
+    ws_url = f"{api_endpoint}/{STAGE_NAME}"
+    print_success(f"WebSocket URL: {ws_url}")
+    print(f"\n{Colors.YELLOW}다음 단계:{Colors.END}")
+    print("프론트엔드 .env.local 파일에 다음 추가:")
+    print(f"   VITE_CHAT_WS_URL={ws_url}\n")
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print_error(f"WebSocket API 설정 실패: {e}")
+        sys.exit(1)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+피로 위험도 야간 배치 / 파티션 유지 스케줄 설정 스크립트
+EventBridge 규칙으로 fatigue_assessment Lambda를 호출합니다.
+- 매일 밤: 전체 사용자의 내일 피로 위험도를 미리 계산
+- 매월 1일: 시계열 테이블(schedules, fatigue_assessments, chat_history)의 미래 월 파티션 생성
+  (pg_cron이 없는 RDS에서도 새 행이 DEFAULT 파티션에 쌓이지 않도록)
+
+사용법:
+    python setup_fatigue_schedule.py                            # 매일 15:00 UTC (KST 자정) + 매월 1일 03:00 UTC
+    python setup_fatigue_schedule.py "cron(30 14 * * ? *)"      # 야간 배치 실행 시각 지정
+"""
+
+import os
+import sys
+import json
+import boto3
+from pathlib import Path
+
+# 색상 코드
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    END = '\033[0m'
+
+def print_success(msg):
+    print(f"{Colors.GREEN}✅ {msg}{Colors.END}")
+
+def print_info(msg):
+    print(f"{Colors.BLUE}ℹ️  {msg}{Colors.END}")
+
+def print_error(msg):
+    print(f"{Colors.RED}❌ {msg}{Colors.END}")
+
+# 환경 변수 로드
+def load_env_file():
+    env_path = Path(__file__).parent.parent / '.env'
+    if not env_path.exists():
+        return
+
+    with open(env_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                os.environ[key.strip()] = value.strip()
+
+load_env_file()
+
+# AWS 클라이언트
+region = os.environ.get('AWS_REGION', 'us-east-1')
+events_client = boto3.client('events', region_name=region)
+lambda_client = boto3.client('lambda', region_name=region)
+
+RULE_NAME = 'shift-worker-wellness-fatigue-nightly'
+LAMBDA_FUNCTION_NAME = 'shift-worker-wellness-fatigue_assessment'
+DEFAULT_SCHEDULE = 'cron(0 15 * * ? *)'
+
+# 파티션 유지 규칙 (fatigue_assessment의 PARTITION_MAINTENANCE_EVENT_SOURCE 이벤트로 호출)
+PARTITION_RULE_NAME = 'shift-worker-wellness-partition-maintenance'
+PARTITION_SCHEDULE = 'cron(0 3 1 * ? *)'
+PARTITION_EVENT = {'source': 'rhythm-fairy.partition-maintenance'}
+
+def put_schedule_rule(rule_name: str, schedule_expression: str, description: str, target_id: str, event_input: dict = None):
+    """EventBridge 규칙 생성/갱신 후 Lambda를 대상으로 연결 (event_input이 있으면 고정 이벤트로 호출)"""
+    function_arn = lambda_client.get_function(FunctionName=LAMBDA_FUNCTION_NAME)['Configuration']['FunctionArn']
+
+    rule_arn = events_client.put_rule(
+        Name=rule_name,
+        ScheduleExpression=schedule_expression,
+        State='ENABLED',
+        Description=description
+    )['RuleArn']
+    print_success(f"EventBridge 규칙 설정 완료: {rule_name} ({schedule_expression})")
+
+    try:
+        lambda_client.add_permission(
+            FunctionName=LAMBDA_FUNCTION_NAME,
+            StatementId=f'events-{rule_name}',
+            Action='lambda:InvokeFunction',
+            Principal='events.amazonaws.com',
+            SourceArn=rule_arn
+        )
+    except lambda_client.exceptions.ResourceConflictException:
+        # 권한이 이미 존재하는 경우
+        pass
+
+    target = {'Id': target_id, 'Arn': function_arn}
+    if event_input is not None:
+        target['Input'] = json.dumps(event_input)
+    events_client.put_targets(Rule=rule_name, Targets=[target])
+    print_success(f"대상 Lambda 연결 완료: {LAMBDA_FUNCTION_NAME}")
+
+def setup_schedule(schedule_expression: str = DEFAULT_SCHEDULE):
+    """야간 피로 위험도 배치 + 월간 파티션 유지 규칙 설정"""
+    put_schedule_rule(RULE_NAME, schedule_expression, '내일 피로 위험도 일괄 계산', 'fatigue-assessment')
+    put_schedule_rule(PARTITION_RULE_NAME, PARTITION_SCHEDULE, '시계열 테이블 미래 월 파티션 생성',
+                      'partition-maintenance', PARTITION_EVENT)
+
+if __name__ == '__main__':
+    try:
+        setup_schedule(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SCHEDULE)
+    except Exception as e:
+        print_error(f"스케줄 설정 실패: {e}")
+        sys.exit(1)
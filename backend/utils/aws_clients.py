@@ -0,0 +1,74 @@
+"""
+AWS 클라이언트 레지스트리
+
+boto3 클라이언트 생성(botocore 로더, 엔드포인트 해석, TLS 연결)은 비싸므로
+(서비스, 용도별 프로필, 리전, 엔드포인트) 단위로 한 번만 만들고 Lambda 웜 컨테이너에서 재사용
+- 용도별 프로필로 타임아웃 / 재시도 / 커넥션 풀 크기를 통일
+- tcp_keepalive로 호출 사이에 커넥션 유지
+"""
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# 용도별 클라이언트 설정 프로필
+CLIENT_PROFILES: Dict[str, Dict[str, Any]] = {
+    # 일반 AWS API 호출
+    'default': {
+        'connect_timeout': 10,
+        'read_timeout': 60,
+        'retries': {'max_attempts': 3, 'mode': 'standard'},
+    },
+    # AI 챗봇 (RAG Agent) - 긴 응답 스트림, VPC 엔드포인트 연결 지연 고려
+    'chat': {
+        'connect_timeout': 30,
+        'read_timeout': 90,
+        'retries': {'max_attempts': 2, 'mode': 'standard'},
+    },
+    # Bio-Coach 수면/카페인 계획 - 실패 시 로컬 규칙 엔진이 있으므로 짧게
+    'bio_coach': {
+        'connect_timeout': 5,
+        'read_timeout': 30,
+        'retries': {'max_attempts': 1, 'mode': 'standard'},
+    },
+    # Bio-Coach agent 모드 헤징 호출 - 응답 대기 마감은 호출자가 관리, 소켓 읽기 하나가 막혀도 스레드를 오래 잡지 않도록 짧게
+    'bio_coach_hedge': {
+        'connect_timeout': 2,
+        'read_timeout': 10,
+        'retries': {'max_attempts': 1, 'mode': 'standard'},
+    },
+    # 비동기(Event) Lambda 자기 호출 / WebSocket 전송 - 응답 본문이 없어 짧게
+    'async': {
+        'connect_timeout': 5,
+        'read_timeout': 10,
+        'retries': {'max_attempts': 2, 'mode': 'standard'},
+    },
+}
+
+_clients: Dict[Tuple[str, str, Optional[str], Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(service_name: str, profile: str = 'default', region_name: Optional[str] = None,
+               endpoint_url: Optional[str] = None):
+    """
+    용도별 프로필이 적용된 boto3 클라이언트 가져오기 (최초 1회 생성 후 재사용)
+
+    Args:
+        service_name: boto3 서비스 이름 ('bedrock-agent-runtime', 'lambda', ...)
+        profile: CLIENT_PROFILES 키
+        region_name: 리전 (None이면 Lambda 기본 리전)
+        endpoint_url: 엔드포인트 (API Gateway WebSocket 관리 API 등)
+    """
+    key = (service_name, profile, region_name, endpoint_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        if key not in _clients:
+            config = Config(tcp_keepalive=True, max_pool_connections=10, **CLIENT_PROFILES[profile])
+            _clients[key] = boto3.client(service_name, region_name=region_name, endpoint_url=endpoint_url,
+                                         config=config)
+        return _clients[key]
@@ -0,0 +1,60 @@
+"""
+바이오리듬 규칙 (BIO_RULES) 공통 모듈
+
+biopathway_calculator(Bio-Coach Agent Action Group)와 ai_services의 로컬 규칙 엔진이
+같은 규칙으로 수면/카페인 시간을 계산하도록 한 곳에서 관리
+"""
+from typing import Dict, Optional
+
+# BIO_RULES: 근무 유형별 바이오리듬 규칙
+BIO_RULES = {
+    "D": {
+        "sleep": "23:00",
+        "coffee": "14:00",
+        "tip": "밤 11시 이전 취침하여 규칙적인 생체 리듬을 유지하세요."
+    },
+    "N": {
+        "sleep": "09:00",
+        "coffee": "03:00",
+        "tip": "퇴근길 햇빛 노출을 최소화하고 즉시 암막 커튼 아래서 수면하세요."
+    },
+    "E": {
+        "sleep": "02:00",
+        "coffee": "18:00",
+        "tip": "퇴근 후 가벼운 식사를 하고 미온수로 샤워하여 숙면을 유도하세요."
+    },
+    "O": {
+        "sleep": "23:00",
+        "coffee": "15:00",
+        "tip": "부족한 잠을 보충하되 오후 3시 이후의 긴 낮잠은 피하세요."
+    }
+}
+
+# Shift type mapping: database format -> BIO_RULES key
+SHIFT_TYPE_MAPPING = {
+    'day': 'D',
+    'evening': 'E',
+    'night': 'N',
+    'off': 'O'
+}
+
+
+def lookup_bio_rules(shift_type: Optional[str]) -> Dict[str, str]:
+    """
+    근무 유형에 맞는 규칙 조회
+
+    Args:
+        shift_type: DB 형식('day', 'night', ...) 또는 BIO_RULES 키('D', 'N', ...)
+
+    Returns:
+        sleep, coffee, tip, shift_type(BIO_RULES 키) - 알 수 없는 유형은 'D' 규칙 사용
+    """
+    bio_key = SHIFT_TYPE_MAPPING.get(shift_type, shift_type)
+    rules = BIO_RULES.get(bio_key, BIO_RULES['D'])
+
+    return {
+        'sleep': rules['sleep'],
+        'coffee': rules['coffee'],
+        'tip': rules['tip'],
+        'shift_type': bio_key
+    }
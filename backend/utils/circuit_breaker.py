@@ -0,0 +1,215 @@
+"""
+서킷 브레이커
+
+Bedrock Agent / Vision 호출은 장애 시 연결·읽기 타임아웃과 재시도를 모두 기다린 뒤에야 실패하므로
+연속 실패가 쌓이면 한동안 호출하지 않고 바로 대체 경로(더미 응답, 규칙 엔진)를 사용
+- closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+- open: reset_timeout_seconds 동안 호출 거부
+- half_open: 대기 시간이 지나면 probe 요청을 half_open_max_probes건만 통과, 성공하면 closed / 실패하면 다시 open
+상태는 Lambda 웜 컨테이너의 모듈 전역에 유지되고, db_factory를 넘기면 circuit_breakers 테이블로 컨테이너 간 공유
+"""
+import os
+import logging
+import threading
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger()
+
+# 서킷 기본 설정
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.environ.get('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5'))
+CIRCUIT_BREAKER_RESET_SECONDS = float(os.environ.get('CIRCUIT_BREAKER_RESET_SECONDS', '60'))
+CIRCUIT_BREAKER_HALF_OPEN_PROBES = int(os.environ.get('CIRCUIT_BREAKER_HALF_OPEN_PROBES', '1'))
+# true이면 circuit_breakers 테이블로 서킷 상태 공유 (run_migration.py circuit_breakers 필요)
+CIRCUIT_BREAKER_SHARED_STATE = os.environ.get('CIRCUIT_BREAKER_SHARED_STATE', 'false').lower() == 'true'
+# 공유 상태 확인 주기 (초, closed 상태에서만 확인)
+CIRCUIT_BREAKER_SYNC_SECONDS = float(os.environ.get('CIRCUIT_BREAKER_SYNC_SECONDS', '10'))
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """서킷이 open이라 호출하지 않음"""
+    pass
+
+class CircuitBreaker:
+    """연속 실패 기반 서킷 브레이커 (스레드 안전)"""
+    
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout_seconds: float = CIRCUIT_BREAKER_RESET_SECONDS,
+                 half_open_max_probes: int = CIRCUIT_BREAKER_HALF_OPEN_PROBES,
+                 db_factory: Optional[Callable[[], Any]] = None,
+                 sync_interval_seconds: float = CIRCUIT_BREAKER_SYNC_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.half_open_max_probes = half_open_max_probes
+        self._db_factory = db_factory  # DatabaseManager 생성 함수 (None이면 컨테이너 내 상태만 사용)
+        self._db = None
+        self.sync_interval_seconds = sync_interval_seconds
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started_at = float('-inf')
+        self._last_sync = float('-inf')
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.opened = 0
+    
+    @property
+    def db(self):
+        """상태 공유용 DatabaseManager (모듈 import가 아니라 첫 공유 상태 조회 / 기록 시 생성)"""
+        if self._db is None and self._db_factory is not None:
+            self._db = self._db_factory()
+        return self._db
+    
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (False면 바로 대체 경로 사용, 허용된 호출은 반드시 record_success / record_failure로 기록)"""
+        self._sync_shared_state()
+        with self._lock:
+            now = monotonic()
+            if self._state == STATE_OPEN:
+                if now - self._opened_at < self.reset_timeout_seconds:
+                    self.rejected += 1
+                    return False
+                self._state = STATE_HALF_OPEN
+                logger.info(f"🔌 서킷 half-open: {self.name} - probe 요청 허용")
+            
+            if self._state == STATE_HALF_OPEN:
+                # 결과를 기록하지 못한 probe가 자리를 계속 차지하지 않도록 reset_timeout이 지나면 다시 허용
+                if now - self._probe_started_at >= self.reset_timeout_seconds:
+                    self._probes = 0
+                if self._probes >= self.half_open_max_probes:
+                    self.rejected += 1
+                    return False
+                self._probes += 1
+                self._probe_started_at = now
+            return True
+    
+    def is_open(self) -> bool:
+        """호출하면 거부될 상태인지 확인 (probe 자리를 차지하지 않음)"""
+        self._sync_shared_state()
+        with self._lock:
+            return self._state == STATE_OPEN and monotonic() - self._opened_at < self.reset_timeout_seconds
+    
+    def record_success(self):
+        """호출 성공 기록 (half_open이면 closed로)"""
+        with self._lock:
+            if self._state == STATE_OPEN:
+                # open 전에 시작된 호출이 늦게 끝난 경우 - 상태는 probe 결과로만 바꿈
+                return
+            closed = self._state == STATE_HALF_OPEN
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probes = 0
+        
+        if closed:
+            logger.info(f"✅ 서킷 closed: {self.name}")
+            self._save_shared_state(STATE_CLOSED, 0)
+    
+    def record_failure(self):
+        """호출 실패 기록 (연속 실패가 임계값에 도달하거나 probe가 실패하면 open)"""
+        with self._lock:
+            if self._state == STATE_OPEN:
+                return
+            self._failures += 1
+            if self._state == STATE_CLOSED and self._failures < self.failure_threshold:
+                return
+            self._state = STATE_OPEN
+            self._opened_at = monotonic()
+            self._probes = 0
+            self.opened += 1
+            failures = self._failures
+        
+        logger.warning(f"⚡ 서킷 open: {self.name} (연속 실패 {failures}회, {self.reset_timeout_seconds:.0f}초 후 재시도)")
+        self._save_shared_state(STATE_OPEN, failures)
+    
+    def _sync_shared_state(self):
+        """다른 컨테이너가 연 서킷을 sync_interval_seconds마다 확인 (closed 상태에서만)"""
+        if self._db_factory is None:
+            return
+        with self._lock:
+            now = monotonic()
+            if self._state != STATE_CLOSED or now - self._last_sync < self.sync_interval_seconds:
+                return
+            self._last_sync = now
+        
+        try:
+            with self.db.autonomous():
+                rows = self.db.execute_query(
+                    """
+                    SELECT failure_count, EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - opened_at) AS open_seconds
+                    FROM circuit_breakers
+                    WHERE name = %s AND state = 'open'
+                    """,
+                    (self.name,)
+                )
+        except Exception as e:
+            logger.warning(f"⚠️  서킷 공유 상태 조회 실패: {self.name}: {e}")
+            return
+        
+        if not rows:
+            return
+        open_seconds = float(rows[0]['open_seconds'])
+        if open_seconds >= self.reset_timeout_seconds:
+            # 대기 시간이 지난 open은 이 컨테이너의 호출이 probe 역할
+            return
+        
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                self._state = STATE_OPEN
+                self._opened_at = monotonic() - open_seconds
+                self._failures = rows[0]['failure_count']
+                logger.warning(f"⚡ 서킷 open (다른 컨테이너에서 open): {self.name}")
+    
+    def _save_shared_state(self, state: str, failure_count: int):
+        """open / closed 전이를 circuit_breakers 테이블에 기록 (요청 단위 작업과 분리된 연결에서 바로 commit)"""
+        if self._db_factory is None:
+            return
+        try:
+            with self.db.autonomous():
+                self.db.execute_update(
+                    """
+                    INSERT INTO circuit_breakers (name, state, failure_count, opened_at, updated_at)
+                    VALUES (%s, %s, %s, CASE WHEN %s = 'open' THEN CURRENT_TIMESTAMP END, CURRENT_TIMESTAMP)
+                    ON CONFLICT (name) DO UPDATE SET
+                        state = EXCLUDED.state,
+                        failure_count = EXCLUDED.failure_count,
+                        opened_at = EXCLUDED.opened_at,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    (self.name, state, failure_count, state)
+                )
+        except Exception as e:
+            logger.warning(f"⚠️  서킷 공유 상태 저장 실패: {self.name}: {e}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """서킷 상태"""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == STATE_OPEN:
+                retry_in = max(0.0, self.reset_timeout_seconds - (monotonic() - self._opened_at))
+            return {
+                'name': self.name,
+                'state': self._state,
+                'failures': self._failures,
+                'opened': self.opened,
+                'rejected': self.rejected,
+                'retry_in_seconds': round(retry_in, 1)
+            }
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(name: str, db_factory: Optional[Callable[[], Any]] = None) -> CircuitBreaker:
+    """이름별 서킷 브레이커 (최초 1회 생성 후 웜 컨테이너에서 재사용, db_factory는 CIRCUIT_BREAKER_SHARED_STATE=true일 때만 사용)"""
+    breaker = _breakers.get(name)
+    if breaker is not None:
+        return breaker
+    
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, db_factory=db_factory if CIRCUIT_BREAKER_SHARED_STATE else None)
+        return _breakers[name]
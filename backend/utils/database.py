@@ -1,60 +1,844 @@
+"""
+공통 데이터베이스 접근 모듈
+
+모든 Lambda 함수가 배포 패키지의 utils/ 디렉토리로 함께 배포하여 사용합니다.
+(deploy_lambda.create_deployment_package 참고)
+
+- 웜 컨테이너 간 재사용되는 커넥션 풀
+- 쿼리별 실행 시간 측정 (query_metrics)
+- dict 또는 지정한 타입(dataclass, NamedTuple 등)으로 행 매핑
+- 교체 가능한 드라이버 (DB_DRIVER=psycopg2 | pg8000)
+- 요청 단위 작업 (unit_of_work / transactional): 연결 1개, 트랜잭션 1개
+- 서버 측 커서 스트리밍 조회 (stream_query)
+- 통계 등 분석용 조회(replica=True)의 읽기 전용 복제본 라우팅 (DB_READER_HOST) 및 사용자 쓰기 후 primary 고정
+- 연결별 서버 측 prepared statement 캐시 (statement_cache)
+"""
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import re
+import ssl
+import functools
+import hashlib
+import itertools
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Type, Iterator
+from time import monotonic, perf_counter
+import threading
+import logging
 import json
 from datetime import datetime, date
 
-class DatabaseManager:
+logger = logging.getLogger(__name__)
+
+# 커넥션 풀 설정 (Lambda 웜 컨테이너에서 호출 간 재사용)
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '3'))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+DB_POOL_HEALTHCHECK_IDLE_SECONDS = float(os.environ.get('DB_POOL_HEALTHCHECK_IDLE_SECONDS', '30'))
+
+# 이 시간(ms)을 넘는 쿼리는 경고 로그를 남김
+DB_SLOW_QUERY_MS = float(os.environ.get('DB_SLOW_QUERY_MS', '200'))
+
+# 읽기 전용 복제본 엔드포인트 (없으면 모든 쿼리를 primary로, 설정 전 run_migration.py user_write_marks 필요)
+DB_READER_HOST = os.environ.get('DB_READER_HOST', '')
+
+# 사용자가 쓰기를 commit한 뒤 이 시간(초) 동안은 해당 사용자의 복제본 조회(replica=True)를 primary로 보냄
+# (복제 지연 대비, 마지막 쓰기 시각을 user_write_marks 테이블에 남겨 다른 Lambda 함수 / 컨테이너에서도 확인)
+DB_WRITE_PIN_SECONDS = float(os.environ.get('DB_WRITE_PIN_SECONDS', '5'))
+
+# 연결별 prepared statement 캐시 (DB_STATEMENT_CACHE_SIZE=0 이면 사용 안 함)
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', '50'))
+
+# stream_query에서 서버 측 커서로 한 번에 가져오는 행 수
+DB_STREAM_ITERSIZE = int(os.environ.get('DB_STREAM_ITERSIZE', '500'))
+
+# 서버 측 커서 이름 (같은 트랜잭션 안에서 겹치지 않도록 증가)
+_stream_cursor_ids = itertools.count(1)
+
+class PoolError(Exception):
+    """커넥션 풀에서 연결을 얻지 못한 경우"""
+    pass
+
+# ============================================================================
+# Drivers
+# ============================================================================
+
+class Psycopg2Driver:
+    """psycopg2 드라이버 (기본값)"""
+    name = 'psycopg2'
+    
+    # 클라이언트 측에서 파라미터를 치환하므로 PREPARE/EXECUTE로 계획을 재사용
+    supports_prepare = True
+    
+    def __init__(self):
+        import psycopg2
+        from psycopg2 import extensions
+        self._psycopg2 = psycopg2
+        self._extensions = extensions
+    
+    def connect(self, db_config: Dict[str, Any]):
+        return self._psycopg2.connect(**db_config)
+    
+    def is_closed(self, conn) -> bool:
+        return bool(conn.closed)
+    
+    def in_transaction(self, conn) -> bool:
+        return conn.info.transaction_status != self._extensions.TRANSACTION_STATUS_IDLE
+    
+    def is_disconnect(self, error: Exception) -> bool:
+        return isinstance(error, (self._psycopg2.OperationalError, self._psycopg2.InterfaceError))
+
+class Pg8000Driver:
+    """pg8000 드라이버 (순수 Python - 네이티브 의존성이 없는 Lambda용)"""
+    name = 'pg8000'
+    
+    # pg8000은 연결별 prepared statement 캐시를 자체적으로 사용
+    supports_prepare = False
+    
+    # SSL 컨텍스트는 연결마다 만들지 않고 한 번만 생성
+    _ssl_context = None
+    
+    def __init__(self):
+        import pg8000
+        self._pg8000 = pg8000
+    
+    def connect(self, db_config: Dict[str, Any]):
+        if Pg8000Driver._ssl_context is None:
+            Pg8000Driver._ssl_context = ssl.create_default_context()
+        return self._pg8000.connect(
+            host=db_config['host'],
+            port=int(db_config.get('port', 5432)),
+            database=db_config['database'],
+            user=db_config['user'],
+            password=db_config['password'],
+            ssl_context=Pg8000Driver._ssl_context  # RDS SSL
+        )
+    
+    def is_closed(self, conn) -> bool:
+        return getattr(conn, '_sock', None) is None
+    
+    def in_transaction(self, conn) -> bool:
+        return getattr(conn, 'in_transaction', True)
+    
+    def is_disconnect(self, error: Exception) -> bool:
+        return isinstance(error, self._pg8000.InterfaceError)
+
+DRIVERS = {
+    'psycopg2': Psycopg2Driver,
+    'pg8000': Pg8000Driver
+}
+
+_driver_instances = {}
+
+def get_driver(name: Optional[str] = None):
+    """드라이버 인스턴스 가져오기 (DB_DRIVER 환경 변수, 기본값 psycopg2)"""
+    name = name or os.environ.get('DB_DRIVER', 'psycopg2')
+    if name not in DRIVERS:
+        raise ValueError(f"지원하지 않는 DB 드라이버입니다: {name} (지원: {', '.join(DRIVERS)})")
+    if name not in _driver_instances:
+        _driver_instances[name] = DRIVERS[name]()
+    return _driver_instances[name]
+
+# ============================================================================
+# Connection Pool
+# ============================================================================
+
+class ConnectionPool:
+    """크기 제한과 상태 확인을 갖춘 커넥션 풀"""
+    def __init__(self, db_config: Dict[str, Any], driver, max_size: int = DB_POOL_MAX_SIZE,
+                 timeout: float = DB_POOL_TIMEOUT,
+                 healthcheck_idle_seconds: float = DB_POOL_HEALTHCHECK_IDLE_SECONDS):
+        self.db_config = db_config
+        self.driver = driver
+        self.max_size = max_size
+        self.timeout = timeout
+        self.healthcheck_idle_seconds = healthcheck_idle_seconds
+        self._idle = []  # (connection, 마지막 반납 시각)
+        self._in_use = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        """유휴 연결을 꺼내거나 새로 연결 (끊어진 연결은 폐기 후 교체)"""
+        deadline = monotonic() + self.timeout
+        with self._cond:
+            while not self._idle and self._in_use >= self.max_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise PoolError(f"커넥션 풀 고갈 (max_size={self.max_size})")
+                self._cond.wait(remaining)
+            self._in_use += 1
+            idle = self._idle.pop() if self._idle else None
+        
+        try:
+            if idle is not None:
+                conn, last_used = idle
+                if self._is_healthy(conn, last_used):
+                    return conn
+                logger.warning("⚠️  끊어진 DB 연결 감지 - 새 연결로 교체합니다")
+                self._close_quietly(conn)
+            return self.driver.connect(self.db_config)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+    
+    def release(self, conn, discard: bool = False):
+        """연결 반납 (열린 트랜잭션은 롤백, 손상된 연결은 폐기)"""
+        if not discard and not self.driver.is_closed(conn):
+            try:
+                if self.driver.in_transaction(conn):
+                    conn.rollback()
+            except Exception:
+                discard = True
+        
+        discard = discard or self.driver.is_closed(conn)
+        if discard:
+            self._close_quietly(conn)
+        
+        with self._cond:
+            self._in_use -= 1
+            if not discard:
+                self._idle.append((conn, monotonic()))
+            self._cond.notify()
+    
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        """오래 유휴 상태였던 연결만 SELECT 1로 확인"""
+        if self.driver.is_closed(conn):
+            return False
+        if monotonic() - last_used < self.healthcheck_idle_seconds:
+            return True
+        try:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1')
+            cursor.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _close_quietly(conn):
+        statement_cache.forget(conn)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+# 모듈 레벨 커넥션 풀 - 웜 호출 간에 유지됨 (드라이버 + 접속 대상별)
+_connection_pools = {}
+_connection_pool_lock = threading.Lock()
+
+def get_connection_pool(db_config: Dict[str, Any], driver) -> ConnectionPool:
+    """모듈 레벨 커넥션 풀 가져오기 (lazy initialization)"""
+    key = (driver.name, db_config.get('host'), str(db_config.get('port')),
+           db_config.get('database'), db_config.get('user'))
+    pool = _connection_pools.get(key)
+    if pool is None:
+        with _connection_pool_lock:
+            pool = _connection_pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(db_config, driver)
+                _connection_pools[key] = pool
+                logger.info(f"🔌 DB 커넥션 풀 생성: driver={driver.name}, max_size={pool.max_size}")
+    return pool
+
+# ============================================================================
+# Unit of Work
+# ============================================================================
+
+class UnitOfWork:
+    """요청 단위 작업 - 첫 쿼리에서 연결을 고정하고 종료 시 한 번만 commit"""
+    def __init__(self, pool: ConnectionPool, mark_writes: bool = False):
+        self.pool = pool
+        self.conn = None
+        self.rollback_only = False
+        self.wrote = False
+        self.mark_writes = mark_writes  # 쓰기가 있으면 commit 전에 user_write_marks 기록 (복제본 사용 시)
+    
+    def connection(self):
+        """고정된 연결 (첫 호출 시 풀에서 대여)"""
+        if self.conn is None:
+            self.conn = self.pool.acquire()
+        return self.conn
+    
+    def commit(self):
+        """지금까지의 변경을 중간 commit (연결은 계속 고정)"""
+        if self.conn is not None and not self.rollback_only:
+            if self.wrote and self.mark_writes:
+                mark_user_write(self.conn)
+            self.conn.commit()
+            if self.wrote:
+                record_user_write()
+    
+    def mark_rollback_only(self):
+        """종료 시 commit 대신 롤백하도록 표시"""
+        self.rollback_only = True
+    
+    def finish(self, error: Optional[Exception] = None):
+        """commit 또는 롤백 후 연결 반납"""
+        if self.conn is None:
+            return
+        discard = error is not None and self.pool.driver.is_disconnect(error)
+        try:
+            if error is None and not self.rollback_only:
+                if self.wrote and self.mark_writes:
+                    mark_user_write(self.conn)
+                self.conn.commit()
+                if self.wrote:
+                    record_user_write()
+            elif not discard:
+                logger.warning("⚠️  단위 작업 롤백: 요청 중 오류가 발생하여 변경 사항을 저장하지 않습니다")
+                self.conn.rollback()
+        except Exception:
+            discard = True
+            if error is None:
+                raise
+        finally:
+            self.pool.release(self.conn, discard=discard)
+            self.conn = None
+
+# 스레드별 진행 중인 단위 작업 (풀 -> UnitOfWork)
+_unit_of_work_state = threading.local()
+
+def _active_units() -> Dict[ConnectionPool, UnitOfWork]:
+    if not hasattr(_unit_of_work_state, 'units'):
+        _unit_of_work_state.units = {}
+    return _unit_of_work_state.units
+
+# ============================================================================
+# 쓰기 후 primary 고정
+# ============================================================================
+
+# 스레드별 현재 요청의 사용자 ID
+_request_state = threading.local()
+
+# 사용자 ID -> 마지막 쓰기 commit 시각 (웜 컨테이너 안에서 유지)
+_recent_writes: Dict[str, float] = {}
+_recent_writes_lock = threading.Lock()
+
+def event_user_id(event: Any) -> Optional[str]:
+    """API Gateway 이벤트에서 사용자 ID 추출 (Cognito claims 또는 path parameter)"""
+    if not isinstance(event, dict):
+        return None
+    authorizer = (event.get('requestContext') or {}).get('authorizer') or {}
+    claims = authorizer.get('claims') or (authorizer.get('jwt') or {}).get('claims') or {}
+    return claims.get('sub') or (event.get('pathParameters') or {}).get('user_id')
+
+def current_request_user() -> Optional[str]:
+    return getattr(_request_state, 'user_id', None)
+
+def record_user_write(user_id: Optional[str] = None):
+    """현재 요청 사용자의 쓰기 commit 시각 기록"""
+    user_id = user_id or current_request_user()
+    if not user_id:
+        return
+    now = monotonic()
+    with _recent_writes_lock:
+        _recent_writes[user_id] = now
+        if len(_recent_writes) > 10000:
+            expired = [uid for uid, at in _recent_writes.items() if now - at > DB_WRITE_PIN_SECONDS]
+            for uid in expired:
+                del _recent_writes[uid]
+
+def wrote_recently(user_id: Optional[str] = None) -> bool:
+    """사용자가 DB_WRITE_PIN_SECONDS 안에 이 컨테이너에서 쓰기를 commit했는지 여부 (user_write_marks 조회 전 빠른 확인)"""
+    user_id = user_id or current_request_user()
+    if not user_id:
+        return False
+    with _recent_writes_lock:
+        written_at = _recent_writes.get(user_id)
+    return written_at is not None and monotonic() - written_at < DB_WRITE_PIN_SECONDS
+
+# 사용자별 마지막 쓰기 시각 (쓰기 트랜잭션 안에서 기록되어 commit과 함께 보임)
+USER_WRITE_MARK_QUERY = """
+INSERT INTO user_write_marks (user_id, written_at) VALUES (%s, clock_timestamp())
+ON CONFLICT (user_id) DO UPDATE SET written_at = EXCLUDED.written_at
+"""
+
+USER_WRITE_PIN_QUERY = """
+SELECT 1 FROM user_write_marks
+WHERE user_id = %s AND written_at > clock_timestamp() - make_interval(secs => %s)
+"""
+
+def mark_user_write(conn):
+    """현재 요청 사용자의 마지막 쓰기 시각을 commit 전에 같은 트랜잭션으로 기록"""
+    user_id = current_request_user()
+    if not user_id:
+        return
+    cursor = conn.cursor()
+    try:
+        cursor.execute(USER_WRITE_MARK_QUERY, (user_id,))
+    finally:
+        cursor.close()
+
+def pin_reads_after_write(handler: Callable) -> Callable:
+    """lambda_handler 데코레이터 - 요청 사용자를 기록해 쓰기 직후의 복제본 조회를 primary로 고정
+    
+    쓰기 시각은 user_write_marks 테이블(primary)에 남으므로 다른 Lambda 함수 / 다른 컨테이너의 요청에도 적용되며,
+    같은 컨테이너에서는 메모리 기록(wrote_recently)으로 조회 없이 바로 판단
+    사용자는 Cognito sub 또는 path parameter user_id로만 식별하며, 둘 다 없는 요청은 고정하지 않음
+    """
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        previous = current_request_user()
+        _request_state.user_id = event_user_id(event)
+        try:
+            return handler(event, context)
+        finally:
+            _request_state.user_id = previous
+    return wrapper
+
+# ============================================================================
+# Query Metrics
+# ============================================================================
+
+class QueryMetrics:
+    """쿼리별 호출 수와 실행 시간 누적 (웜 컨테이너 단위)"""
     def __init__(self):
-        # 환경 변수에서 데이터베이스 연결 정보 가져오기
-        self.db_config = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'port': os.getenv('DB_PORT', '5432'),
-            'database': os.getenv('DB_NAME', 'rhythm_fairy'),
-            'user': os.getenv('DB_USER', 'postgres'),
-            'password': os.getenv('DB_PASSWORD', '')
-        }
+        self._stats = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def label(query: str) -> str:
+        """공백을 정리한 SQL 앞부분을 쿼리 식별자로 사용"""
+        return re.sub(r'\s+', ' ', query).strip()[:80]
+    
+    def record(self, query: str, elapsed_ms: float):
+        label = self.label(query)
+        with self._lock:
+            stats = self._stats.setdefault(label, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['calls'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+        
+        if elapsed_ms >= DB_SLOW_QUERY_MS:
+            logger.warning(f"🐢 느린 쿼리 ({elapsed_ms:.1f}ms): {label}")
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """쿼리별 통계 복사본 (avg_ms 포함)"""
+        with self._lock:
+            return {
+                label: {**stats, 'avg_ms': round(stats['total_ms'] / stats['calls'], 2)}
+                for label, stats in self._stats.items()
+            }
+    
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+query_metrics = QueryMetrics()
+
+# ============================================================================
+# Statement Cache
+# ============================================================================
+
+class StatementCache:
+    """연결별 서버 측 prepared statement 캐시
+    
+    같은 SQL 텍스트는 연결마다 처음 한 번만 PREPARE 하고 이후에는 EXECUTE로 파싱/계획을 재사용
+    연결이 웜 컨테이너의 풀에 남아 있는 동안 유지되며, 연결당 max_size개까지 LRU로 보관
+    PREPARE가 실패하는 쿼리(파라미터 타입 추론 불가 등)는 기억해 두고 일반 실행으로 처리
+    """
+    _PREPARABLE = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b', re.IGNORECASE)
+    _PLACEHOLDER = re.compile(r'%%|%s')
+    
+    def __init__(self, max_size: int = DB_STATEMENT_CACHE_SIZE):
+        self.max_size = max_size
+        self._prepared: Dict[int, OrderedDict] = {}  # id(connection) -> 문장 이름 (LRU 순서)
+        self._unpreparable = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+    
+    @classmethod
+    def _to_positional(cls, query: str) -> str:
+        """%s 자리표시자를 $1, $2, ... 로 변환 (%% 는 %)"""
+        counter = itertools.count(1)
+        return cls._PLACEHOLDER.sub(lambda m: '%' if m.group() == '%%' else f"${next(counter)}", query)
+    
+    def execute(self, cursor, conn, query: str, params) -> bool:
+        """prepared statement로 실행 (대상이 아니면 False를 반환하고 호출자가 직접 실행)"""
+        if self.max_size <= 0 or isinstance(params, dict) or not self._PREPARABLE.match(query):
+            return False
+        
+        name = 'stmt_' + hashlib.md5(query.encode('utf-8')).hexdigest()[:20]
+        if name in self._unpreparable:
+            return False
+        
+        # 연결별 OrderedDict는 forget / snapshot이 다른 스레드에서 순회하므로 모든 변경을 잠금 안에서 수행
+        with self._lock:
+            statements = self._prepared.setdefault(id(conn), OrderedDict())
+            prepared = name in statements
+            if prepared:
+                statements.move_to_end(name)
+                self.hits += 1
+            else:
+                self.misses += 1
+        
+        if not prepared:
+            body = self._to_positional(query) if params else query
+            try:
+                # 실패해도 진행 중인 트랜잭션이 중단되지 않도록 savepoint 안에서 PREPARE
+                cursor.execute(f"SAVEPOINT prepare_statement; PREPARE {name} AS {body}; RELEASE SAVEPOINT prepare_statement")
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT prepare_statement")
+                with self._lock:
+                    self.fallbacks += 1
+                    self._unpreparable.add(name)
+                logger.info(f"ℹ️  prepared statement 사용 불가, 일반 실행으로 처리: {e}")
+                return False
+            
+            with self._lock:
+                statements = self._prepared.setdefault(id(conn), OrderedDict())
+                statements[name] = None
+                evicted = statements.popitem(last=False)[0] if len(statements) > self.max_size else None
+            if evicted:
+                cursor.execute(f"DEALLOCATE {evicted}")
+        
+        if params:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+        return True
+    
+    def forget(self, conn):
+        """닫힌 연결의 캐시 정보 제거"""
+        with self._lock:
+            self._prepared.pop(id(conn), None)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """적중률 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'fallbacks': self.fallbacks,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'connections': len(self._prepared),
+                'statements': sum(len(statements) for statements in self._prepared.values())
+            }
+    
+    def reset(self):
+        with self._lock:
+            self.hits = self.misses = self.fallbacks = 0
+
+statement_cache = StatementCache()
+
+# ============================================================================
+# DatabaseManager
+# ============================================================================
+
+def get_db_config() -> Dict[str, Any]:
+    """환경 변수에서 데이터베이스 연결 정보 가져오기"""
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', '5432'),
+        'database': os.getenv('DB_NAME', 'rhythm_fairy'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD', '')
+    }
+
+def get_reader_db_config() -> Optional[Dict[str, Any]]:
+    """읽기 전용 복제본 연결 정보 (DB_READER_HOST가 없으면 None)"""
+    if not DB_READER_HOST:
+        return None
+    return {**get_db_config(), 'host': DB_READER_HOST}
+
+class DatabaseManager:
+    def __init__(self, db_config: Optional[Dict[str, Any]] = None, driver: Optional[str] = None,
+                 reader_config: Optional[Dict[str, Any]] = None):
+        self.db_config = db_config or get_db_config()
+        self.driver = get_driver(driver)
+        # 연결 정보를 직접 넘긴 경우에는 명시한 reader만 사용
+        self.reader_config = reader_config if (reader_config or db_config) else get_reader_db_config()
+    
+    def _use_reader(self) -> bool:
+        """복제본 조회(replica=True)를 실제로 복제본으로 보낼지 결정
+        
+        복제본이 없거나, 이번 요청이 이미 primary에서 트랜잭션을 시작했거나,
+        요청 사용자가 DB_WRITE_PIN_SECONDS 안에 쓰기를 commit했다면 (어느 컨테이너에서든) primary 사용
+        """
+        if not self.reader_config:
+            return False
+        uow = _active_units().get(get_connection_pool(self.db_config, self.driver))
+        if uow is not None and uow.conn is not None:
+            return False
+        if wrote_recently():
+            return False
+        return not self._wrote_recently_shared()
+    
+    def _wrote_recently_shared(self) -> bool:
+        """요청 사용자의 최근 쓰기를 user_write_marks(primary)에서 확인 (확인 실패 시 primary 사용)"""
+        user_id = current_request_user()
+        if not user_id:
+            return False
+        try:
+            with self.autonomous():
+                return bool(self.execute_query(USER_WRITE_PIN_QUERY, (user_id, DB_WRITE_PIN_SECONDS)))
+        except Exception as e:
+            logger.warning(f"⚠️  사용자 쓰기 시각 확인 실패, primary 사용: {e}")
+            return True
     
     @contextmanager
-    def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
+    def _reader_connection(self):
+        """복제본 연결 대여 (연결 실패 시 primary로 대체)"""
+        pool = get_connection_pool(self.reader_config, self.driver)
+        try:
+            conn = pool.acquire()
+        except Exception as e:
+            logger.warning(f"⚠️  읽기 전용 복제본 연결 실패, primary 사용: {e}")
+            with self._primary_connection(readonly=True) as conn:
+                yield conn
+            return
+        
+        discard = False
         try:
-            conn = psycopg2.connect(**self.db_config)
             yield conn
+            conn.commit()
         except Exception as e:
-            if conn:
-                conn.rollback()
-            raise e
+            discard = self.driver.is_closed(conn) or self.driver.is_disconnect(e)
+            if not discard:
+                try:
+                    conn.rollback()
+                except Exception:
+                    discard = True
+            raise
         finally:
-            if conn:
-                conn.close()
+            pool.release(conn, discard=discard)
     
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
-        """SELECT 쿼리 실행"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+    @contextmanager
+    def get_connection(self, readonly: bool = False, replica: bool = False):
+        """풀에서 데이터베이스 연결 대여 (정상 종료 시 commit, 오류 시 rollback 후 반납)
+        
+        단위 작업이 진행 중이면 고정된 연결을 그대로 사용하고 commit은 작업 종료 시로 미룸
+        readonly=True이면 쓰기로 기록하지 않음, replica=True(읽기 전용)이면 가능한 경우 읽기 전용 복제본 사용
+        """
+        if replica and self._use_reader():
+            with self._reader_connection() as conn:
+                yield conn
+            return
+        
+        with self._primary_connection(readonly or replica) as conn:
+            yield conn
+    
+    @contextmanager
+    def _primary_connection(self, readonly: bool):
+        """primary 연결 대여 (readonly=True이면 쓰기로 기록하지 않음 - 사용자 primary 고정 / uow.wrote 없음)"""
+        pool = get_connection_pool(self.db_config, self.driver)
+        uow = _active_units().get(pool)
+        if uow is not None:
+            if not readonly:
+                uow.wrote = True
+            try:
+                yield uow.connection()
+            except Exception:
+                # 트랜잭션이 중단되었으므로 작업 종료 시 롤백
+                uow.mark_rollback_only()
+                raise
+            return
+        
+        conn = pool.acquire()
+        discard = False
+        try:
+            yield conn
+            if not readonly and self.reader_config:
+                mark_user_write(conn)
+            conn.commit()
+            if not readonly:
+                record_user_write()
+        except Exception as e:
+            # 연결 자체가 끊어진 경우 풀에 되돌리지 않고 폐기
+            discard = self.driver.is_closed(conn) or self.driver.is_disconnect(e)
+            if not discard:
+                try:
+                    conn.rollback()
+                except Exception:
+                    discard = True
+            raise
+        finally:
+            pool.release(conn, discard=discard)
+    
+    @contextmanager
+    def unit_of_work(self):
+        """요청 단위 작업: 연결 하나를 고정하고 모든 쿼리를 하나의 트랜잭션으로 묶음
+        
+        중첩 호출 시 바깥 작업에 합류하며, 예외가 발생하면 전체를 롤백
+        """
+        pool = get_connection_pool(self.db_config, self.driver)
+        active = _active_units()
+        if pool in active:
+            yield active[pool]
+            return
+        
+        uow = UnitOfWork(pool, mark_writes=bool(self.reader_config))
+        active[pool] = uow
+        error = None
+        try:
+            yield uow
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            del active[pool]
+            uow.finish(error)
+    
+    def commit(self):
+        """진행 중인 단위 작업의 변경을 중간 commit (단위 작업 밖에서는 매 쿼리가 이미 commit됨)"""
+        uow = _active_units().get(get_connection_pool(self.db_config, self.driver))
+        if uow is not None:
+            uow.commit()
+    
+    @contextmanager
+    def autonomous(self):
+        """진행 중인 단위 작업과 분리된 독립 작업 - 블록 안의 쿼리는 자체 연결에서 바로 commit
+        
+        요청 트랜잭션의 commit / 롤백과 무관하게 남겨야 하는 기록(서킷 상태 등)에 사용하며,
+        요청 사용자의 쓰기로 기록하지 않으므로 이후 읽기를 primary로 고정하지 않음
+        """
+        pool = get_connection_pool(self.db_config, self.driver)
+        active = _active_units()
+        suspended = active.pop(pool, None)
+        previous_user = current_request_user()
+        _request_state.user_id = None
+        try:
+            yield self
+        finally:
+            _request_state.user_id = previous_user
+            if suspended is not None:
+                active[pool] = suspended
+    
+    def _execute(self, cursor, query: str, params: tuple = None, prepare: bool = True):
+        """실행 시간을 측정하며 쿼리 실행 (가능하면 연결별 prepared statement 재사용)"""
+        started = perf_counter()
+        try:
+            if not (prepare and self.driver.supports_prepare
+                    and statement_cache.execute(cursor, cursor.connection, query, params)):
                 cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+        finally:
+            query_metrics.record(query, (perf_counter() - started) * 1000)
+    
+    @staticmethod
+    def _map_rows(cursor, rows, row_type: Optional[Callable] = None) -> list:
+        """cursor.description 기준으로 행을 dict (또는 row_type 인스턴스)로 변환"""
+        columns = [column[0] for column in cursor.description]
+        mapped = [dict(zip(columns, row)) for row in rows]
+        if row_type is not None:
+            return [row_type(**row) for row in mapped]
+        return mapped
+    
+    def execute_query(self, query: str, params: tuple = None, row_type: Optional[Callable] = None,
+                      replica: bool = False) -> List[Any]:
+        """SELECT 쿼리 실행 (기본 primary, replica=True이면 가능한 경우 읽기 전용 복제본 - 통계 등 분석용 조회만)"""
+        with self.get_connection(readonly=True, replica=replica) as conn:
+            cursor = conn.cursor()
+            try:
+                self._execute(cursor, query, params)
+                return self._map_rows(cursor, cursor.fetchall(), row_type)
+            finally:
+                cursor.close()
     
     def execute_update(self, query: str, params: tuple = None) -> int:
         """INSERT/UPDATE/DELETE 쿼리 실행"""
         with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
+            cursor = conn.cursor()
+            try:
+                self._execute(cursor, query, params)
                 return cursor.rowcount
+            finally:
+                cursor.close()
     
-    def execute_insert_returning(self, query: str, params: tuple = None) -> Optional[Dict[str, Any]]:
+    def execute_insert_returning(self, query: str, params: tuple = None, row_type: Optional[Callable] = None) -> Optional[Any]:
         """INSERT 쿼리 실행 후 결과 반환"""
         with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                conn.commit()
+            cursor = conn.cursor()
+            try:
+                self._execute(cursor, query, params)
                 result = cursor.fetchone()
-                return dict(result) if result else None
+                return self._map_rows(cursor, [result], row_type)[0] if result else None
+            finally:
+                cursor.close()
+    
+    def execute_values(self, query: str, rows: List[tuple], fetch: bool = False,
+                       row_type: Optional[Callable] = None, page_size: int = 500):
+        """다중 행 VALUES 쿼리를 한 번에 실행 (psycopg2.extras.execute_values와 같은 'VALUES %s' 형식)
+        
+        query에는 VALUES 자리의 %s 하나만 있어야 하며, rows는 page_size 단위로 나누어 같은 연결에서 실행
+        fetch=True이면 RETURNING 결과 목록을, 아니면 영향받은 행 수를 반환
+        """
+        head, placeholder, tail = query.partition('%s')
+        if not placeholder or '%s' in tail:
+            raise ValueError("execute_values 쿼리에는 VALUES 자리의 %s 하나만 있어야 합니다")
+        
+        results = []
+        rowcount = 0
+        if not rows:
+            return results if fetch else rowcount
+        
+        row_template = '(' + ', '.join(['%s'] * len(rows[0])) + ')'
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for start in range(0, len(rows), page_size):
+                    page = rows[start:start + page_size]
+                    sql = head + ', '.join([row_template] * len(page)) + tail
+                    # 행 수에 따라 SQL이 달라지므로 prepared statement 캐시 대상에서 제외
+                    self._execute(cursor, sql, tuple(value for row in page for value in row), prepare=False)
+                    if fetch:
+                        results.extend(self._map_rows(cursor, cursor.fetchall(), row_type))
+                    else:
+                        rowcount += cursor.rowcount
+            finally:
+                cursor.close()
+        return results if fetch else rowcount
+    
+    def stream_query(self, query: str, params: tuple = None, itersize: int = DB_STREAM_ITERSIZE,
+                     row_type: Optional[Callable] = None) -> Iterator[Any]:
+        """서버 측 커서로 대용량 SELECT 결과를 itersize 건씩 가져오며 한 행씩 반환
+        
+        전체 결과를 fetchall로 메모리에 올리지 않으며, DECLARE/FETCH를 직접 사용하므로
+        psycopg2 named cursor가 없는 pg8000에서도 동일하게 동작
+        (제너레이터를 끝까지 소비하거나 close()해야 연결이 반납됨)
+        """
+        name = f"stream_cursor_{next(_stream_cursor_ids)}"
+        with self.get_connection(readonly=True) as conn:
+            cursor = conn.cursor()
+            try:
+                self._execute(cursor, f"DECLARE {name} NO SCROLL CURSOR FOR {query}", params, prepare=False)
+                fetch_query = f"FETCH FORWARD {int(itersize)} FROM {name}"
+                while True:
+                    cursor.execute(fetch_query)
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    for row in self._map_rows(cursor, rows, row_type):
+                        yield row
+            finally:
+                try:
+                    cursor.execute(f"CLOSE {name}")
+                except Exception:
+                    pass
+                cursor.close()
+
+def transactional(handler: Callable) -> Callable:
+    """lambda_handler 데코레이터 - 호출 하나를 하나의 단위 작업(연결 1개, 트랜잭션 1개)으로 실행
+    
+    4xx/5xx 응답을 반환하거나 예외가 발생하면 호출 중의 모든 쓰기를 롤백
+    """
+    @functools.wraps(handler)
+    @pin_reads_after_write
+    def wrapper(event, context):
+        try:
+            with DatabaseManager().unit_of_work() as uow:
+                response = handler(event, context)
+                if isinstance(response, dict) and response.get('statusCode', 200) >= 400:
+                    uow.mark_rollback_only()
+                return response
+        except Exception as e:
+            logger.error(f"❌ 단위 작업 commit/rollback 실패: {e}")
+            raise
+    return wrapper
 
 class UserRepository:
     def __init__(self, db_manager: DatabaseManager):
@@ -0,0 +1,87 @@
+"""
+대용량 응답용 점진적 JSON 인코딩
+
+행 목록 전체를 리스트로 만든 뒤 json.dumps 하지 않고,
+행을 일정 개수씩 인코딩해 문자열 청크로 내보냅니다.
+(stream_query 제너레이터와 함께 사용)
+
+내보내기는 청크를 S3 멀티파트 업로드로 바로 흘려보내고 presigned URL을 반환하여
+Lambda 메모리나 동기 응답 크기 제한(6MB)과 무관하게 동작 (upload_json_export)
+"""
+import io
+import os
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from utils.aws_clients import get_client
+
+# 내보내기 파일 presigned URL 유효 시간(초)
+EXPORT_URL_EXPIRES_SECONDS = int(os.environ.get('EXPORT_URL_EXPIRES_SECONDS', '900'))
+# 멀티파트 업로드로 넘기기 전 읽기 버퍼 크기
+EXPORT_READ_BUFFER_BYTES = 1024 * 1024
+
+# create_response와 같은 인코딩 규칙 (한글 유지, datetime 등은 str)
+_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def iter_json_object(key: str, rows: Iterable[Any], extra: Optional[Dict[str, Any]] = None,
+                     chunk_rows: int = 200) -> Iterator[str]:
+    """{...extra, key: [rows...]} 형태의 JSON 문서를 청크 단위 문자열로 생성"""
+    if extra:
+        yield _encoder.encode(extra)[:-1] + ', '
+    else:
+        yield '{'
+    yield _encoder.encode(key) + ': ['
+    
+    buffer = []
+    first = True
+    for row in rows:
+        buffer.append(_encoder.encode(row))
+        if len(buffer) >= chunk_rows:
+            yield ('' if first else ', ') + ', '.join(buffer)
+            first = False
+            buffer = []
+    if buffer:
+        yield ('' if first else ', ') + ', '.join(buffer)
+    
+    yield ']}'
+
+
+
+class IterableReader(io.RawIOBase):
+    """문자열 청크 제너레이터를 읽기 전용 파일 객체로 감싸기 (UTF-8, 청크 하나만 메모리에 유지)"""
+    
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._pending = b''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk.encode('utf-8')
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def upload_json_export(chunks: Iterable[str], key: str, bucket: Optional[str] = None) -> Dict[str, Any]:
+    """JSON 청크를 S3에 멀티파트 업로드하고 내려받기용 presigned URL 반환"""
+    bucket = bucket or os.environ.get('S3_BUCKET_NAME', 'redhorse-s3-ai-0126')
+    s3_client = get_client('s3')
+    s3_client.upload_fileobj(
+        io.BufferedReader(IterableReader(chunks), buffer_size=EXPORT_READ_BUFFER_BYTES),
+        bucket, key,
+        ExtraArgs={'ContentType': 'application/json; charset=utf-8'}
+    )
+    download_url = s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=EXPORT_URL_EXPIRES_SECONDS
+    )
+    return {'download_url': download_url, 'expires_in': EXPORT_URL_EXPIRES_SECONDS}
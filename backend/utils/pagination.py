@@ -0,0 +1,59 @@
+"""
+키셋(커서) 페이지네이션 공통 유틸리티
+
+- 정렬 키 값을 불투명한 next_cursor 토큰으로 인코딩/디코딩
+- limit + 1 건을 조회해 다음 페이지 존재 여부를 판단
+"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class InvalidPaginationError(ValueError):
+    """잘못된 페이지네이션 파라미터 (limit, cursor)"""
+    pass
+
+
+class InvalidCursorError(InvalidPaginationError):
+    """잘못된 커서 토큰"""
+    pass
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록을 URL-safe 토큰으로 인코딩"""
+    raw = json.dumps(values, default=str, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: Optional[str], size: int) -> Optional[List[Any]]:
+    """토큰을 정렬 키 값 목록으로 디코딩 (토큰이 없으면 None)"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {e}")
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError("잘못된 커서입니다")
+    return values
+
+
+def parse_limit(value: Optional[str], default: int, maximum: int) -> int:
+    """limit 쿼리 파라미터 파싱 (기본값을 포함해 1 ~ maximum 범위로 제한)"""
+    if value in (None, ''):
+        limit = default
+    else:
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            raise InvalidPaginationError("limit은 숫자여야 합니다")
+    return max(1, min(limit, maximum))
+
+
+def paginate(rows: List[Dict[str, Any]], limit: int, key_fields: Tuple[str, ...]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """limit + 1 건 조회 결과를 현재 페이지와 다음 페이지 커서로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor([page[-1][field] for field in key_fields])
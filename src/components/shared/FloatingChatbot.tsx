@@ -18,6 +18,8 @@ export default function FloatingChatbot() {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [inputMessage, setInputMessage] = useState("");
   const [isLoading, setIsLoading] = useState(false);
+  // 스트리밍 중인 메시지 (응답 청크가 도착할 때마다 누적)
+  const [streamingMessage, setStreamingMessage] = useState<Pick<ChatMessage, "message" | "response"> | null>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
 
   // 채팅 기록 로드
@@ -30,7 +32,7 @@ export default function FloatingChatbot() {
   // 메시지 스크롤
   useEffect(() => {
     scrollToBottom();
-  }, [messages]);
+  }, [messages, streamingMessage]);
 
   const loadChatHistory = async () => {
     if (!userId) return;
@@ -55,11 +57,20 @@ export default function FloatingChatbot() {
     setIsLoading(true);
 
     try {
-      const response = await aiApi.chatWithAI(userId, userMessage);
-      setMessages(prev => [...prev, response.chat]);
+      if (aiApi.isChatStreamingEnabled()) {
+        setStreamingMessage({ message: userMessage, response: "" });
+        const response = await aiApi.streamChatWithAI(userMessage, (text) =>
+          setStreamingMessage(prev => prev && { ...prev, response: prev.response + text })
+        );
+        setMessages(prev => [...prev, response.chat]);
+      } else {
+        const response = await aiApi.chatWithAI(userId, userMessage);
+        setMessages(prev => [...prev, response.chat]);
+      }
     } catch (error) {
       console.error('메시지 전송 실패:', error);
     } finally {
+      setStreamingMessage(null);
       setIsLoading(false);
     }
   };
@@ -138,8 +149,8 @@ export default function FloatingChatbot() {
                 </div>
               )}
 
-              {messages.map((msg) => (
-                <div key={msg.id} className="space-y-3">
+              {[...messages, ...(streamingMessage ? [streamingMessage] : [])].map((msg) => (
+                <div key={"id" in msg ? msg.id : "streaming"} className="space-y-3">
                   {/* 사용자 메시지 */}
                   <div className="flex justify-end">
                     <div className="bg-indigo-600 text-white px-4 py-3 rounded-[20px] rounded-tr-sm max-w-[80%] font-medium text-[14px]">
@@ -148,20 +159,22 @@ export default function FloatingChatbot() {
                   </div>
 
                   {/* AI 응답 */}
-                  <div className="flex justify-start">
-                    <div className="flex gap-3 max-w-[85%]">
-                      <div className="w-8 h-8 bg-gradient-to-br from-[#5843E4] to-[#7D6DF2] rounded-xl flex items-center justify-center flex-shrink-0">
-                        <MessageCircle className="w-4 h-4 text-white" />
-                      </div>
-                      <div className="bg-white px-4 py-3 rounded-[20px] rounded-tl-sm shadow-sm border border-gray-100 font-medium text-[14px] text-gray-700">
-                        {msg.response}
+                  {msg.response && (
+                    <div className="flex justify-start">
+                      <div className="flex gap-3 max-w-[85%]">
+                        <div className="w-8 h-8 bg-gradient-to-br from-[#5843E4] to-[#7D6DF2] rounded-xl flex items-center justify-center flex-shrink-0">
+                          <MessageCircle className="w-4 h-4 text-white" />
+                        </div>
+                        <div className="bg-white px-4 py-3 rounded-[20px] rounded-tl-sm shadow-sm border border-gray-100 font-medium text-[14px] text-gray-700">
+                          {msg.response}
+                        </div>
                       </div>
                     </div>
-                  </div>
+                  )}
                 </div>
               ))}
 
-              {isLoading && (
+              {isLoading && !streamingMessage?.response && (
                 <div className="flex justify-start">
                   <div className="flex gap-3">
                     <div className="w-8 h-8 bg-gradient-to-br from-[#5843E4] to-[#7D6DF2] rounded-xl flex items-center justify-center">
@@ -3,6 +3,8 @@ import { fetchAuthSession } from "aws-amplify/auth";
 
 // API 기본 설정
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:3000';
+// AI 챗봇 스트리밍용 WebSocket URL (없으면 REST 응답을 기다림)
+const CHAT_WS_URL = import.meta.env.VITE_CHAT_WS_URL;
 
 // API 응답 타입
 export interface ApiResponse<T = any> {
@@ -183,6 +185,10 @@ export const aiApi = {
   generateSleepPlan: (userId: string, planDate: string) => 
     apiClient.post<{ sleep_plan: any }>(`/users/${userId}/sleep-plans`, { plan_date: planDate }),
   
+  // 수면 + 카페인 계획 동시 생성 (Bio-Coach 1회 호출)
+  generateDailyPlan: (userId: string, planDate: string) => 
+    apiClient.post<{ sleep_plan: any; caffeine_plan: any }>(`/users/${userId}/daily-plan`, { plan_date: planDate }),
+  
   // 수면 계획 조회
   getSleepPlan: (userId: string, date: string) => 
     apiClient.get<{ sleep_plan: any }>(`/users/${userId}/sleep-plans?date=${date}`),
@@ -199,6 +205,37 @@ export const aiApi = {
   chatWithAI: (userId: string, message: string) => 
     apiClient.post<{ chat: any }>(`/users/${userId}/chat`, { message }),
   
+  // AI 챗봇 스트리밍 사용 여부
+  isChatStreamingEnabled: () => Boolean(CHAT_WS_URL),
+  
+  // AI 챗봇 상담 (WebSocket 스트리밍 - 응답 청크마다 onChunk 호출, 완료 시 저장된 채팅 기록 반환)
+  // 사용자는 연결 시 Cognito Access Token(?token=)으로 인증 ($connect authorizer)
+  streamChatWithAI: async (message: string, onChunk: (text: string) => void) => {
+    const session = await fetchAuthSession();
+    const token = session.tokens?.accessToken?.toString();
+    if (!token) {
+      throw new Error('로그인이 필요합니다');
+    }
+    return new Promise<{ chat: any }>((resolve, reject) => {
+      const socket = new WebSocket(`${CHAT_WS_URL}?token=${encodeURIComponent(token)}`);
+      socket.onopen = () => socket.send(JSON.stringify({ action: 'chat', message }));
+      socket.onmessage = (event) => {
+        const frame = JSON.parse(event.data);
+        if (frame.type === 'chunk') {
+          onChunk(frame.text);
+        } else if (frame.type === 'done') {
+          resolve({ chat: frame.chat });
+          socket.close();
+        } else if (frame.type === 'error') {
+          reject(new Error(frame.error));
+          socket.close();
+        }
+      };
+      socket.onerror = () => reject(new Error('WebSocket 연결 실패'));
+      socket.onclose = () => reject(new Error('응답 완료 전에 연결이 종료되었습니다'));
+    });
+  },
+  
   // 채팅 기록 조회
   getChatHistory: (userId: string, limit?: number) => {
     const query = limit ? `?limit=${limit}` : '';
@@ -38,9 +38,9 @@ export default function PlanPage({ onNavigate }: Props) {
         console.log('✅ 수면 계획 로드 성공:', response.sleep_plan);
       } catch (error) {
         console.error('❌ 수면 계획 로드 실패:', error);
-        // 수면 계획이 없으면 생성
+        // 수면 계획이 없으면 생성 (카페인 계획도 함께 생성)
         try {
-          const createResponse = await aiApi.generateSleepPlan(userId, today);
+          const createResponse = await aiApi.generateDailyPlan(userId, today);
           setSleepPlan(createResponse.sleep_plan);
           console.log('✅ 수면 계획 생성 성공:', createResponse.sleep_plan);
         } catch (createError) {
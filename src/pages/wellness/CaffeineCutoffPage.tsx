@@ -37,9 +37,9 @@ export default function CaffeineCutoffPage({ onNavigate }: Props) {
         setCaffeinePlan(response.caffeine_plan);
       } catch (error) {
         console.error('카페인 계획 로드 실패:', error);
-        // 계획이 없으면 생성
+        // 계획이 없으면 생성 (수면 계획도 함께 생성)
         try {
-          const createResponse = await aiApi.generateCaffeinePlan(userId, today);
+          const createResponse = await aiApi.generateDailyPlan(userId, today);
           setCaffeinePlan(createResponse.caffeine_plan);
         } catch (createError) {
           console.error('카페인 계획 생성 실패:', createError);